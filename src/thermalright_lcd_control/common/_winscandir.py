@@ -0,0 +1,158 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Windows-only directory listing built on FindFirstFileExW.
+
+os.scandir uses plain FindFirstFileW, which also fills in 8.3 short names
+and uses a small kernel buffer. Requesting FindExInfoBasic with
+FIND_FIRST_EX_LARGE_FETCH skips the short-name lookup and fetches more
+entries per system call, which speeds up large directory walks.
+
+scandir_basic() is a drop-in replacement for os.scandir for callers that
+only need name, path, is_dir() and is_file().
+"""
+
+import ctypes
+import os
+from ctypes import wintypes
+
+# FINDEX_INFO_LEVELS / FINDEX_SEARCH_OPS / dwAdditionalFlags
+FIND_EX_INFO_BASIC = 1
+FIND_EX_SEARCH_NAME_MATCH = 0
+FIND_FIRST_EX_LARGE_FETCH = 2
+
+FILE_ATTRIBUTE_DIRECTORY = 0x10
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Reparse tags, reported in WIN32_FIND_DATAW.dwReserved0 for reparse points
+IO_REPARSE_TAG_MOUNT_POINT = 0xA0000003
+IO_REPARSE_TAG_SYMLINK = 0xA000000C
+
+ERROR_FILE_NOT_FOUND = 2
+ERROR_NO_MORE_FILES = 18
+
+INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+
+_FindFirstFileExW = _kernel32.FindFirstFileExW
+_FindFirstFileExW.argtypes = [
+    wintypes.LPCWSTR, ctypes.c_int, ctypes.POINTER(wintypes.WIN32_FIND_DATAW),
+    ctypes.c_int, wintypes.LPVOID, wintypes.DWORD
+]
+_FindFirstFileExW.restype = wintypes.HANDLE
+
+_FindNextFileW = _kernel32.FindNextFileW
+_FindNextFileW.argtypes = [wintypes.HANDLE, ctypes.POINTER(wintypes.WIN32_FIND_DATAW)]
+_FindNextFileW.restype = wintypes.BOOL
+
+_FindClose = _kernel32.FindClose
+_FindClose.argtypes = [wintypes.HANDLE]
+_FindClose.restype = wintypes.BOOL
+
+
+class BasicDirEntry:
+    """
+    Minimal os.DirEntry equivalent backed by the find data attributes.
+
+    As with os.scandir, only IO_REPARSE_TAG_SYMLINK entries are symlinks:
+    junctions, mount points and cloud placeholder folders are directories.
+    """
+
+    __slots__ = ('name', 'path', '_attributes', '_reparse_tag')
+
+    def __init__(self, name: str, path: str, attributes: int, reparse_tag: int = 0):
+        self.name = name
+        self.path = path
+        self._attributes = attributes
+        self._reparse_tag = reparse_tag if attributes & FILE_ATTRIBUTE_REPARSE_POINT else 0
+
+    def is_dir(self, follow_symlinks: bool = True) -> bool:
+        if not self._attributes & FILE_ATTRIBUTE_DIRECTORY:
+            return False
+        return follow_symlinks or not self.is_symlink()
+
+    def is_file(self, follow_symlinks: bool = True) -> bool:
+        return not self._attributes & FILE_ATTRIBUTE_DIRECTORY
+
+    def is_symlink(self) -> bool:
+        return self._reparse_tag == IO_REPARSE_TAG_SYMLINK
+
+    def is_junction(self) -> bool:
+        return self._reparse_tag == IO_REPARSE_TAG_MOUNT_POINT
+
+    def __repr__(self):
+        return f"<BasicDirEntry '{self.name}'>"
+
+
+class _FindIterator:
+    """Iterator over a directory listing, usable as a context manager like os.scandir"""
+
+    def __init__(self, directory: str):
+        self._handle = None
+        self._directory = directory
+        self._data = wintypes.WIN32_FIND_DATAW()
+        self._pending = True
+
+        self._handle = _FindFirstFileExW(
+            os.path.join(directory, '*'), FIND_EX_INFO_BASIC, ctypes.byref(self._data),
+            FIND_EX_SEARCH_NAME_MATCH, None, FIND_FIRST_EX_LARGE_FETCH
+        )
+        if self._handle in (None, INVALID_HANDLE_VALUE):
+            self._handle = None
+            error = ctypes.get_last_error()
+            if error != ERROR_FILE_NOT_FOUND:
+                raise ctypes.WinError(error)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> BasicDirEntry:
+        while self._handle is not None:
+            if self._pending:
+                self._pending = False
+            elif not _FindNextFileW(self._handle, ctypes.byref(self._data)):
+                error = ctypes.get_last_error()
+                self.close()
+                if error != ERROR_NO_MORE_FILES:
+                    raise ctypes.WinError(error)
+                break
+
+            name = self._data.cFileName
+            if name in ('.', '..'):
+                continue
+            return BasicDirEntry(name, os.path.join(self._directory, name),
+                                 self._data.dwFileAttributes, self._data.dwReserved0)
+
+        raise StopIteration
+
+    def close(self):
+        if self._handle is not None:
+            _FindClose(self._handle)
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __del__(self):
+        self.close()
+
+
+def scandir_basic(directory) -> _FindIterator:
+    """
+    List a directory using FindFirstFileExW with basic info and large fetch.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Context-managed iterator of BasicDirEntry objects
+
+    Raises:
+        OSError: If the directory cannot be opened
+    """
+    return _FindIterator(os.fspath(directory))
@@ -6,11 +6,49 @@ Application detector for Windows to find installed applications like iStripper a
 Searches common installation directories and Windows registry.
 """
 
+import functools
 import os
+import re
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable, Tuple, Union
 from thermalright_lcd_control.common.platform_utils import is_windows
 
+# GetDriveTypeW return values
+DRIVE_NO_ROOT_DIR = 1
+DRIVE_FIXED = 3
+
+_DRIVE_TYPE_AVAILABLE = False
+
+if is_windows():
+    import ctypes
+
+    try:
+        # Bind once with explicit signature to skip generic argument marshalling
+        _GetDriveTypeW = ctypes.windll.kernel32.GetDriveTypeW
+        _GetDriveTypeW.argtypes = [ctypes.c_wchar_p]
+        _GetDriveTypeW.restype = ctypes.c_uint
+
+        # Bitmask of present drive letters (bit 0 = A:) in a single call
+        _GetLogicalDrives = ctypes.windll.kernel32.GetLogicalDrives
+        _GetLogicalDrives.argtypes = []
+        _GetLogicalDrives.restype = ctypes.c_uint
+
+        # Probe once so a broken ctypes setup is detected here rather than
+        # raising for every drive letter
+        _GetDriveTypeW('C:\\')
+        _DRIVE_TYPE_AVAILABLE = True
+    except (AttributeError, OSError):
+        pass
+
+    # Large-fetch, no-short-name directory listing for the recursive search
+    from thermalright_lcd_control.common._winscandir import scandir_basic as _scandir
+else:
+    _scandir = os.scandir
+
 
 class AppDetector:
     """
@@ -26,40 +64,89 @@ class AppDetector:
         'vlc': ['vlc.exe']
     }
     
+    # Lowercased, interned executable names used for case-insensitive matching
+    APP_EXECUTABLES_LC = {
+        app: frozenset(sys.intern(name.lower()) for name in names)
+        for app, names in APP_EXECUTABLES.items()
+    }
+    
     # Common installation subdirectories
     COMMON_SUBDIRS = {
         'istripper': ['iStripper', 'Totem Entertainment', 'VirtuaGirl HD'],
         'vlc': ['VLC', 'VideoLAN\\VLC']
     }
     
+    # Vendor directories that never contain supported applications; their
+    # subtrees are skipped during recursive searches (lowercase)
+    SKIP_DIRS = frozenset({
+        'windowsapps', 'common files', 'microsoft', 'windows defender',
+        'windowsdefender', 'windowspowershell', 'internet explorer',
+        'nvidia corporation', 'intel', 'amd'
+    })
+    
+    # Installer bitness: 'x64' apps never install under Program Files (x86)
+    APP_BITNESS = {
+        'istripper': 'x64',
+        'vlc': 'any'
+    }
+    
+    # Legacy 32-bit releases of 'x64' apps, the only installs looked for under
+    # Program Files (x86) (VirtuaGirl HD predates the 64-bit iStripper)
+    LEGACY_X86_EXECUTABLES = {
+        'istripper': ['vghd.exe']
+    }
+    LEGACY_X86_SUBDIRS = {
+        'istripper': ['VirtuaGirl HD']
+    }
+    
     def __init__(self):
         """Initialize application detector"""
         if not is_windows():
             raise RuntimeError("AppDetector is only supported on Windows")
+        
+        # Fixed drives don't change during detection; see refresh_drives()
+        self._drives_cache: Optional[List[Path]] = None
     
     def get_all_drives(self) -> List[Path]:
         """
         Get all available fixed drives on Windows.
         
+        The result is cached on the instance; call refresh_drives() to
+        re-enumerate.
+        
         Returns:
             List of Path objects for drive roots
         """
+        if self._drives_cache is None:
+            self._drives_cache = self._enumerate_drives()
+        return list(self._drives_cache)
+    
+    def refresh_drives(self):
+        """Discard the cached drive list so the next lookup re-enumerates drives"""
+        self._drives_cache = None
+    
+    def _enumerate_drives(self) -> List[Path]:
+        """Enumerate fixed drives through the Win32 drive APIs"""
         import string
         drives = []
         
-        for letter in string.ascii_uppercase:
-            drive = Path(f'{letter}:/')
-            if drive.exists():
-                try:
-                    # Check if it's a fixed drive (not CD/DVD or network)
-                    import ctypes
-                    drive_type = ctypes.windll.kernel32.GetDriveTypeW(str(drive))
-                    # 3 = DRIVE_FIXED (local hard disk)
-                    if drive_type == 3:
-                        drives.append(drive)
-                except:
-                    # If we can't determine type, include it anyway
+        if not _DRIVE_TYPE_AVAILABLE:
+            # Drive type can't be determined, include every existing drive
+            for letter in string.ascii_uppercase:
+                drive = Path(f'{letter}:/')
+                if drive.exists():
                     drives.append(drive)
+            return drives
+        
+        drive_mask = _GetLogicalDrives()
+        for i, letter in enumerate(string.ascii_uppercase):
+            if not drive_mask & (1 << i):
+                continue
+            # Check if it's a fixed drive (not CD/DVD or network).
+            # Absent letters report DRIVE_NO_ROOT_DIR, so no separate
+            # existence probe is needed.
+            if _GetDriveTypeW(f'{letter}:\\') == DRIVE_FIXED:
+                drives.append(Path(f'{letter}:/'))
         
         return drives
     
@@ -105,44 +192,54 @@ class AppDetector:
         
         return [d for d in dirs if d.exists()]
     
-    def search_directory_recursive(self, base_dir: Path, executable_names: List[str], 
-                                   max_depth: int = 3) -> Optional[Path]:
+    def search_directory_recursive(self, base_dir: Union[str, Path], executable_names: Iterable[str],
+                                   max_depth: int = 3,
+                                   stop_event: Optional[threading.Event] = None) -> Optional[Path]:
         """
         Recursively search a directory for an executable.
         
         Args:
             base_dir: Base directory to start search
-            executable_names: List of executable names to search for
+            executable_names: Executable names to search for
             max_depth: Maximum depth to search (default 3 levels)
+            stop_event: When set, the search gives up before the next directory
             
         Returns:
             Path to executable if found, None otherwise
         """
-        def search_recursive(current_dir: Path, depth: int) -> Optional[Path]:
-            if depth > max_depth:
+        # Windows filesystems are case-insensitive, so match names in lowercase
+        exe_set = {name.lower() for name in executable_names}
+
+        # Iterative depth-first search with an explicit stack of (path, depth)
+        stack = deque([(str(base_dir), 0)])
+        while stack:
+            if stop_event is not None and stop_event.is_set():
                 return None
-            
+            current_dir, depth = stack.pop()
+
+            subdirs = []
             try:
-                # Check if any executable exists in current directory
-                for exe_name in executable_names:
-                    exe_path = current_dir / exe_name
-                    if exe_path.exists() and exe_path.is_file():
-                        return exe_path
-                
-                # Search subdirectories
-                if depth < max_depth:
-                    for item in current_dir.iterdir():
-                        if item.is_dir():
-                            result = search_recursive(item, depth + 1)
-                            if result:
-                                return result
+                # Directory listings serve is_file()/is_dir() from the
+                # enumeration buffer, avoiding a stat call per entry
+                with _scandir(current_dir) as it:
+                    for entry in it:
+                        name = entry.name.lower()
+
+                        # Check if entry is one of the executables
+                        if name in exe_set and entry.is_file():
+                            return Path(entry.path)
+
+                        if (depth < max_depth and name not in self.SKIP_DIRS
+                                and entry.is_dir(follow_symlinks=False)):
+                            subdirs.append((entry.path, depth + 1))
             except (PermissionError, OSError):
                 # Skip directories we can't access
-                pass
-            
-            return None
-        
-        return search_recursive(base_dir, 0)
+                continue
+
+            # Push in reverse so subdirectories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+        return None
     
     def check_registry(self, app_name: str) -> Optional[Path]:
         """
@@ -165,48 +262,120 @@ class AppDetector:
         ]
         
         app_name_lower = app_name.lower()
-        
+        exe_names = self.APP_EXECUTABLES.get(app_name_lower, [])
+        # Case-insensitive search avoids lowercasing every subkey name
+        name_pattern = re.compile(re.escape(app_name_lower), re.IGNORECASE)
+
         for hkey, key_path in registry_keys:
             try:
                 with winreg.OpenKey(hkey, key_path) as key:
-                    # Enumerate all subkeys
-                    i = 0
-                    while True:
+                    # Enumerate all subkeys, bounded by the subkey count
+                    num_subkeys, _, _ = winreg.QueryInfoKey(key)
+                    for i in range(num_subkeys):
                         try:
                             subkey_name = winreg.EnumKey(key, i)
-                            i += 1
-                            
-                            # Check if subkey name contains app name
-                            if app_name_lower in subkey_name.lower():
-                                try:
-                                    with winreg.OpenKey(key, subkey_name) as subkey:
-                                        # Try to get InstallLocation
-                                        install_location, _ = winreg.QueryValueEx(subkey, "InstallLocation")
-                                        if install_location:
-                                            install_path = Path(install_location)
-                                            if install_path.exists():
-                                                # Look for executable in install location
-                                                exe_names = self.APP_EXECUTABLES.get(app_name_lower, [])
-                                                for exe_name in exe_names:
-                                                    exe_path = install_path / exe_name
-                                                    if exe_path.exists():
-                                                        return exe_path
-                                except (OSError, FileNotFoundError):
-                                    continue
                         except OSError:
                             break
+
+                        # Filter by name before opening the subkey
+                        if not name_pattern.search(subkey_name):
+                            continue
+
+                        try:
+                            with winreg.OpenKey(key, subkey_name) as subkey:
+                                # Try to get InstallLocation
+                                install_location, _ = winreg.QueryValueEx(subkey, "InstallLocation")
+                                if install_location:
+                                    install_path = Path(install_location)
+                                    if install_path.exists():
+                                        # Look for executable in install location
+                                        for exe_name in exe_names:
+                                            exe_path = install_path / exe_name
+                                            if exe_path.exists():
+                                                return exe_path
+                        except (OSError, FileNotFoundError):
+                            continue
             except (OSError, PermissionError):
                 continue
         
         return None
     
-    def find_application(self, app_name: str, search_all_drives: bool = False) -> Optional[Path]:
+    @staticmethod
+    def _find_executable_in(directory: str, exe_set: frozenset) -> Optional[Path]:
+        """
+        List a single directory and return the first matching executable.
+        
+        Args:
+            directory: Directory to list
+            exe_set: Set of lowercased executable names to match
+            
+        Returns:
+            Path to executable if found, None otherwise
+        """
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if entry.name.lower() in exe_set and entry.is_file():
+                        return Path(entry.path)
+        except (PermissionError, OSError):
+            pass
+        
+        return None
+    
+    def _search_common_subdirs(self, base_dir: str, subdir_map: Dict[str, List[List[str]]],
+                               exe_set: frozenset) -> Optional[Path]:
+        """
+        Check the known installation subdirectories of a base directory.
+        
+        Args:
+            base_dir: Base directory (e.g. Program Files)
+            subdir_map: Lowercased first subdir segment -> remaining segments
+            exe_set: Set of lowercased executable names to match
+            
+        Returns:
+            Path to executable if found, None otherwise
+        """
+        try:
+            with os.scandir(base_dir) as it:
+                candidates = [
+                    entry for entry in it
+                    if entry.name.lower() in subdir_map and entry.is_dir()
+                ]
+        except (PermissionError, OSError):
+            return None
+        
+        for entry in candidates:
+            for rest in subdir_map[entry.name.lower()]:
+                result = self._find_executable_in(os.path.join(entry.path, *rest), exe_set)
+                if result:
+                    return result
+        
+        return None
+    
+    @staticmethod
+    def _subdir_map(subdirs: List[str]) -> Dict[str, List[List[str]]]:
+        """
+        Map each subdir's first segment (lowercased) to the remaining segments,
+        so a single listing of a base directory finds every candidate
+        (e.g. VideoLAN\\VLC).
+        """
+        subdir_map: Dict[str, List[List[str]]] = {}
+        for subdir in subdirs:
+            first, *rest = subdir.split('\\')
+            subdir_map.setdefault(first.lower(), []).append(rest)
+        return subdir_map
+    
+    def find_application(self, app_name: str, search_all_drives: bool = False,
+                         max_workers: Optional[int] = None) -> Optional[Path]:
         """
         Find an application by searching all common locations.
         
         Args:
             app_name: Application name ('istripper' or 'vlc')
             search_all_drives: If True, search all fixed drives (slower but more thorough)
+            max_workers: Number of drives searched concurrently (default: one per
+                drive, up to 8). Use a low value such as 2 when several drives
+                share a single spinning disk.
             
         Returns:
             Path to executable if found, None otherwise
@@ -223,25 +392,88 @@ class AppDetector:
         if not exe_names:
             return None
         
-        common_subdirs = self.COMMON_SUBDIRS.get(app_name_lower, [])
+        subdir_map = self._subdir_map(self.COMMON_SUBDIRS.get(app_name_lower, []))
+        exe_set = self.APP_EXECUTABLES_LC[app_name_lower]
+        
+        # Program Files (x86) only holds the legacy 32-bit release of an 'x64' app
+        x86_search = (subdir_map, exe_set)
+        if self.APP_BITNESS.get(app_name_lower, 'any') == 'x64':
+            legacy_exes = self.LEGACY_X86_EXECUTABLES.get(app_name_lower)
+            x86_search = None
+            if legacy_exes:
+                x86_search = (self._subdir_map(self.LEGACY_X86_SUBDIRS.get(app_name_lower, [])),
+                              frozenset(name.lower() for name in legacy_exes))
+        
+        # Search Program Files directories, grouped by drive; independent
+        # drives are searched concurrently
+        drive_groups: Dict[str, List[Tuple[Path, Dict[str, List[List[str]]], frozenset]]] = {}
+        for base_dir in self.get_program_files_dirs(include_all_drives=search_all_drives):
+            search = x86_search if base_dir.name == 'Program Files (x86)' else (subdir_map, exe_set)
+            if search is not None:
+                drive_groups.setdefault(base_dir.drive, []).append((base_dir, *search))
+        
+        # Set once a result is chosen, so scans of other drives stop early
+        stop_event = threading.Event()
+        
+        def search_group(drive: str) -> Optional[Path]:
+            # Only do recursive search on C: drive to avoid long delays
+            recursive = not search_all_drives or drive == 'C:'
+            return self._search_roots(drive_groups[drive], recursive, stop_event)
+        
+        if not drive_groups:
+            return None
+        if len(drive_groups) == 1:
+            return search_group(next(iter(drive_groups)))
+        
+        if max_workers is None:
+            max_workers = min(8, len(drive_groups))
         
-        # Search Program Files directories
-        program_files_dirs = self.get_program_files_dirs(include_all_drives=search_all_drives)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(search_group, drive) for drive in drive_groups]
+            # Drives are searched concurrently but results are taken in drive
+            # priority order (C: first), so a copy on a faster secondary drive
+            # never beats the primary install
+            for future in futures:
+                result = future.result()
+                if result:
+                    return result
+        finally:
+            # Don't wait for lower-priority drives once a match is found, and
+            # make scans already running stop at their next directory
+            stop_event.set()
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        for base_dir in program_files_dirs:
+        return None
+    
+    def _search_roots(self, roots: List[Tuple[Path, Dict[str, List[List[str]]], frozenset]],
+                      recursive: bool, stop_event: Optional[threading.Event] = None) -> Optional[Path]:
+        """
+        Search a list of base directories, common subdirectories first.
+        
+        Args:
+            roots: (base directory, subdir map, executable set) to search, in
+                priority order; the subdir map takes lowercased first subdir
+                segments to the remaining segments, the set holds lowercased
+                executable names
+            recursive: If True, fall back to a recursive search of each base directory
+            stop_event: When set, the search gives up (see search_directory_recursive)
+            
+        Returns:
+            Path to executable if found, None otherwise
+        """
+        for base_dir, subdir_map, exe_set in roots:
+            # Work on plain strings below; Path objects are only built for results
+            base_dir = str(base_dir)
+            
             # First check common subdirectories (faster)
-            for subdir in common_subdirs:
-                search_dir = base_dir / subdir
-                if search_dir.exists():
-                    for exe_name in exe_names:
-                        exe_path = search_dir / exe_name
-                        if exe_path.exists() and exe_path.is_file():
-                            return exe_path
+            result = self._search_common_subdirs(base_dir, subdir_map, exe_set)
+            if result:
+                return result
             
             # If not found in common subdirs, do recursive search
-            # Only do recursive search on C: drive to avoid long delays
-            if not search_all_drives or base_dir.drive == 'C:':
-                result = self.search_directory_recursive(base_dir, exe_names)
+            if recursive:
+                result = self.search_directory_recursive(base_dir, exe_set, stop_event=stop_event)
                 if result:
                     return result
         
@@ -257,14 +489,18 @@ class AppDetector:
         Returns:
             Dictionary mapping application names to their paths (or None if not found)
         """
-        results = {}
-        
-        for app_name in self.APP_EXECUTABLES.keys():
-            # Only search all drives for iStripper
-            should_search_all = search_all_drives and app_name == 'istripper'
-            results[app_name] = self.find_application(app_name, search_all_drives=should_search_all)
-        
-        return results
+        # Applications live in largely disjoint directories, so search them
+        # concurrently; a slow iStripper scan then doesn't delay VLC detection
+        with ThreadPoolExecutor(max_workers=len(self.APP_EXECUTABLES)) as executor:
+            futures = {
+                # Only search all drives for iStripper
+                app_name: executor.submit(
+                    self.find_application, app_name,
+                    search_all_drives=search_all_drives and app_name == 'istripper'
+                )
+                for app_name in self.APP_EXECUTABLES.keys()
+            }
+            return {app_name: future.result() for app_name, future in futures.items()}
 
 
 def detect_applications(search_all_drives: bool = False) -> Dict[str, Optional[str]]:
@@ -287,15 +523,48 @@ def detect_applications(search_all_drives: bool = False) -> Dict[str, Optional[s
     return {app: str(path) if path else None for app, path in results.items()}
 
 
+def _program_files_mtimes() -> tuple:
+    """Modification times of the Program Files directories (None if missing)"""
+    mtimes = []
+    for variable in ('ProgramFiles', 'ProgramFiles(x86)'):
+        path = os.environ.get(variable)
+        try:
+            mtimes.append(os.stat(path).st_mtime_ns if path else None)
+        except OSError:
+            mtimes.append(None)
+    return tuple(mtimes)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_istripper_path_cached(program_files_mtimes: tuple) -> Optional[str]:
+    """
+    Search for iStripper; memoized per Program Files modification times.
+    
+    Removing an application removes its directory there, which changes the
+    key and so triggers a new search. A miss is not kept (see
+    find_istripper_path), as iStripper may be installed into an existing
+    vendor folder without changing these times.
+    """
+    path = AppDetector().find_application('istripper')
+    return str(path) if path else None
+
+
 def find_istripper_path() -> Optional[str]:
     """
     Find the iStripper executable path.
 
+    Only iStripper is searched for, and a found path is reused until a
+    Program Files directory changes; a miss is searched for again next time.
+
     Returns:
         Path to iStripper executable as string, or None if not found
     """
-    apps = detect_applications()
-    return apps.get('istripper')
+    if not is_windows():
+        return None
+    path = _find_istripper_path_cached(_program_files_mtimes())
+    if path is None:
+        _find_istripper_path_cached.cache_clear()
+    return path
 
 
 def detect_istripper_content_directory(istripper_path: Optional[str] = None) -> Optional[str]:
@@ -7,6 +7,7 @@ Reads the detected_apps.json file created by the Windows installer.
 """
 
 import json
+import os
 from pathlib import Path
 from typing import Optional, Dict
 from thermalright_lcd_control.common.platform_utils import is_windows, get_data_dir
@@ -17,6 +18,11 @@ class DetectedAppsConfig:
     Loads and provides access to detected application paths.
     """
     
+    __slots__ = (
+        'istripper_path', 'istripper_content_dir', 'vlc_path', 'detection_date',
+        '_istripper_valid', '_istripper_content_valid', '_vlc_valid', '_mtime',
+    )
+    
     def __init__(self):
         """Initialize and load detected applications configuration"""
         self.istripper_path: Optional[str] = None
@@ -24,13 +30,19 @@ class DetectedAppsConfig:
         self.vlc_path: Optional[str] = None
         self.detection_date: Optional[str] = None
         
+        # Path validity is checked when the file is (re)loaded, not on every
+        # accessor; accessors only stat the file to pick up edits (see refresh)
+        self._istripper_valid = False
+        self._istripper_content_valid = False
+        self._vlc_valid = False
+        self._mtime: Optional[float] = None
+        
         self._load_config()
     
     def _get_config_file_path(self) -> Path:
         """Get the path to the detected_apps.json configuration file"""
         if is_windows():
             # Use Windows-specific location
-            import os
             localappdata = os.environ.get('LOCALAPPDATA', '')
             if localappdata:
                 return Path(localappdata) / 'thermalright-lcd-control' / 'detected_apps.json'
@@ -43,12 +55,21 @@ class DetectedAppsConfig:
         """Load configuration from JSON file"""
         config_file = self._get_config_file_path()
         
-        if not config_file.exists():
+        try:
+            self._mtime = config_file.stat().st_mtime
+        except OSError:
+            self._mtime = None
             return
         
         try:
-            with open(config_file, 'r') as f:
-                config = json.load(f)
+            # The file is tiny: read the raw bytes in one call, skipping the
+            # buffered text layer and newline translation
+            fd = os.open(str(config_file), os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                data = os.read(fd, os.fstat(fd).st_size)
+            finally:
+                os.close(fd)
+            config = json.loads(data)
             
             self.istripper_path = config.get('istripper_path')
             self.istripper_content_dir = config.get('istripper_content_dir')
@@ -65,29 +86,57 @@ class DetectedAppsConfig:
             if self.vlc_path and not Path(self.vlc_path).exists():
                 self.vlc_path = None
                 
-        except (json.JSONDecodeError, IOError):
+        except (json.JSONDecodeError, UnicodeDecodeError, IOError):
             # If config file is invalid, just use defaults
             pass
+        
+        self._istripper_valid = self.istripper_path is not None
+        self._istripper_content_valid = self.istripper_content_dir is not None
+        self._vlc_valid = self.vlc_path is not None
+    
+    def refresh(self):
+        """Reload configuration if the JSON file changed since the last load"""
+        try:
+            mtime = self._get_config_file_path().stat().st_mtime
+        except OSError:
+            mtime = None
+        
+        if mtime == self._mtime:
+            return
+        
+        self.istripper_path = None
+        self.istripper_content_dir = None
+        self.vlc_path = None
+        self.detection_date = None
+        self._istripper_valid = False
+        self._istripper_content_valid = False
+        self._vlc_valid = False
+        self._load_config()
     
     def has_istripper(self) -> bool:
-        """Check if iStripper was detected and is still available"""
-        return self.istripper_path is not None and Path(self.istripper_path).exists()
+        """Check if iStripper was detected and its path existed when the file was last loaded"""
+        self.refresh()
+        return self._istripper_valid
     
     def has_vlc(self) -> bool:
-        """Check if VLC was detected and is still available"""
-        return self.vlc_path is not None and Path(self.vlc_path).exists()
+        """Check if VLC was detected and its path existed when the file was last loaded"""
+        self.refresh()
+        return self._vlc_valid
     
     def get_istripper_path(self) -> Optional[str]:
         """Get iStripper executable path"""
-        return self.istripper_path if self.has_istripper() else None
+        self.refresh()
+        return self.istripper_path if self._istripper_valid else None
     
     def get_istripper_content_dir(self) -> Optional[str]:
         """Get iStripper content/models directory path"""
-        return self.istripper_content_dir if self.istripper_content_dir and Path(self.istripper_content_dir).exists() else None
+        self.refresh()
+        return self.istripper_content_dir if self._istripper_content_valid else None
     
     def get_vlc_path(self) -> Optional[str]:
         """Get VLC executable path"""
-        return self.vlc_path if self.has_vlc() else None
+        self.refresh()
+        return self.vlc_path if self._vlc_valid else None
     
     def get_all_detected_apps(self) -> Dict[str, Optional[str]]:
         """
@@ -96,10 +145,11 @@ class DetectedAppsConfig:
         Returns:
             Dictionary mapping app names to paths (None if not detected/available)
         """
+        self.refresh()
         return {
-            'istripper': self.get_istripper_path(),
-            'istripper_content': self.get_istripper_content_dir(),
-            'vlc': self.get_vlc_path()
+            'istripper': self.istripper_path if self._istripper_valid else None,
+            'istripper_content': self.istripper_content_dir if self._istripper_content_valid else None,
+            'vlc': self.vlc_path if self._vlc_valid else None
         }
 
 
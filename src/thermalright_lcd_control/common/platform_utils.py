@@ -3,6 +3,8 @@
 
 """Platform detection and utilities for cross-platform support"""
 
+import functools
+import os
 import platform
 import sys
 from enum import Enum
@@ -16,7 +18,7 @@ class PlatformType(Enum):
     UNKNOWN = "unknown"
 
 
-def get_platform() -> PlatformType:
+def _detect_platform() -> PlatformType:
     """
     Detect the current operating system platform
     
@@ -35,21 +37,45 @@ def get_platform() -> PlatformType:
         return PlatformType.UNKNOWN
 
 
+# The platform cannot change during the process lifetime, so detect it once
+_PLATFORM = _detect_platform()
+_IS_WINDOWS = _PLATFORM is PlatformType.WINDOWS
+_IS_LINUX = _PLATFORM is PlatformType.LINUX
+_IS_MACOS = _PLATFORM is PlatformType.MACOS
+
+# Home directory lookup may hit the password database, so resolve it once
+_HOME = os.path.expanduser('~')
+
+
+def get_platform() -> PlatformType:
+    """
+    Get the current operating system platform
+    
+    Returns:
+        PlatformType: The detected platform type
+    """
+    return _PLATFORM
+
+
 def is_windows() -> bool:
     """Check if running on Windows"""
-    return get_platform() == PlatformType.WINDOWS
+    return _IS_WINDOWS
 
 
 def is_linux() -> bool:
     """Check if running on Linux"""
-    return get_platform() == PlatformType.LINUX
+    return _IS_LINUX
 
 
 def is_macos() -> bool:
     """Check if running on macOS"""
-    return get_platform() == PlatformType.MACOS
+    return _IS_MACOS
 
 
+# Directory helpers depend only on the environment at startup, so each
+# result is computed once per process.
+
+@functools.lru_cache(maxsize=1)
 def get_config_dir() -> str:
     """
     Get platform-specific configuration directory
@@ -58,20 +84,16 @@ def get_config_dir() -> str:
         str: Path to configuration directory
     """
     if is_windows():
-        import os
         return os.path.join(os.environ.get('APPDATA', ''), 'thermalright-lcd-control')
     elif is_linux():
-        import os
-        home = os.path.expanduser('~')
-        return os.path.join(home, '.config', 'thermalright-lcd-control')
+        return os.path.join(_HOME, '.config', 'thermalright-lcd-control')
     elif is_macos():
-        import os
-        home = os.path.expanduser('~')
-        return os.path.join(home, 'Library', 'Application Support', 'thermalright-lcd-control')
+        return os.path.join(_HOME, 'Library', 'Application Support', 'thermalright-lcd-control')
     else:
         return '.'
 
 
+@functools.lru_cache(maxsize=1)
 def get_data_dir() -> str:
     """
     Get platform-specific data directory
@@ -80,20 +102,16 @@ def get_data_dir() -> str:
         str: Path to data directory
     """
     if is_windows():
-        import os
         return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'thermalright-lcd-control')
     elif is_linux():
-        import os
-        home = os.path.expanduser('~')
-        return os.path.join(home, '.local', 'share', 'thermalright-lcd-control')
+        return os.path.join(_HOME, '.local', 'share', 'thermalright-lcd-control')
     elif is_macos():
-        import os
-        home = os.path.expanduser('~')
-        return os.path.join(home, 'Library', 'Application Support', 'thermalright-lcd-control')
+        return os.path.join(_HOME, 'Library', 'Application Support', 'thermalright-lcd-control')
     else:
         return '.'
 
 
+@functools.lru_cache(maxsize=1)
 def get_log_dir() -> str:
     """
     Get platform-specific log directory
@@ -102,22 +120,36 @@ def get_log_dir() -> str:
         str: Path to log directory
     """
     if is_windows():
-        import os
         return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'thermalright-lcd-control', 'logs')
     elif is_linux():
         # For Linux, use /var/log if running as service (root), otherwise use user dir
-        import os
         try:
             if os.geteuid() == 0:  # Running as root
                 return '/var/log'
         except AttributeError:
             # geteuid not available on Windows
             pass
-        home = os.path.expanduser('~')
-        return os.path.join(home, '.local', 'share', 'thermalright-lcd-control', 'logs')
+        return os.path.join(_HOME, '.local', 'share', 'thermalright-lcd-control', 'logs')
+    elif is_macos():
+        return os.path.join(_HOME, 'Library', 'Logs', 'thermalright-lcd-control')
+    else:
+        return '.'
+
+
+@functools.lru_cache(maxsize=1)
+def get_cache_dir() -> str:
+    """
+    Get platform-specific cache directory
+    
+    Returns:
+        str: Path to cache directory
+    """
+    if is_windows():
+        return os.path.join(os.environ.get('LOCALAPPDATA', ''), 'thermalright-lcd-control', 'cache')
+    elif is_linux():
+        return os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(_HOME, '.cache'),
+                            'thermalright-lcd-control')
     elif is_macos():
-        import os
-        home = os.path.expanduser('~')
-        return os.path.join(home, 'Library', 'Logs', 'thermalright-lcd-control')
+        return os.path.join(_HOME, 'Library', 'Caches', 'thermalright-lcd-control')
     else:
         return '.'
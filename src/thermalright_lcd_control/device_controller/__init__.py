@@ -1,4 +1,14 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright © 2025 Rejeb Ben Rejeb
 
-from thermalright_lcd_control.device_controller.device_controller import run_service
+__all__ = ['run_service']
+
+
+def __getattr__(name):
+    # run_service pulls in the whole display stack (PIL, OpenCV, USB/HID):
+    # import it on first access so that subpackages such as metrics can be
+    # imported on their own
+    if name == 'run_service':
+        from thermalright_lcd_control.device_controller.device_controller import run_service
+        return run_service
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Windows-only screen grab that scales while copying, built on GDI StretchBlt.
+
+mss copies the window area at its source resolution and leaves the resize
+to Python. Here the screen is stretched with HALFTONE filtering straight
+into a DIB section of the output size, so only output-sized pixels are
+read back (320x240x4 = 300 KB instead of ~8 MB for a 1080p window).
+
+ScaledGrabber.grab() fills a reused top-down 32-bit BGRX buffer.
+"""
+
+import ctypes
+from ctypes import wintypes
+
+SRCCOPY = 0x00CC0020
+# Include layered (transparent/overlay) windows in the copy
+CAPTUREBLT = 0x40000000
+HALFTONE = 4
+BI_RGB = 0
+DIB_RGB_COLORS = 0
+
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_gdi32 = ctypes.WinDLL('gdi32', use_last_error=True)
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ('biSize', wintypes.DWORD),
+        ('biWidth', wintypes.LONG),
+        ('biHeight', wintypes.LONG),
+        ('biPlanes', wintypes.WORD),
+        ('biBitCount', wintypes.WORD),
+        ('biCompression', wintypes.DWORD),
+        ('biSizeImage', wintypes.DWORD),
+        ('biXPelsPerMeter', wintypes.LONG),
+        ('biYPelsPerMeter', wintypes.LONG),
+        ('biClrUsed', wintypes.DWORD),
+        ('biClrImportant', wintypes.DWORD),
+    ]
+
+
+class BITMAPINFO(ctypes.Structure):
+    _fields_ = [('bmiHeader', BITMAPINFOHEADER), ('bmiColors', wintypes.DWORD * 3)]
+
+
+_GetDC = _user32.GetDC
+_GetDC.argtypes = [wintypes.HWND]
+_GetDC.restype = wintypes.HDC
+
+_ReleaseDC = _user32.ReleaseDC
+_ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+_ReleaseDC.restype = ctypes.c_int
+
+_CreateCompatibleDC = _gdi32.CreateCompatibleDC
+_CreateCompatibleDC.argtypes = [wintypes.HDC]
+_CreateCompatibleDC.restype = wintypes.HDC
+
+_DeleteDC = _gdi32.DeleteDC
+_DeleteDC.argtypes = [wintypes.HDC]
+_DeleteDC.restype = wintypes.BOOL
+
+_CreateDIBSection = _gdi32.CreateDIBSection
+_CreateDIBSection.argtypes = [
+    wintypes.HDC, ctypes.POINTER(BITMAPINFO), wintypes.UINT,
+    ctypes.POINTER(ctypes.c_void_p), wintypes.HANDLE, wintypes.DWORD
+]
+_CreateDIBSection.restype = wintypes.HBITMAP
+
+_SelectObject = _gdi32.SelectObject
+_SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+_SelectObject.restype = wintypes.HGDIOBJ
+
+_DeleteObject = _gdi32.DeleteObject
+_DeleteObject.argtypes = [wintypes.HGDIOBJ]
+_DeleteObject.restype = wintypes.BOOL
+
+_SetStretchBltMode = _gdi32.SetStretchBltMode
+_SetStretchBltMode.argtypes = [wintypes.HDC, ctypes.c_int]
+_SetStretchBltMode.restype = ctypes.c_int
+
+_SetBrushOrgEx = _gdi32.SetBrushOrgEx
+_SetBrushOrgEx.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.POINTER(wintypes.POINT)]
+_SetBrushOrgEx.restype = wintypes.BOOL
+
+_StretchBlt = _gdi32.StretchBlt
+_StretchBlt.argtypes = [
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int,
+    wintypes.HDC, ctypes.c_int, ctypes.c_int, ctypes.c_int, ctypes.c_int, wintypes.DWORD
+]
+_StretchBlt.restype = wintypes.BOOL
+
+_GdiFlush = _gdi32.GdiFlush
+_GdiFlush.argtypes = []
+_GdiFlush.restype = wintypes.BOOL
+
+
+class ScaledGrabber:
+    """
+    Grabs screen areas scaled to a given size into a reused DIB section.
+
+    GDI device contexts belong to the thread that created them: create,
+    use and close a grabber on the same thread.
+    """
+
+    def __init__(self):
+        self._size = None
+        self._bitmap = None
+        self._old_bitmap = None
+        self._buffer = None
+
+        self._screen_dc = _GetDC(None)
+        if not self._screen_dc:
+            raise ctypes.WinError(ctypes.get_last_error())
+        self._mem_dc = _CreateCompatibleDC(self._screen_dc)
+        if not self._mem_dc:
+            error = ctypes.get_last_error()
+            _ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+            raise ctypes.WinError(error)
+
+        # HALFTONE averages source pixels (area filter) when shrinking;
+        # the brush origin must be reset after selecting it
+        _SetStretchBltMode(self._mem_dc, HALFTONE)
+        _SetBrushOrgEx(self._mem_dc, 0, 0, None)
+
+    def _ensure_bitmap(self, width: int, height: int):
+        """(Re)create the output DIB section when the output size changes"""
+        if self._size == (width, height):
+            return
+        self._release_bitmap()
+
+        info = BITMAPINFO()
+        header = info.bmiHeader
+        header.biSize = ctypes.sizeof(BITMAPINFOHEADER)
+        header.biWidth = width
+        # Negative height: top-down rows, matching numpy's row order
+        header.biHeight = -height
+        header.biPlanes = 1
+        header.biBitCount = 32
+        header.biCompression = BI_RGB
+
+        bits = ctypes.c_void_p()
+        bitmap = _CreateDIBSection(self._mem_dc, ctypes.byref(info), DIB_RGB_COLORS, ctypes.byref(bits), None, 0)
+        if not bitmap or not bits.value:
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        self._bitmap = bitmap
+        self._old_bitmap = _SelectObject(self._mem_dc, bitmap)
+        self._buffer = (ctypes.c_ubyte * (width * height * 4)).from_address(bits.value)
+        self._size = (width, height)
+
+    def grab(self, left: int, top: int, width: int, height: int, out_width: int, out_height: int):
+        """
+        Copy a screen area, scaled to (out_width, out_height).
+
+        Args:
+            left: Left of the area in virtual-screen coordinates
+            top: Top of the area in virtual-screen coordinates
+            width: Width of the area
+            height: Height of the area
+            out_width: Width of the output
+            out_height: Height of the output
+
+        Returns:
+            Writable ctypes buffer of out_height rows of out_width BGRX
+            pixels, overwritten by the next grab()
+
+        Raises:
+            OSError: If the copy fails
+        """
+        self._ensure_bitmap(out_width, out_height)
+        if not _StretchBlt(self._mem_dc, 0, 0, out_width, out_height,
+                           self._screen_dc, left, top, width, height, SRCCOPY | CAPTUREBLT):
+            raise ctypes.WinError(ctypes.get_last_error())
+        # Make sure the batched GDI drawing has reached the DIB bits
+        _GdiFlush()
+        return self._buffer
+
+    def _release_bitmap(self):
+        if self._bitmap is not None:
+            _SelectObject(self._mem_dc, self._old_bitmap)
+            _DeleteObject(self._bitmap)
+            self._bitmap = None
+            self._old_bitmap = None
+            self._buffer = None
+            self._size = None
+
+    def close(self):
+        """Release the bitmap and device contexts"""
+        if self._mem_dc:
+            self._release_bitmap()
+            _DeleteDC(self._mem_dc)
+            self._mem_dc = None
+        if self._screen_dc:
+            _ReleaseDC(None, self._screen_dc)
+            self._screen_dc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -55,6 +55,8 @@ class DisplayDevice(ABC):
         elif pathlib.Path(self.config_file).stat().st_mtime_ns > self.last_modified:
             self.logger.info(f"Config file updated: {self.config_file}")
             self.last_modified = pathlib.Path(self.config_file).stat().st_mtime_ns
+            # Release the previous background (threads, capture handles) explicitly
+            self._generator.cleanup()
             self._generator = self._build_generator()
             self.logger.info(f"Display device generator reloaded from {self.config_file}")
             return self._generator
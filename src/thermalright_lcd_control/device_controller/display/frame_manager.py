@@ -1,12 +1,18 @@
 # SPDX-License-Identifier: Apache-2.0
 # Copyright © 2025 Rejeb Ben Rejeb
 
-import glob
+import atexit
+import functools
+import logging
 import os
+import queue
 import threading
 import time
-from threading import Timer
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional
+import numpy as np
 from PIL import Image, ImageSequence
 
 from thermalright_lcd_control.device_controller.display.config import BackgroundType, DisplayConfig
@@ -31,13 +37,38 @@ except ImportError:
     HAS_WINDOW_CAPTURE = False
 
 
+def _cleanup_at_exit(cleanup_ref: weakref.WeakMethod):
+    """atexit hook calling a FrameManager's cleanup() if it is still alive"""
+    cleanup = cleanup_ref()
+    if cleanup is not None:
+        cleanup()
+
+
 class FrameManager:
     """Frame manager with real-time metrics updates and window capture support"""
 
     # Supported video formats
     SUPPORTED_VIDEO_FORMATS = ['.mp4', '.avi', '.mkv', '.mov', '.webm', '.flv', '.wmv', '.m4v']
+    _VIDEO_EXTS_TUPLE = tuple(SUPPORTED_VIDEO_FORMATS)
+    # Image formats picked up by image collections
+    SUPPORTED_IMAGE_FORMATS = ('.jpg', '.jpeg', '.png', '.bmp', '.tiff', '.webp')
     DEFAULT_FRAME_DURATION = 2.0
+    # Highest frame rate worth decoding for the LCD; faster videos are sampled
+    MAX_VIDEO_FPS = 30
+    # Decoded frames kept in memory for streamed backgrounds (videos, collections)
+    VIDEO_CACHE_FRAMES = 8
+    IMAGE_CACHE_FRAMES = 8
+    # Collection images loaded ahead of display on a worker pool
+    IMAGE_PREFETCH = 2
+    # Decoded video frames buffered ahead of display by the decoder thread
+    DECODER_QUEUE_SIZE = 4
     REFRESH_METRICS_INTERVAL = 5.0
+    # Names used when logging that an animated background loops
+    _MEDIA_LABELS = {
+        BackgroundType.VIDEO: "Video",
+        BackgroundType.GIF: "GIF",
+        BackgroundType.IMAGE_COLLECTION: "Image collection",
+    }
     
     def __init__(self, config: DisplayConfig):
         self.config = config
@@ -48,14 +79,52 @@ class FrameManager:
         self.background_frames = []
         self.gif_durations = []
         self.frame_duration = self.DEFAULT_FRAME_DURATION
-        self.frame_start_time = 0
-        self.metrics_thread: Timer | None = None
-        self.metrics_running = False
+        # Monotonic time at which the next frame is due; between deadlines
+        # get_current_frame() returns _last_frame without any other work
+        self._next_deadline = 0.0
+        self._last_frame: Optional[np.ndarray] = None
+        self.metrics_thread: threading.Thread | None = None
+        self._metrics_stop = threading.Event()
+        
+        # Streamed backgrounds decode frames on demand instead of keeping all
+        # of them in background_frames; _frame_source(index) returns a frame
+        self._frame_source = None
+        self._stream_length = 0
+        self._video_capture = None
+        self._video_stride = 1
+        self._video_next_index = 0
+        self._video_cache: OrderedDict = OrderedDict()
+        
+        # Video decoding runs on a background thread feeding _frame_queue,
+        # overlapping decode with frame transmission (OpenCV releases the GIL)
+        self._frame_queue: queue.Queue = queue.Queue(maxsize=self.DECODER_QUEUE_SIZE)
+        self._decoder_thread: Optional[threading.Thread] = None
+        self._decoder_stop = threading.Event()
+        self._video_frame: Optional[np.ndarray] = None
+        self._video_frame_index = 0
+        self._image_files = []
+        
+        # Upcoming collection images are decoded and resized on a small pool
+        # (PIL/OpenCV release the GIL) so switching images does not stall
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+        self._prefetch_futures: OrderedDict = OrderedDict()
+        
+        # Opaque black frame at output size, built once and copied when a
+        # padded frame is needed
+        self._black_frame = np.zeros((config.output_height, config.output_width, 4), dtype=np.uint8)
+        self._black_frame[..., 3] = 255
         
         # Window capture for iStripper and other apps
         self.window_capture: Optional[WindowCapture] = None
         self.is_window_capture_mode = False
         
+        # Release threads and capture handles at interpreter exit if the
+        # owner never called cleanup(), also when loading the background
+        # below fails part way; the weak reference keeps this hook from
+        # holding the instance alive
+        self._atexit_hook = functools.partial(_cleanup_at_exit, weakref.WeakMethod(self.cleanup))
+        atexit.register(self._atexit_hook)
+        
         if len(config.metrics_configs) != 0:
             # Initialize metrics collectors
             self.cpu_metrics = CpuMetrics()
@@ -70,42 +139,37 @@ class FrameManager:
             self.current_metrics = {}
             self._stop_metrics_update()
 
+        # Background loaders by type
+        self._loaders = {
+            BackgroundType.IMAGE: self._load_static_image,
+            BackgroundType.GIF: self._load_gif,
+            BackgroundType.VIDEO: self._load_video_background,
+            BackgroundType.IMAGE_COLLECTION: self._load_image_collection,
+            BackgroundType.WINDOW_CAPTURE: self._load_window_capture,
+        }
+
         # Load background
         self._load_background()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+
     def _is_video_file(self, file_path: str) -> bool:
         """Check if the file is a supported video format"""
-        if not file_path:
-            return False
-
-        file_ext = os.path.splitext(file_path)[1].lower()
-        return file_ext in self.SUPPORTED_VIDEO_FORMATS
+        return bool(file_path) and file_path.lower().endswith(self._VIDEO_EXTS_TUPLE)
 
     def _load_background(self):
         """Load background based on its type and set frame duration"""
         try:
-            if self.config.background_type == BackgroundType.IMAGE:
-                self._load_static_image()
-            elif self.config.background_type == BackgroundType.GIF:
-                self._load_gif()
-            elif self.config.background_type == BackgroundType.VIDEO:
-                if HAS_OPENCV and self._is_video_file(self.config.background_path):
-                    self._load_video()
-                else:
-                    if not HAS_OPENCV:
-                        self.logger.warning(
-                            "OpenCV not available. Video background type is not supported. Falling back to static image.")
-                    else:
-                        self.logger.warning(
-                            f"Unsupported video format. Supported formats: {', '.join(self.SUPPORTED_VIDEO_FORMATS)}. Falling back to static image.")
-                    # Fallback to treating video path as a static image
-                    self._load_static_image()
-            elif self.config.background_type == BackgroundType.IMAGE_COLLECTION:
-                self._load_image_collection()
-            elif self.config.background_type == BackgroundType.WINDOW_CAPTURE:
-                self._load_window_capture()
-
-            self.frame_start_time = time.time()
+            loader = self._loaders.get(self.config.background_type)
+            if loader is not None:
+                loader()
+
+            self._last_frame = None
+            self._next_deadline = time.monotonic() + self.frame_duration
             self.logger.info(
                 f"Background loaded: {self.config.background_type}, frame_duration: {self.frame_duration}s")
 
@@ -113,20 +177,125 @@ class FrameManager:
             self.logger.error(f"Error loading background: {e}")
             raise
 
+    def _load_video_background(self):
+        """Load a video background, falling back to a static image when it cannot be played"""
+        if HAS_OPENCV and self._is_video_file(self.config.background_path):
+            self._load_video()
+            return
+
+        if not HAS_OPENCV:
+            self.logger.warning(
+                "OpenCV not available. Video background type is not supported. Falling back to static image.")
+        else:
+            self.logger.warning(
+                f"Unsupported video format. Supported formats: {', '.join(self.SUPPORTED_VIDEO_FORMATS)}. Falling back to static image.")
+        # Fallback to treating video path as a static image
+        self._load_static_image()
+
     def _load_static_image(self) -> None:
         """Load a static image"""
         if not os.path.exists(self.config.background_path):
             raise FileNotFoundError(f"Background image not found: {self.config.background_path}")
 
         image = Image.open(self.config.background_path)
-        image = self._resize_image(image)
-        self.background_frames = [image]
+        # Single-frame (1, H, W, 4) block, same layout as GIF backgrounds
+        self.background_frames = self._resize_image(image)[np.newaxis]
+
+    @staticmethod
+    def _is_downscale(src_width: int, src_height: int, width: int, height: int) -> bool:
+        """Whether resizing src to (width, height) shrinks the image on both axes"""
+        return max(width / src_width, height / src_height) < 1.0
+
+    def _resize_np(self, arr: np.ndarray, width: int, height: int, bgr: bool = False) -> np.ndarray:
+        """
+        Resize a uint8 RGB or RGBA array with OpenCV (INTER_AREA down,
+        INTER_LANCZOS4 up). 3-channel input gets its opaque alpha channel
+        added after the resize, on the smaller output; with bgr=True it is
+        treated as OpenCV BGR and converted to RGBA in the same pass.
+        """
+        src_height, src_width = arr.shape[:2]
+        if self._is_downscale(src_width, src_height, width, height):
+            interpolation = cv2.INTER_AREA
+        else:
+            interpolation = cv2.INTER_LANCZOS4
+        # OpenCV only takes its vectorized resize kernels for contiguous 8-bit data
+        if arr.dtype != np.uint8 or not arr.flags.c_contiguous:
+            arr = np.ascontiguousarray(arr, dtype=np.uint8)
+        arr = cv2.resize(arr, (width, height), interpolation=interpolation)
+        if arr.shape[2] == 3:
+            arr = cv2.cvtColor(arr, cv2.COLOR_BGR2RGBA if bgr else cv2.COLOR_RGB2RGBA)
+        return arr
+
+    def _resize_pil(self, image: Image.Image, width: int, height: int) -> Image.Image:
+        """Resize a PIL image (BOX down, LANCZOS up)"""
+        if self._is_downscale(image.width, image.height, width, height):
+            resample = Image.Resampling.BOX
+        else:
+            resample = Image.Resampling.LANCZOS
+        return image.resize((width, height), resample)
+
+    def _scale_array(self, arr: np.ndarray, bgr: bool = False) -> np.ndarray:
+        """
+        Resize and scale an RGB(A) array to fit output dimensions.
+        Applies scale_factor for manual zoom adjustment.
+        
+        Args:
+            arr: (H, W, 3) or (H, W, 4) uint8 array
+            bgr: Whether 3-channel input is in OpenCV BGR order
+            
+        Returns:
+            np.ndarray: (H, W, 4) uint8 RGBA frame
+        """
+        target_width = self.config.output_width
+        target_height = self.config.output_height
+
+        # Apply scale factor if not 1.0
+        if self.config.scale_factor != 1.0:
+            # Calculate scaled dimensions
+            scaled_width = int(target_width * self.config.scale_factor)
+            scaled_height = int(target_height * self.config.scale_factor)
+
+            # Resize to scaled dimensions first
+            arr = self._resize_np(arr, scaled_width, scaled_height, bgr)
+
+            # If scale > 1.0 (zoom in), crop to target size from center
+            if self.config.scale_factor > 1.0:
+                left = (scaled_width - target_width) // 2
+                top = (scaled_height - target_height) // 2
+                arr = np.ascontiguousarray(arr[top:top + target_height, left:left + target_width])
+            # If scale < 1.0 (zoom out), pad with black to target size
+            elif self.config.scale_factor < 1.0:
+                result = self._black_frame.copy()
+                paste_x = (target_width - scaled_width) // 2
+                paste_y = (target_height - scaled_height) // 2
+                result[paste_y:paste_y + scaled_height, paste_x:paste_x + scaled_width] = arr
+                arr = result
+        else:
+            # No scaling, just resize to fit
+            arr = self._resize_np(arr, target_width, target_height, bgr)
 
-    def _resize_image(self, image: Image.Image) -> Image.Image:
+        return arr
+
+    def _resize_image(self, image: Image.Image) -> np.ndarray:
         """
         Resize and scale image to fit output dimensions.
         Applies scale_factor for manual zoom adjustment.
+        
+        Uses OpenCV when available (SIMD resampling, much faster than PIL),
+        falling back to PIL otherwise. Downscales (the usual case, e.g. a
+        1920x1080 source on a 320x240 LCD) use area averaging (INTER_AREA /
+        BOX), which anti-aliases as well as Lanczos at a fraction of the
+        cost; Lanczos is only used when enlarging.
+        
+        Returns:
+            np.ndarray: (H, W, 4) uint8 RGBA frame
         """
+        if HAS_OPENCV:
+            # RGB frames are resized as-is and gain alpha in _resize_np
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA')
+            return self._scale_array(np.asarray(image))
+
         target_width = self.config.output_width
         target_height = self.config.output_height
         
@@ -137,7 +306,7 @@ class FrameManager:
             scaled_height = int(target_height * self.config.scale_factor)
             
             # Resize to scaled dimensions first
-            image = image.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+            image = self._resize_pil(image, scaled_width, scaled_height)
             
             # If scale > 1.0 (zoom in), crop to target size from center
             if self.config.scale_factor > 1.0:
@@ -155,11 +324,11 @@ class FrameManager:
                 image = result
         else:
             # No scaling, just resize to fit
-            image = image.resize((target_width, target_height), Image.Resampling.LANCZOS)
+            image = self._resize_pil(image, target_width, target_height)
         
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
-        return image
+        return np.asarray(image)
 
     def _load_gif(self):
         """
@@ -170,18 +339,24 @@ class FrameManager:
         if not os.path.exists(self.config.background_path):
             raise FileNotFoundError(f"Background GIF not found: {self.config.background_path}")
 
-        gif = Image.open(self.config.background_path)
-
-        self.background_frames = []
-
-        # Extract all frames from GIF
-        for frame in ImageSequence.Iterator(gif):
-            gif_frame_duration = self._gif_duration(frame)
-            self.logger.debug(f"Extracting GIF frame with duration: {gif_frame_duration:.3f}s")
-            frame_copy = frame.copy()
-            frame_copy = self._resize_image(frame_copy)
-            self.background_frames.append(frame_copy)
-            self.gif_durations.append(gif_frame_duration)
+        with Image.open(self.config.background_path) as gif:
+            # All frames live in one contiguous (N, H, W, 4) block, and
+            # durations are sized up front so reloading never mixes in
+            # durations from a previously loaded GIF
+            n_frames = getattr(gif, 'n_frames', 1)
+            self.background_frames = np.empty(
+                (n_frames, self.config.output_height, self.config.output_width, 4), dtype=np.uint8)
+            self.gif_durations = [0.0] * n_frames
+
+            # Extract frames and durations in one pass. _resize_image always
+            # produces a new array, so frames need no intermediate copy()
+            extracted = 0
+            for i, frame in enumerate(ImageSequence.Iterator(gif)):
+                self.gif_durations[i] = self._gif_duration(frame)
+                self.background_frames[i] = self._resize_image(frame)
+                extracted = i + 1
+            self.background_frames = self.background_frames[:extracted]
+            del self.gif_durations[extracted:]
 
         self.frame_duration = self.gif_durations[0]
         self.logger.info(f"GIF loaded: {len(self.background_frames)} frames, loops continuously")
@@ -209,33 +384,157 @@ class FrameManager:
                 f"Unsupported video format '{file_ext}'. Supported formats: {', '.join(self.SUPPORTED_VIDEO_FORMATS)}")
 
         # OpenCV VideoCapture reads only video frames, audio is automatically ignored
-        video_capture = cv2.VideoCapture(self.config.background_path)
+        video_capture = cv2.VideoCapture(self.config.background_path, cv2.CAP_FFMPEG)
+        if not video_capture.isOpened():
+            # FFmpeg backend unavailable in this OpenCV build, let OpenCV pick one
+            video_capture = cv2.VideoCapture(self.config.background_path)
         if not video_capture.isOpened():
             raise RuntimeError(
                 f"Cannot open video: {self.config.background_path}. Please check if the file is corrupted or if OpenCV supports this codec.")
+        video_capture.set(cv2.CAP_PROP_BUFFERSIZE, 1)
 
         # Get video properties
         fps = video_capture.get(cv2.CAP_PROP_FPS)
         frame_count = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
         duration = frame_count / fps if fps > 0 else 0
-        self.frame_duration = 1.0 / fps if fps > 0 else 1.0 / 30  # Fallback 30 FPS
-
-        for i in range(frame_count):
-            ret, frame = video_capture.read()
-            if not ret:
-                break
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            image = self._resize_image(Image.fromarray(frame_rgb))
-            self.background_frames.append(image)
 
-        video_capture.release()
+        # Only decode the frames that will actually be displayed: sources
+        # faster than MAX_VIDEO_FPS are sampled with a fixed stride and the
+        # skipped frames are only grabbed (demuxed), never decoded
+        stride = max(1, round(fps / self.MAX_VIDEO_FPS)) if fps > 0 else 1
+        self.frame_duration = stride / fps if fps > 0 else 1.0 / 30  # Fallback 30 FPS
+
+        # Frames are decoded on demand from the open capture; only a small
+        # cache of recent frames is kept in memory
+        self._video_capture = video_capture
+        self._video_stride = stride
+        self._video_next_index = 0
+        self._video_cache.clear()
+        self._stream_length = max(1, -(-frame_count // stride))
+
+        # Decode the first frame now so unreadable videos fail at load time
+        self._video_frame = self._read_video_frame(0)
+        self._video_frame_index = 0
+        if self._video_frame is None:
+            self._release_video()
+            raise RuntimeError(f"Cannot decode video: {self.config.background_path}")
+
+        # Decode the following frames ahead of time on a background thread
+        self._frame_source = self._next_video_frame
+        self._decoder_stop.clear()
+        self._decoder_thread = threading.Thread(target=self._decoder_worker, name="video-decoder", daemon=True)
+        self._decoder_thread.start()
 
         self.logger.info(f"Video loaded: {os.path.basename(self.config.background_path)} (audio disabled, loops continuously)")
         self.logger.info(f"  Format: {os.path.splitext(self.config.background_path)[1].upper()}")
-        self.logger.info(f"  FPS: {fps:.2f}")
+        self.logger.info(f"  FPS: {fps:.2f} (decoding every {stride} frame(s))")
         self.logger.info(f"  Duration: {duration:.1f}s per loop")
         self.logger.info(f"  Frame duration: {self.frame_duration:.3f}s")
-        self.logger.info(f"  Total frames loaded: {len(self.background_frames)}")
+        self.logger.info(f"  Total frames: {self._stream_length} (streamed)")
+
+    def _read_video_frame(self, index: int) -> Optional[np.ndarray]:
+        """
+        Decode displayed frame `index` of the current video.
+
+        Sequential playback only walks the stream forward; the capture is
+        repositioned only when a frame out of order is requested (on loop).
+        """
+        frame = self._video_cache.get(index)
+        if frame is not None:
+            self._video_cache.move_to_end(index)
+            return frame
+
+        video_capture = self._video_capture
+        stride = self._video_stride
+        if index != self._video_next_index:
+            video_capture.set(cv2.CAP_PROP_POS_FRAMES, index * stride)
+
+        ret = video_capture.grab()
+        if ret:
+            ret, frame = video_capture.retrieve()
+        if not ret:
+            # Stream ended earlier than the reported frame count
+            self._video_next_index = -1
+            if index > 0:
+                self._stream_length = index
+            return next(reversed(self._video_cache.values()), None)
+
+        # Skip the frames between two displayed frames without decoding them
+        for _ in range(stride - 1):
+            video_capture.grab()
+        self._video_next_index = index + 1
+
+        # Resize the decoded BGR frame first and convert only the small
+        # result to RGBA, so the full-size frame is touched once
+        frame = self._scale_array(frame, bgr=True)
+
+        self._video_cache[index] = frame
+        if len(self._video_cache) > self.VIDEO_CACHE_FRAMES:
+            self._video_cache.popitem(last=False)
+        return frame
+
+    def _decoder_worker(self):
+        """Decode video frames in display order and queue them for get_current_frame()"""
+        index = self._video_frame_index
+        try:
+            while not self._decoder_stop.is_set():
+                index = (index + 1) % self._stream_length
+                frame = self._read_video_frame(index)
+                if frame is None:
+                    # Nothing decodable right now, retry on the next frame tick
+                    self._decoder_stop.wait(self.frame_duration)
+                    continue
+                # Block while the queue is full, but keep checking for stop
+                while not self._decoder_stop.is_set():
+                    try:
+                        self._frame_queue.put((index, frame), timeout=0.1)
+                        break
+                    except queue.Full:
+                        continue
+        except Exception as e:
+            self.logger.error(f"Video decoder stopped: {e}")
+
+    def _next_video_frame(self, index: int) -> np.ndarray:
+        """
+        Return the video frame for `index`, taking the next frame from the
+        decoder queue when playback advances.
+        """
+        if index == self._video_frame_index:
+            return self._video_frame
+
+        try:
+            index, frame = self._frame_queue.get(timeout=self.frame_duration)
+        except queue.Empty:
+            # Decoder is behind: keep showing the current frame for this tick
+            self.current_frame_index = self._video_frame_index
+            return self._video_frame
+
+        # Follow the decoder's position (it may wrap early on short streams)
+        self.current_frame_index = index
+        self._video_frame_index = index
+        self._video_frame = frame
+        return frame
+
+    def _stop_decoder(self):
+        """Stop the video decoder thread and drop queued frames"""
+        self._decoder_stop.set()
+        if self._decoder_thread is not None:
+            self._decoder_thread.join(timeout=1.0)
+            self._decoder_thread = None
+        while not self._frame_queue.empty():
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def _release_video(self):
+        """Release the open video capture and its decoded frames"""
+        self._stop_decoder()
+        if self._video_capture is not None:
+            self._video_capture.release()
+            self._video_capture = None
+        self._video_cache.clear()
+        self._video_frame = None
 
     def _load_image_collection(self):
         """
@@ -247,26 +546,68 @@ class FrameManager:
         if not os.path.isdir(self.config.background_path):
             raise NotADirectoryError(f"Background directory not found: {self.config.background_path}")
 
-        # Search for all images in the folder
-        image_extensions = ['*.jpg', '*.jpeg', '*.png', '*.bmp', '*.tiff', '*.webp']
-        image_files = []
-
-        for ext in image_extensions:
-            image_files.extend(glob.glob(os.path.join(self.config.background_path, ext)))
-            image_files.extend(glob.glob(os.path.join(self.config.background_path, ext.upper())))
+        # Search for all images in the folder with a single directory listing
+        # (extensions are matched case-insensitively)
+        with os.scandir(self.config.background_path) as entries:
+            image_files = [
+                entry.path for entry in entries
+                if entry.name.lower().endswith(self.SUPPORTED_IMAGE_FORMATS) and entry.is_file()
+            ]
 
         image_files.sort()  # Alphabetical sort
 
         if not image_files:
             raise RuntimeError(f"No images found in directory: {self.config.background_path}")
 
-        for image_path in image_files:
-            image = Image.open(image_path)
-            image = self._resize_image(image)
-            self.background_frames.append(image)
+        # Images are loaded on demand, keeping only the most recent ones,
+        # while the next few are prepared in the background
+        self._image_files = image_files
+        self._stream_length = len(image_files)
+        if len(image_files) > 1:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=min(self.IMAGE_PREFETCH, os.cpu_count() or 1),
+                thread_name_prefix="collection-prefetch")
+        self._frame_source = functools.lru_cache(maxsize=self.IMAGE_CACHE_FRAMES)(self._collection_frame)
+
+        # Load the first image now so unreadable files fail at load time
+        self._frame_source(0)
 
         self.logger.info(f"Image collection loaded: {len(image_files)} images, loops continuously")
 
+    def _load_collection_image(self, index: int) -> np.ndarray:
+        """Load and resize image `index` of the current image collection"""
+        with Image.open(self._image_files[index]) as image:
+            return self._resize_image(image)
+
+    def _collection_frame(self, index: int) -> np.ndarray:
+        """
+        Return collection image `index`, using its prefetched result when
+        available, and queue the following images for loading.
+        """
+        future = self._prefetch_futures.pop(index, None)
+        frame = future.result() if future is not None else self._load_collection_image(index)
+
+        if self._prefetch_executor is not None:
+            for ahead in range(1, self.IMAGE_PREFETCH + 1):
+                next_index = (index + ahead) % self._stream_length
+                if next_index != index and next_index not in self._prefetch_futures:
+                    self._prefetch_futures[next_index] = self._prefetch_executor.submit(
+                        self._load_collection_image, next_index)
+            # Bound pending results so skipped images do not accumulate
+            while len(self._prefetch_futures) > self.IMAGE_PREFETCH:
+                _, stale = self._prefetch_futures.popitem(last=False)
+                stale.cancel()
+        return frame
+
+    def _stop_prefetch(self):
+        """Cancel pending collection loads and shut the prefetch pool down"""
+        for future in self._prefetch_futures.values():
+            future.cancel()
+        self._prefetch_futures.clear()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_executor = None
+
     def _load_window_capture(self):
         """
         Initialize window capture for displaying application content (e.g., iStripper).
@@ -279,7 +620,7 @@ class FrameManager:
             raise RuntimeError(
                 "Window capture not available. Install required packages:\n"
                 "  Windows: pip install mss pygetwindow\n"
-                "  Linux: pip install python-xlib"
+                "  Linux: pip install python-xlib mss"
             )
         
         if not self.config.window_title:
@@ -293,39 +634,42 @@ class FrameManager:
             fps=self.config.capture_fps,
             scale_factor=self.config.scale_factor
         )
+        # Capture runs on its own thread so slow grabs never stall rendering
+        self.window_capture.start()
         
         self.is_window_capture_mode = True
         self.frame_duration = 1.0 / self.config.capture_fps
         
         # Pre-load one black frame as fallback
-        black_frame = Image.new('RGBA', (self.config.output_width, self.config.output_height), (0, 0, 0, 255))
-        self.background_frames = [black_frame]
+        self.background_frames = self._black_frame[np.newaxis]
         
         scale_info = f", scale: {self.config.scale_factor}x" if self.config.scale_factor != 1.0 else ""
         self.logger.info(f"Window capture initialized: '{self.config.window_title}' at {self.config.capture_fps} FPS{scale_info}")
 
     def _start_metrics_update(self):
-        """Start the metrics update thread every second"""
+        """Start the metrics update thread, refreshing every REFRESH_METRICS_INTERVAL seconds"""
         self.logger.info("Starting metrics update thread ...")
-        self.metrics_running = True
-        self.metrics_thread = threading.Timer(interval=self.REFRESH_METRICS_INTERVAL,function=self._metrics_update_loop)
+        self._metrics_stop.clear()
+        self.metrics_thread = threading.Thread(target=self._metrics_update_loop, name="metrics-update", daemon=True)
         self.metrics_thread.start()
         self.logger.debug("Metrics update thread started")
 
     def _stop_metrics_update(self):
-        """Start the metrics update thread every second"""
-        self.metrics_running = False
+        """Stop the metrics update thread"""
+        self._metrics_stop.set()
         if self.metrics_thread:
-            self.metrics_thread.cancel()
+            self.metrics_thread.join(timeout=1.0)
             self.metrics_thread = None
-        self.logger.debug("Metrics update thread started")
+        self.logger.debug("Metrics update thread stopped")
 
     def _metrics_update_loop(self):
-        new_metrics = self._get_current_metric()
-        self.current_metrics = new_metrics
-        if self.metrics_running:
-            self.metrics_thread = threading.Timer(interval=self.REFRESH_METRICS_INTERVAL, function=self._metrics_update_loop)
-            self.metrics_thread.start()
+        # A single long-lived thread; wait() returns True as soon as a stop is requested
+        while not self._metrics_stop.wait(self.REFRESH_METRICS_INTERVAL):
+            try:
+                self.current_metrics = self._get_current_metric()
+            except Exception:
+                # Already logged by _get_current_metric, keep the last values
+                pass
 
     def _get_current_metric(self):
         try:
@@ -357,58 +701,77 @@ class FrameManager:
         except:
             return 0.1  # Default fallback
 
-    def get_current_frame(self) -> Image.Image:
+    def get_current_frame(self) -> np.ndarray:
         """
         Get the current background frame.
         
         Automatically loops through all frames (for videos, GIFs, and image collections)
         until a different media is selected. The looping is continuous and seamless.
         
-        For window capture mode (iStripper), captures a fresh frame in real-time.
+        For window capture mode (iStripper), picks up the latest frame from the
+        capture thread once per capture interval.
+        
+        Between frame deadlines the previously returned frame is reused, so
+        calling this more often than the frame rate costs nothing.
+        
+        Returns:
+            np.ndarray: (H, W, 4) uint8 RGBA frame. Callers needing a PIL image
+            should wrap it with Image.fromarray(frame) (mode inferred as RGBA).
         """
+        now = time.monotonic()
+        if now < self._next_deadline:
+            if self._last_frame is not None:
+                return self._last_frame
+        else:
+            # Schedule from the previous deadline so timing does not drift,
+            # but never try to catch up on missed frames
+            self._advance_frame()
+            self._next_deadline += self.frame_duration
+            if self._next_deadline <= now:
+                self._next_deadline = now + self.frame_duration
+
         # Handle window capture mode (iStripper, etc.)
         if self.is_window_capture_mode and self.window_capture:
-            current_time = time.time()
-            
-            # Check if it's time to capture a new frame
-            if current_time - self.frame_start_time >= self.frame_duration:
-                self.frame_start_time = current_time
-                
-                # Capture new frame from window
-                captured_frame = self.window_capture.capture_frame()
-                
-                if captured_frame:
-                    # Successfully captured - update the frame
-                    return captured_frame
-                else:
-                    # Window not found or capture failed - return black frame
-                    self.logger.debug(f"Window '{self.config.window_title}' not available, using fallback frame")
-                    return self.background_frames[0]  # Return black fallback frame
+            captured_frame = self.window_capture.get_latest()
+            if captured_frame is not None:
+                self._last_frame = captured_frame
             else:
-                # Return the last captured frame (stored in background_frames[0] if needed)
-                # For window capture, we return a new capture each time
-                return self.window_capture.capture_frame() or self.background_frames[0]
+                # Window not found or capture failed - use black frame
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Window '{self.config.window_title}' not available, using fallback frame")
+                self._last_frame = self.background_frames[0]
+            return self._last_frame
+
+        if self._frame_source is not None:
+            frame = self._frame_source(self.current_frame_index)
+        else:
+            frame = self.background_frames[self.current_frame_index]
+        self._last_frame = frame
+        return frame
+
+    def _advance_frame(self):
+        """Move to the next frame, looping back to the start at the end"""
+        if self.is_window_capture_mode:
+            return
+
+        # Advance to next frame with wraparound (loop back to start when reaching the end)
+        previous_index = self.current_frame_index
+        frame_count = self._frame_count()
+        self.current_frame_index = (self.current_frame_index + 1) % frame_count
         
-        # Handle standard media types (images, videos, GIFs, collections)
-        current_time = time.time()
-
-        if current_time - self.frame_start_time >= self.frame_duration:
-            self.frame_start_time = current_time
-            # Advance to next frame with wraparound (loop back to start when reaching the end)
-            previous_index = self.current_frame_index
-            self.current_frame_index = (self.current_frame_index + 1) % len(self.background_frames)
-            
-            # Log when video/animation loops back to start
-            if previous_index > 0 and self.current_frame_index == 0:
-                media_type = "video" if self.config.background_type == BackgroundType.VIDEO else \
-                            "GIF" if self.config.background_type == BackgroundType.GIF else \
-                            "image collection"
-                self.logger.debug(f"{media_type.capitalize()} looping back to start (frame 0/{len(self.background_frames)-1})")
+        # Log when video/animation loops back to start
+        if previous_index > 0 and self.current_frame_index == 0 and self.logger.isEnabledFor(logging.DEBUG):
+            media_type = self._MEDIA_LABELS.get(self.config.background_type, "Background")
+            self.logger.debug(f"{media_type} looping back to start (frame 0/{frame_count-1})")
 
         if self.config.background_type == BackgroundType.GIF:
             self.frame_duration = self.gif_durations[self.current_frame_index]
 
-        return self.background_frames[self.current_frame_index]
+    def _frame_count(self) -> int:
+        """Number of frames in the current background"""
+        if self._frame_source is not None:
+            return self._stream_length
+        return len(self.background_frames)
 
     def get_current_frame_info(self) -> Tuple[int, float]:
         """
@@ -426,9 +789,9 @@ class FrameManager:
 
     def cleanup(self):
         """Clean up resources"""
-        self.metrics_running = False
+        self._metrics_stop.set()
         if self.metrics_thread:
-            self.metrics_thread.cancel()
+            self.metrics_thread.join(timeout=1.0)
             self.metrics_thread = None
         
         # Clean up window capture if active
@@ -436,8 +799,19 @@ class FrameManager:
             self.window_capture.cleanup()
             self.window_capture = None
 
-        self.logger.debug("FrameManager cleaned up")
+        # Release streamed background resources
+        self._release_video()
+        self._stop_prefetch()
+        if self._frame_source is not None and hasattr(self._frame_source, 'cache_clear'):
+            self._frame_source.cache_clear()
+        self._frame_source = None
+        self._image_files = []
+        self.background_frames = []
+        self._last_frame = None
 
-    def __del__(self):
-        """Destructor to automatically clean up"""
-        self.cleanup()
+        atexit_hook = getattr(self, '_atexit_hook', None)
+        if atexit_hook is not None:
+            atexit.unregister(atexit_hook)
+            self._atexit_hook = None
+
+        self.logger.debug("FrameManager cleaned up")
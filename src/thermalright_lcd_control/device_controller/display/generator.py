@@ -9,7 +9,6 @@ from PIL import Image, ImageDraw
 from thermalright_lcd_control.device_controller.display.config import DisplayConfig
 from thermalright_lcd_control.device_controller.display.frame_manager import FrameManager
 from thermalright_lcd_control.device_controller.display.text_renderer import TextRenderer
-from thermalright_lcd_control.device_controller.display.utils import async_background
 from thermalright_lcd_control.common.logging_config import LoggerConfig
 
 
@@ -21,6 +20,7 @@ class DisplayGenerator:
         self.logger = self.logger = LoggerConfig.setup_service_logger()
         # Initialize components
         self.frame_manager = FrameManager(config)
+        self._cleaned_up = False
         self.text_renderer = TextRenderer(config)  # Pass config for global font
 
         self.logger.info(f"DisplayGenerator initialized with background type: {self.config.background_type}")
@@ -59,8 +59,9 @@ class DisplayGenerator:
             metrics: Dictionary of metric values to display
             apply_rotation: Whether to apply rotation to the final frame (default: True)
         """
-        # Get current background
-        background = self.frame_manager.get_current_frame()
+        # Get current background (RGBA array); the wrapper is read-only, so
+        # drawing on it copies instead of modifying the cached frame
+        background = Image.fromarray(self.frame_manager.get_current_frame())
 
         # Add foreground image if configured
         result = self._add_foreground_image(background)
@@ -123,12 +124,13 @@ class DisplayGenerator:
         """Get current metrics"""
         return self.frame_manager.get_current_metrics()
 
-    @async_background
     def cleanup(self):
-        """Clean up resources"""
+        """
+        Clean up resources, synchronously so a replacement generator never
+        overlaps a release still in progress. Later calls do nothing.
+        """
+        if self._cleaned_up:
+            return
+        self._cleaned_up = True
         self.frame_manager.cleanup()
         self.logger.debug("DisplayGenerator cleaned up")
-
-    def __del__(self):
-        """Destructor to automatically clean up"""
-        self.cleanup()
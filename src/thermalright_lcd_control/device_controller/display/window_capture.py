@@ -6,7 +6,10 @@ Window capture functionality for capturing content from application windows.
 Supports capturing from iStripper and other applications for display on LCD.
 """
 
+import sys
+import threading
 import time
+from collections import deque
 from typing import Optional
 from PIL import Image
 import numpy as np
@@ -14,14 +17,47 @@ import numpy as np
 from thermalright_lcd_control.common.platform_utils import is_windows, is_linux
 from thermalright_lcd_control.common.logging_config import get_service_logger
 
+# Try to import OpenCV for fast in-place pixel conversion and resizing
+try:
+    import cv2
+    HAS_OPENCV = True
+except ImportError:
+    HAS_OPENCV = False
+
+
+def _bgra_to_opaque_rgba_inplace(bgra: np.ndarray):
+    """
+    Swap B and R and set alpha to 255 in a contiguous (H, W, 4) uint8 array.
+    
+    On little-endian machines each pixel is handled as one uint32 (SWAR):
+    the B and R bytes are exchanged with shifts and masks, instead of moving
+    bytes through fancy-indexed temporaries.
+    
+    Args:
+        bgra: Writable, C-contiguous BGRA/BGRX pixels, modified in place
+    """
+    if sys.byteorder != 'little' or not bgra.flags.c_contiguous:
+        bgra[..., [0, 2]] = bgra[..., [2, 0]]
+        bgra[..., 3] = 255
+        return
+    
+    # Little endian: a BGRA pixel reads as 0xAARRGGBB
+    pixels = bgra.reshape(-1).view(np.uint32)
+    swapped = (pixels >> 16) & 0xFF
+    swapped |= (pixels & 0xFF) << 16
+    pixels &= 0x0000FF00
+    pixels |= swapped
+    pixels |= 0xFF000000
+
 
 class WindowCapture:
     """
     Cross-platform window capture for displaying application content on LCD.
     
     Supports:
-    - Windows: Uses mss (screenshot library) or pygetwindow + PIL
-    - Linux: Uses python-xlib or scrot
+    - Windows: Uses pygetwindow to find the window and GDI to grab it scaled,
+      falling back to mss (screenshot library) or PIL ImageGrab
+    - Linux: Uses python-xlib to find the window, mss (or XGetImage) to capture it
     
     Use cases:
     - Capture iStripper application for LCD display
@@ -29,7 +65,25 @@ class WindowCapture:
     - Real-time screen capture at configurable FPS
     """
     
-    def __init__(self, window_title: str, target_width: int = 320, target_height: int = 240, fps: int = 30, scale_factor: float = 1.0):
+    # Seconds a window lookup result is reused before it is refreshed
+    WINDOW_CACHE_TTL = 1.0
+    
+    # Smallest visible window area (pixels per side) worth grabbing; a
+    # window that is minimized or almost entirely off-screen is skipped
+    MIN_VISIBLE_SIZE = 8
+    
+    # OpenCV equivalents of the PIL resampling filters
+    _CV2_INTERPOLATION = {
+        Image.Resampling.NEAREST: 'INTER_NEAREST',
+        Image.Resampling.BOX: 'INTER_AREA',
+        Image.Resampling.BILINEAR: 'INTER_LINEAR',
+        Image.Resampling.HAMMING: 'INTER_LINEAR',
+        Image.Resampling.BICUBIC: 'INTER_CUBIC',
+        Image.Resampling.LANCZOS: 'INTER_LANCZOS4',
+    }
+    
+    def __init__(self, window_title: str, target_width: int = 320, target_height: int = 240, fps: int = 30, scale_factor: float = 1.0,
+                 resample: Image.Resampling = Image.Resampling.BILINEAR):
         """
         Initialize window capture.
         
@@ -39,18 +93,56 @@ class WindowCapture:
             target_height: Target height for captured frames  
             fps: Frames per second for capture rate
             scale_factor: Scaling factor for zoom (1.0 = original, <1.0 = zoom out, >1.0 = zoom in)
+            resample: Resampling filter for enlargements and mild (< 2x) downscales;
+                larger downscales always use a box filter
         """
         self.logger = get_service_logger()
         self.window_title = window_title
+        # Case-folded once for case-insensitive title matching on Linux
+        self._title_folded = window_title.casefold()
         self.target_width = target_width
         self.target_height = target_height
         self.fps = fps
         self.frame_interval = 1.0 / fps
         self.scale_factor = scale_factor
+        self._resample = resample
+        self._cv2_interpolation = getattr(cv2, self._CV2_INTERPOLATION.get(resample, 'INTER_LINEAR')) if HAS_OPENCV else None
+        
+        # Opaque black frame at target size, built once and copied when a
+        # padded (zoomed out) frame is needed
+        self._black = np.zeros((target_height, target_width, 4), dtype=np.uint8)
+        self._black[..., 3] = 255
+        
+        # Output buffer reused by every mss capture (see capture_frame)
+        self._rgba_out: Optional[np.ndarray] = None
+        # Window-sized canvas the visible parts of a window partly off screen
+        # are composited on, and the monitor rectangles last drawn onto it
+        self._mss_canvas: Optional[np.ndarray] = None
+        self._mss_canvas_clips: Optional[list] = None
         
         self._is_windows = is_windows()
         self._is_linux = is_linux()
         
+        # Window lookup cache: the matched window handle is kept so geometry
+        # can be re-read cheaply, and the geometry itself is reused until the
+        # cache expires or a capture fails
+        self._cached_window = None
+        self._cached_window_info: Optional[dict] = None
+        self._cache_expiry = 0.0
+        self._geom_refresh_interval = self.WINDOW_CACHE_TTL
+        # Monitor rectangles (left, top, right, bottom) from mss, read lazily
+        self._monitors: Optional[list] = None
+        
+        # Optional background producer (see start()): the most recent frame
+        # is published in _latest, older ones are dropped
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_stop = threading.Event()
+        self._latest_lock = threading.Lock()
+        self._latest: Optional[np.ndarray] = None
+        # mss/GDI grabbers created by the capture thread for itself (their OS
+        # handles belong to the creating thread); see _grabber()
+        self._thread_grabbers = threading.local()
+        
         # Platform-specific capture backend
         self._capture_backend = None
         self._initialize_capture_backend()
@@ -68,7 +160,19 @@ class WindowCapture:
             raise RuntimeError("Window capture not supported on this platform")
     
     def _initialize_windows_backend(self):
-        """Initialize Windows window capture using mss or pygetwindow"""
+        """Initialize Windows window capture using GDI, mss or pygetwindow"""
+        try:
+            # GDI stretches the window area to the output size while copying,
+            # so only output-sized pixels are read back
+            import pygetwindow as gw
+            from thermalright_lcd_control.device_controller.display._gdi_grab import ScaledGrabber
+            self._gdi = ScaledGrabber()
+            self._capture_backend = "gdi"
+            self.logger.info("Using pygetwindow + GDI scaled grab for window capture (Windows)")
+            return
+        except (ImportError, AttributeError, OSError) as e:
+            self.logger.debug(f"GDI scaled grab unavailable: {e}")
+        
         try:
             # Try mss first (fastest, most reliable)
             import mss
@@ -87,13 +191,26 @@ class WindowCapture:
                 raise RuntimeError("Window capture requires 'mss' or 'pygetwindow' package. Install with: pip install mss")
     
     def _initialize_linux_backend(self):
-        """Initialize Linux window capture using python-xlib"""
+        """Initialize Linux window capture using python-xlib, grabbing pixels with mss when available"""
         try:
             import Xlib.display
             import Xlib.X
             self._capture_backend = "xlib"
             self._display = Xlib.display.Display()
-            self.logger.info("Using python-xlib for window capture (Linux)")
+            # EWMH atoms used to list managed windows and read UTF-8 titles
+            self._net_client_list = self._display.intern_atom('_NET_CLIENT_LIST')
+            self._net_wm_name = self._display.intern_atom('_NET_WM_NAME')
+            self._utf8_string = self._display.intern_atom('UTF8_STRING')
+            # ICCCM: set on client (application) windows by the window manager
+            self._wm_state = self._display.intern_atom('WM_STATE')
+            try:
+                # mss grabs through MIT-SHM in-process; python-xlib is then
+                # only used to look up the window
+                import mss
+                self._mss = mss.mss()
+                self.logger.info("Using python-xlib + mss for window capture (Linux)")
+            except ImportError:
+                self.logger.info("Using python-xlib for window capture (Linux)")
         except ImportError:
             self.logger.error("No window capture backend available. Install: pip install python-xlib")
             raise RuntimeError("Window capture on Linux requires 'python-xlib' package. Install with: pip install python-xlib")
@@ -102,15 +219,110 @@ class WindowCapture:
         """
         Find window by title.
         
+        The result is cached for WINDOW_CACHE_TTL seconds. Once expired, the
+        geometry is re-read from the cached window handle (after checking the
+        window still carries the title), and a full window search only
+        happens when no valid handle is cached.
+        
         Returns:
             dict: Window info with 'left', 'top', 'width', 'height', or None if not found
         """
-        if self._capture_backend == "mss":
-            return self._find_window_mss()
-        elif self._capture_backend == "pygetwindow":
-            return self._find_window_pygetwindow()
-        elif self._capture_backend == "xlib":
-            return self._find_window_xlib()
+        now = time.monotonic()
+        if self._cached_window_info is not None and now < self._cache_expiry:
+            return self._cached_window_info
+        
+        window_info = None
+        if self._cached_window is not None and self._window_matches(self._cached_window):
+            window_info = self._get_window_geometry(self._cached_window)
+        
+        if window_info is None:
+            self._cached_window = None
+            if self._capture_backend == "mss":
+                window_info = self._find_window_mss()
+            elif self._capture_backend in ("gdi", "pygetwindow"):
+                window_info = self._find_window_pygetwindow()
+            elif self._capture_backend == "xlib":
+                window_info = self._find_window_xlib()
+        
+        self._cached_window_info = window_info
+        self._cache_expiry = now + self._geom_refresh_interval if window_info else 0.0
+        return window_info
+    
+    def _invalidate_window_cache(self):
+        """
+        Drop the cached geometry so the next find_window() re-reads it.
+        
+        The window handle is kept: find_window() checks it is still valid
+        first, so a window that is merely minimized or off-screen does not
+        trigger a full window search on every frame.
+        """
+        self._cached_window_info = None
+        self._cache_expiry = 0.0
+        # The monitor layout may have changed as well
+        self._monitors = None
+    
+    def _get_window_title(self, window) -> Optional[str]:
+        """Current title of a pygetwindow window (Windows) or Xlib window (Linux)"""
+        if self._capture_backend == "xlib":
+            # Prefer the UTF-8 EWMH title, falling back to legacy WM_NAME
+            prop = window.get_full_property(self._net_wm_name, self._utf8_string)
+            if prop is not None and prop.value:
+                value = prop.value
+                return value.decode('utf-8', 'replace') if isinstance(value, bytes) else str(value)
+            return window.get_wm_name()
+        return window.title
+    
+    def _window_matches(self, window) -> bool:
+        """
+        Check that a cached window still exists and still carries the title.
+        
+        Args:
+            window: pygetwindow window (Windows) or Xlib window (Linux)
+            
+        Returns:
+            bool: False if the window was closed (BadWindow) or renamed
+        """
+        try:
+            title = self._get_window_title(window)
+        except Exception as e:
+            self.logger.debug(f"Cached window '{self.window_title}' no longer available: {e}")
+            return False
+        if not title:
+            return False
+        if self._capture_backend == "xlib":
+            return self._title_folded in title.casefold()
+        return self.window_title in title
+    
+    def _get_window_geometry(self, window) -> Optional[dict]:
+        """
+        Read the current geometry of a previously found window.
+        
+        Args:
+            window: pygetwindow window (Windows) or Xlib window (Linux)
+            
+        Returns:
+            dict: Window info, or None if the window is gone
+        """
+        try:
+            if self._capture_backend == "xlib":
+                geom = window.get_geometry()
+                # Geometry is relative to the parent (often a WM frame), so
+                # translate the origin to root coordinates for screen grabs
+                origin = self._display.screen().root.translate_coords(window, 0, 0)
+                return {
+                    'left': origin.x,
+                    'top': origin.y,
+                    'width': geom.width,
+                    'height': geom.height
+                }
+            return {
+                'left': window.left,
+                'top': window.top,
+                'width': window.width,
+                'height': window.height
+            }
+        except Exception as e:
+            self.logger.debug(f"Cached window '{self.window_title}' no longer available: {e}")
         return None
     
     def _find_window_mss(self) -> Optional[dict]:
@@ -119,13 +331,8 @@ class WindowCapture:
             import pygetwindow as gw
             windows = gw.getWindowsWithTitle(self.window_title)
             if windows:
-                win = windows[0]
-                return {
-                    'left': win.left,
-                    'top': win.top,
-                    'width': win.width,
-                    'height': win.height
-                }
+                self._cached_window = windows[0]
+                return self._get_window_geometry(windows[0])
         except Exception as e:
             self.logger.debug(f"Could not find window '{self.window_title}': {e}")
         return None
@@ -136,13 +343,8 @@ class WindowCapture:
             import pygetwindow as gw
             windows = gw.getWindowsWithTitle(self.window_title)
             if windows:
-                win = windows[0]
-                return {
-                    'left': win.left,
-                    'top': win.top,
-                    'width': win.width,
-                    'height': win.height
-                }
+                self._cached_window = windows[0]
+                return self._get_window_geometry(windows[0])
         except Exception as e:
             self.logger.debug(f"Could not find window '{self.window_title}': {e}")
         return None
@@ -150,41 +352,59 @@ class WindowCapture:
     def _find_window_xlib(self) -> Optional[dict]:
         """Find window using python-xlib (Linux)"""
         try:
-            import Xlib.display
+            import Xlib.X
+            import Xlib.error
             
-            def get_window_geometry(window):
-                """Get window geometry recursively"""
-                try:
-                    geom = window.get_geometry()
-                    return {
-                        'left': geom.x,
-                        'top': geom.y,
-                        'width': geom.width,
-                        'height': geom.height
-                    }
-                except Exception:
-                    return None
+            root = self._display.screen().root
             
-            def search_windows(window, title):
-                """Recursively search for window by title"""
+            # The window manager publishes all managed top-level windows in a
+            # single root property, which avoids walking the whole window tree
+            client_list = root.get_full_property(self._net_client_list, Xlib.X.AnyPropertyType)
+            if client_list is not None:
+                for window_id in client_list.value:
+                    window = self._display.create_resource_object('window', window_id)
+                    try:
+                        window_name = self._get_window_title(window)
+                    except Xlib.error.XError as e:
+                        # Window may have been destroyed since the list was read
+                        self.logger.debug(f"Error accessing window: {e}")
+                        continue
+                    if window_name and self._title_folded in window_name.casefold():
+                        self._cached_window = window
+                        return self._get_window_geometry(window)
+                return None
+            
+            # No EWMH-compliant window manager: breadth-first search for
+            # client windows (those with WM_STATE). Frames and other windows
+            # without it are descended into, clients are never descended.
+            pending = deque([root])
+            unmanaged = []
+            while pending:
+                window = pending.popleft()
                 try:
-                    window_name = window.get_wm_name()
-                    if window_name and self.window_title.lower() in window_name.lower():
-                        return get_window_geometry(window)
-                    
-                    # Search children
-                    children = window.query_tree().children
-                    for child in children:
-                        result = search_windows(child, title)
-                        if result:
-                            return result
-                except Exception as e:
-                    # Window may not be accessible, continue search
+                    if window is not root and window.get_full_property(self._wm_state, Xlib.X.AnyPropertyType) is not None:
+                        window_name = self._get_window_title(window)
+                        if window_name and self._title_folded in window_name.casefold():
+                            self._cached_window = window
+                            return self._get_window_geometry(window)
+                        continue
+                    unmanaged.append(window)
+                    pending.extend(window.query_tree().children)
+                except Xlib.error.XError as e:
+                    # Window destroyed while walking the tree
                     self.logger.debug(f"Error accessing window: {e}")
-                return None
             
-            root = self._display.screen().root
-            return search_windows(root, self.window_title)
+            # Without any window manager no window has WM_STATE: match titles
+            # on the windows visited instead
+            for window in unmanaged[1:]:
+                try:
+                    window_name = self._get_window_title(window)
+                except Xlib.error.XError as e:
+                    self.logger.debug(f"Error accessing window: {e}")
+                    continue
+                if window_name and self._title_folded in window_name.casefold():
+                    self._cached_window = window
+                    return self._get_window_geometry(window)
             
         except Exception as e:
             self.logger.debug(f"Could not find window '{self.window_title}': {e}")
@@ -194,6 +414,10 @@ class WindowCapture:
         """
         Capture a single frame from the window.
         
+        The returned image may share its pixel buffer with the capture
+        backend, which reuses it for the next frame: consume it (or copy()
+        it) before calling capture_frame() again.
+        
         Returns:
             PIL.Image: Captured and resized frame, or None if capture failed
         """
@@ -202,17 +426,77 @@ class WindowCapture:
             self.logger.debug(f"Window '{self.window_title}' not found")
             return None
         
+        frame = None
         try:
-            if self._capture_backend == "mss":
-                return self._capture_frame_mss(window_info)
+            if self._capture_backend == "gdi":
+                frame = self._capture_frame_gdi(window_info)
+            elif self._capture_backend == "mss":
+                frame = self._capture_frame_mss(window_info)
             elif self._capture_backend == "pygetwindow":
-                return self._capture_frame_pygetwindow(window_info)
+                frame = self._capture_frame_pygetwindow(window_info)
             elif self._capture_backend == "xlib":
-                return self._capture_frame_xlib(window_info)
+                frame = self._capture_frame_xlib(window_info)
         except Exception as e:
             self.logger.error(f"Error capturing frame: {e}")
         
-        return None
+        if frame is None:
+            # Window may have moved or closed, look it up again next time
+            self._invalidate_window_cache()
+        return frame
+    
+    @staticmethod
+    def _is_downscale(src_width: int, src_height: int, width: int, height: int) -> bool:
+        """Whether resizing src to (width, height) shrinks the image on both axes"""
+        return max(width / src_width, height / src_height) < 1.0
+    
+    @staticmethod
+    def _is_large_downscale(src_width: int, src_height: int, width: int, height: int) -> bool:
+        """Whether resizing src to (width, height) shrinks both axes by 2x or more"""
+        return src_width >= 2 * width and src_height >= 2 * height
+    
+    def _resize_np(self, arr: np.ndarray, width: int, height: int) -> np.ndarray:
+        """
+        Resize with OpenCV using INTER_AREA for downscales and the configured
+        filter otherwise. 3-channel input is widened to RGBA after the resize.
+        Input that already has the requested size is not resampled.
+        """
+        src_height, src_width = arr.shape[:2]
+        # OpenCV only takes its vectorized resize kernels for contiguous 8-bit data
+        if arr.dtype != np.uint8 or not arr.flags.c_contiguous:
+            arr = np.ascontiguousarray(arr, dtype=np.uint8)
+        if (src_width, src_height) != (width, height):
+            if self._is_downscale(src_width, src_height, width, height):
+                interpolation = cv2.INTER_AREA
+            else:
+                interpolation = self._cv2_interpolation
+            arr = cv2.resize(arr, (width, height), interpolation=interpolation)
+        if arr.shape[2] == 3:
+            arr = cv2.cvtColor(arr, cv2.COLOR_RGB2RGBA)
+        return arr
+    
+    def _resize_pil(self, img: Image.Image, width: int, height: int) -> Image.Image:
+        """
+        Resize with PIL using BOX for downscales of 2x or more and the
+        configured filter otherwise.
+        
+        Large downscales are done in two stages: a fast integer reduce()
+        down to at most 2x the target, then the filtered resize, so the
+        filter kernel never spans many source pixels. An image that already
+        has the requested size is returned as is.
+        """
+        if img.size == (width, height):
+            return img
+        
+        factor = min(img.width // (2 * width), img.height // (2 * height))
+        if factor > 1:
+            img = img.reduce(factor)
+        
+        if self._is_large_downscale(img.width, img.height, width, height):
+            return img.resize((width, height), Image.Resampling.BOX)
+        
+        # RGB is resized as is: widening to RGBA afterwards (in _apply_scaling)
+        # only touches the small output instead of the full capture
+        return img.resize((width, height), self._resample)
     
     def _apply_scaling(self, img: Image.Image) -> Image.Image:
         """
@@ -224,6 +508,9 @@ class WindowCapture:
         Returns:
             Scaled and cropped/padded image
         """
+        if HAS_OPENCV and img.mode in ('RGB', 'RGBA'):
+            return Image.fromarray(self._scale_array(np.asarray(img)))
+        
         # Apply scale factor if not 1.0
         if self.scale_factor != 1.0:
             # Calculate scaled dimensions
@@ -231,7 +518,7 @@ class WindowCapture:
             scaled_height = int(self.target_height * self.scale_factor)
             
             # Resize to scaled dimensions first
-            img = img.resize((scaled_width, scaled_height), Image.Resampling.LANCZOS)
+            img = self._resize_pil(img, scaled_width, scaled_height)
             
             # If scale > 1.0 (zoom in), crop to target size from center
             if self.scale_factor > 1.0:
@@ -242,34 +529,159 @@ class WindowCapture:
                 img = img.crop((left, top, right, bottom))
             # If scale < 1.0 (zoom out), pad with black to target size
             elif self.scale_factor < 1.0:
-                result = Image.new('RGBA', (self.target_width, self.target_height), (0, 0, 0, 255))
+                if img.mode != 'RGBA':
+                    img = img.convert('RGBA')
+                result = self._black.copy()
                 paste_x = (self.target_width - scaled_width) // 2
                 paste_y = (self.target_height - scaled_height) // 2
-                result.paste(img, (paste_x, paste_y))
-                img = result
+                result[paste_y:paste_y + scaled_height, paste_x:paste_x + scaled_width] = np.asarray(img)
+                img = Image.fromarray(result)
         else:
             # No scaling, just resize to fit
-            img = img.resize((self.target_width, self.target_height), Image.Resampling.LANCZOS)
+            img = self._resize_pil(img, self.target_width, self.target_height)
         
         if img.mode != 'RGBA':
             img = img.convert('RGBA')
         
         return img
     
+    def _scale_array(self, arr: np.ndarray) -> np.ndarray:
+        """
+        Apply scaling to a captured array with OpenCV.
+        
+        Args:
+            arr: (H, W, 3) or (H, W, 4) uint8 array
+            
+        Returns:
+            (target_height, target_width, 4) uint8 array, cropped/padded
+            according to scale_factor
+        """
+        if self.scale_factor == 1.0:
+            return self._resize_np(arr, self.target_width, self.target_height)
+        
+        scaled_width = int(self.target_width * self.scale_factor)
+        scaled_height = int(self.target_height * self.scale_factor)
+        arr = self._resize_np(arr, scaled_width, scaled_height)
+        
+        # If scale > 1.0 (zoom in), crop to target size from center
+        if self.scale_factor > 1.0:
+            left = (scaled_width - self.target_width) // 2
+            top = (scaled_height - self.target_height) // 2
+            return np.ascontiguousarray(arr[top:top + self.target_height, left:left + self.target_width])
+        
+        # If scale < 1.0 (zoom out), pad with black to target size
+        result = self._black.copy()
+        paste_x = (self.target_width - scaled_width) // 2
+        paste_y = (self.target_height - scaled_height) // 2
+        result[paste_y:paste_y + scaled_height, paste_x:paste_x + scaled_width] = arr
+        return result
+    
+    def _grabber(self, name: str):
+        """
+        The mss ('_mss') or GDI ('_gdi') grabber for the calling thread.
+        
+        Returns:
+            The capture thread's own grabber on that thread, else the one
+            created with this instance
+        """
+        return getattr(self._thread_grabbers, name, None) or getattr(self, name)
+    
+    def _monitor_bounds(self) -> list:
+        """Rectangles (left, top, right, bottom) of the monitors known to mss"""
+        if self._monitors is None:
+            # monitors[0] is the bounding box of all monitors, the rest are physical ones
+            monitors = self._grabber('_mss').monitors
+            self._monitors = [
+                (m['left'], m['top'], m['left'] + m['width'], m['top'] + m['height'])
+                for m in (monitors[1:] or monitors)
+            ]
+        return self._monitors
+    
     def _capture_frame_mss(self, window_info: dict) -> Optional[Image.Image]:
-        """Capture frame using mss (Windows)"""
-        monitor = {
-            'left': window_info['left'],
-            'top': window_info['top'],
-            'width': window_info['width'],
-            'height': window_info['height']
-        }
-        
-        screenshot = self._mss.grab(monitor)
-        img = Image.frombytes('RGB', screenshot.size, screenshot.bgra, 'raw', 'BGRX')
-        img = self._apply_scaling(img)
+        """Capture frame using mss (Windows, and Linux when installed)"""
+        left, top = window_info['left'], window_info['top']
+        width, height = window_info['width'], window_info['height']
+        right, bottom = left + width, top + height
         
-        return img
+        # Grab the part of the window on each monitor it overlaps
+        clips = []
+        for m_left, m_top, m_right, m_bottom in self._monitor_bounds():
+            c_left, c_top = max(left, m_left), max(top, m_top)
+            c_width = min(right, m_right) - c_left
+            c_height = min(bottom, m_bottom) - c_top
+            if c_width > 0 and c_height > 0:
+                clips.append((c_left, c_top, c_width, c_height))
+        
+        if not any(c_width >= self.MIN_VISIBLE_SIZE and c_height >= self.MIN_VISIBLE_SIZE
+                   for _, _, c_width, c_height in clips):
+            self.logger.debug(f"Window '{self.window_title}' is not visible on any monitor")
+            return None
+        
+        mss_grabber = self._grabber('_mss')
+        if clips == [(left, top, width, height)]:
+            # Entirely on one monitor: view the raw BGRA buffer without copying
+            screenshot = mss_grabber.grab({'left': left, 'top': top, 'width': width, 'height': height})
+            bgra = np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(height, width, 4)
+            return self._frame_from_bgra(bgra)
+        
+        # Put each visible part in place on a black window-sized canvas, so
+        # scaling keeps the window's aspect ratio and position. Parts off
+        # every monitor stay black; the canvas is only cleared when they move
+        canvas = self._mss_canvas
+        if canvas is None or canvas.shape[:2] != (height, width) or clips != self._mss_canvas_clips:
+            if canvas is None or canvas.shape[:2] != (height, width):
+                canvas = self._mss_canvas = np.empty((height, width, 4), dtype=np.uint8)
+            canvas.fill(0)
+            self._mss_canvas_clips = clips
+        for c_left, c_top, c_width, c_height in clips:
+            screenshot = mss_grabber.grab({'left': c_left, 'top': c_top, 'width': c_width, 'height': c_height})
+            x, y = c_left - left, c_top - top
+            canvas[y:y + c_height, x:x + c_width] = np.frombuffer(
+                screenshot.raw, dtype=np.uint8).reshape(c_height, c_width, 4)
+        return self._frame_from_bgra(canvas)
+    
+    def _capture_frame_gdi(self, window_info: dict) -> Optional[Image.Image]:
+        """Capture frame using GDI, scaled to the output size during the copy (Windows)"""
+        if self.scale_factor == 1.0:
+            width, height = self.target_width, self.target_height
+        else:
+            # Grab at the zoomed size; _frame_from_bgra only crops or pads
+            width = int(self.target_width * self.scale_factor)
+            height = int(self.target_height * self.scale_factor)
+        
+        buffer = self._grabber('_gdi').grab(window_info['left'], window_info['top'],
+                                window_info['width'], window_info['height'], width, height)
+        bgra = np.frombuffer(buffer, dtype=np.uint8).reshape(height, width, 4)
+        return self._frame_from_bgra(bgra)
+    
+    def _frame_from_bgra(self, bgra: np.ndarray) -> Image.Image:
+        """
+        Scale a captured BGRA/BGRX pixel array into an opaque RGBA frame.
+        
+        Args:
+            bgra: (H, W, 4) uint8 view of the captured pixels
+            
+        Returns:
+            PIL.Image: Frame at target size
+        """
+        if not HAS_OPENCV:
+            if not bgra.flags.writeable:
+                img = Image.frombuffer('RGB', (bgra.shape[1], bgra.shape[0]), bgra, 'raw', 'BGRX', 0, 1)
+                return self._apply_scaling(img)
+            # Reorder to opaque RGBA in place (the grab buffer is ours) and
+            # hand it to PIL as RGBA, so no later convert('RGBA') is needed
+            _bgra_to_opaque_rgba_inplace(bgra)
+            return self._apply_scaling(Image.fromarray(bgra))
+        
+        # Shrink while still BGRA, then convert only the small result to
+        # opaque RGBA, writing into the persistent output buffer
+        scaled = self._scale_array(bgra)
+        if self._rgba_out is None or self._rgba_out.shape != scaled.shape:
+            self._rgba_out = np.empty(scaled.shape, dtype=np.uint8)
+        rgba = cv2.cvtColor(scaled, cv2.COLOR_BGRA2RGBA, dst=self._rgba_out)
+        rgba[..., 3] = 255
+        
+        return Image.fromarray(rgba)
     
     def _capture_frame_pygetwindow(self, window_info: dict) -> Optional[Image.Image]:
         """Capture frame using ImageGrab (Windows)"""
@@ -289,37 +701,154 @@ class WindowCapture:
     
     def _capture_frame_xlib(self, window_info: dict) -> Optional[Image.Image]:
         """Capture frame using python-xlib (Linux)"""
-        # For Linux, we'll use a simpler approach with scrot or import
+        if getattr(self, '_mss', None) is not None:
+            # In-process shared-memory grab of the window area
+            return self._capture_frame_mss(window_info)
+        
+        # Without mss, read the window's pixels with XGetImage
+        import Xlib.X
+        import Xlib.error
+        
+        window = self._cached_window
+        if window is None:
+            return None
+        
+        left, top = window_info['left'], window_info['top']
+        width, height = window_info['width'], window_info['height']
+        
+        # XGetImage fails (BadMatch) for any part outside the root window:
+        # only request the on-screen part
+        screen = self._display.screen()
+        clip_left, clip_top = max(left, 0), max(top, 0)
+        clip_width = min(left + width, screen.width_in_pixels) - clip_left
+        clip_height = min(top + height, screen.height_in_pixels) - clip_top
+        if clip_width < self.MIN_VISIBLE_SIZE or clip_height < self.MIN_VISIBLE_SIZE:
+            self.logger.debug(f"Window '{self.window_title}' is not visible on screen")
+            return None
+        
+        x, y = clip_left - left, clip_top - top
         try:
-            import subprocess
-            import tempfile
-            import os
-            
-            # Use scrot to capture window
-            with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
-                tmp_path = tmp.name
-            
-            subprocess.run([
-                'scrot',
-                '-u',  # Current window
-                tmp_path
-            ], capture_output=True, timeout=2)
-            
-            if os.path.exists(tmp_path):
-                img = Image.open(tmp_path)
-                os.unlink(tmp_path)
-                
-                img = self._apply_scaling(img)
-                
-                return img
-        except Exception as e:
-            self.logger.debug(f"scrot capture failed: {e}")
+            image = window.get_image(x, y, clip_width, clip_height, Xlib.X.ZPixmap, 0xffffffff)
+        except Xlib.error.XError as e:
+            # Also BadMatch while the window is minimized (unmapped)
+            self.logger.debug(f"Could not read window '{self.window_title}': {e}")
+            return None
+        data = image.data
+        if len(data) != clip_width * clip_height * 4:
+            # Only 24/32-bit visuals (4 bytes per pixel) are supported
+            self.logger.debug(f"Unsupported X image format ({len(data)} bytes for {clip_width}x{clip_height})")
+            return None
         
-        return None
+        bgra = np.frombuffer(data, dtype=np.uint8).reshape(clip_height, clip_width, 4)
+        if (clip_width, clip_height) != (width, height):
+            # Put the visible part back in place on a black window-sized canvas
+            canvas = np.zeros((height, width, 4), dtype=np.uint8)
+            canvas[y:y + clip_height, x:x + clip_width] = bgra
+            bgra = canvas
+        return self._frame_from_bgra(bgra)
+    
+    def set_fps(self, fps: int):
+        """
+        Change the capture rate; a running capture thread paces its next frame with it.
+        
+        Args:
+            fps: Frames per second
+        """
+        self.fps = fps
+        self.frame_interval = 1.0 / fps
+    
+    def set_scale_factor(self, scale_factor: float):
+        """
+        Change the zoom from the next frame on, keeping the capture backend open.
+        
+        Args:
+            scale_factor: Scaling factor for zoom (see __init__)
+        """
+        self.scale_factor = scale_factor
+    
+    def start(self):
+        """Start capturing on a background thread at the configured FPS"""
+        if self._capture_thread is not None:
+            if not self._capture_stop.is_set():
+                return
+            # A previous thread is still finishing its last capture
+            self._capture_thread.join()
+            self._capture_thread = None
+        self._capture_stop.clear()
+        self._capture_thread = threading.Thread(target=self._capture_loop, name="window-capture", daemon=True)
+        self._capture_thread.start()
+        self.logger.debug(f"Capture thread started for '{self.window_title}'")
+    
+    def stop(self):
+        """Stop the background capture thread"""
+        self._capture_stop.set()
+        if self._capture_thread is not None:
+            self._capture_thread.join(timeout=1.0)
+            if self._capture_thread.is_alive():
+                # Still inside a capture: it exits (closing its own grabbers)
+                # when that returns; keep the reference until then
+                self.logger.debug("Capture thread still finishing its last frame")
+            else:
+                self._capture_thread = None
+    
+    def get_latest(self) -> Optional[np.ndarray]:
+        """
+        Get the most recent frame captured by the background thread.
+        
+        Never blocks on a capture; frames the consumer did not pick up in
+        time are dropped.
+        
+        Returns:
+            np.ndarray: (H, W, 4) uint8 RGBA frame, or None if the window is unavailable
+        """
+        with self._latest_lock:
+            return self._latest
+    
+    def _capture_loop(self):
+        """Capture frames paced to frame_interval until stop() is called"""
+        # mss keeps per-thread OS handles and GDI device contexts belong to
+        # their creating thread: this thread creates and closes its own,
+        # leaving those of the thread that built the instance untouched
+        grabbers = self._thread_grabbers
+        if getattr(self, '_mss', None) is not None:
+            import mss
+            grabbers._mss = mss.mss()
+        if getattr(self, '_gdi', None) is not None:
+            from thermalright_lcd_control.device_controller.display._gdi_grab import ScaledGrabber
+            grabbers._gdi = ScaledGrabber()
+        
+        try:
+            next_capture = time.monotonic()
+            while not self._capture_stop.is_set():
+                frame = self.capture_frame()
+                # Copy out of the reused output buffer before publishing
+                latest = np.array(frame) if frame is not None else None
+                with self._latest_lock:
+                    self._latest = latest
+                
+                next_capture += self.frame_interval
+                delay = next_capture - time.monotonic()
+                if delay > 0:
+                    self._capture_stop.wait(delay)
+                else:
+                    # Capture is slower than the frame rate: don't try to catch up
+                    next_capture = time.monotonic()
+        finally:
+            for name in ('_mss', '_gdi'):
+                grabber = getattr(grabbers, name, None)
+                if grabber is not None:
+                    grabber.close()
+                    delattr(grabbers, name)
     
     def cleanup(self):
         """Clean up resources"""
-        if hasattr(self, '_mss'):
+        self.stop()
+        
+        # Only the grabbers created with the instance: a capture thread still
+        # running closes its own when it exits
+        if getattr(self, '_mss', None) is not None:
             self._mss.close()
+        if getattr(self, '_gdi', None) is not None:
+            self._gdi.close()
         
         self.logger.debug("Window capture cleaned up")
@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Windows-only graphics adapter enumeration built on DXGI.
+
+Listing adapters through WMI (Win32_VideoController) starts a COM server
+query that can take seconds on machines with several adapters. DXGI
+answers from the graphics stack in-process within milliseconds, and
+reports the PCI vendor/device ids and dedicated video memory directly.
+
+enumerate_adapters() walks IDXGIFactory1::EnumAdapters1 through the COM
+vtables with ctypes, so no COM binding package is needed.
+"""
+
+import ctypes
+import uuid
+from ctypes import wintypes
+
+DXGI_ERROR_NOT_FOUND = 0x887A0002
+DXGI_ADAPTER_FLAG_SOFTWARE = 2
+
+# Vtable slots: IUnknown (3) + IDXGIObject (4) + IDXGIFactory (5) + EnumAdapters1
+_IUNKNOWN_RELEASE = 2
+_IDXGIFACTORY1_ENUMADAPTERS1 = 12
+# IUnknown (3) + IDXGIObject (4) + IDXGIAdapter (3) + GetDesc1
+_IDXGIADAPTER1_GETDESC1 = 10
+
+
+class GUID(ctypes.Structure):
+    _fields_ = [
+        ('Data1', wintypes.DWORD),
+        ('Data2', wintypes.WORD),
+        ('Data3', wintypes.WORD),
+        ('Data4', ctypes.c_ubyte * 8),
+    ]
+
+
+class LUID(ctypes.Structure):
+    _fields_ = [('LowPart', wintypes.DWORD), ('HighPart', wintypes.LONG)]
+
+
+class DXGI_ADAPTER_DESC1(ctypes.Structure):
+    _fields_ = [
+        ('Description', wintypes.WCHAR * 128),
+        ('VendorId', wintypes.UINT),
+        ('DeviceId', wintypes.UINT),
+        ('SubSysId', wintypes.UINT),
+        ('Revision', wintypes.UINT),
+        ('DedicatedVideoMemory', ctypes.c_size_t),
+        ('DedicatedSystemMemory', ctypes.c_size_t),
+        ('SharedSystemMemory', ctypes.c_size_t),
+        ('AdapterLuid', LUID),
+        ('Flags', wintypes.UINT),
+    ]
+
+
+IID_IDXGIFactory1 = GUID.from_buffer_copy(uuid.UUID('770aae78-f26f-4dba-a829-253c83d1b387').bytes_le)
+
+_dxgi = ctypes.WinDLL('dxgi')
+
+_CreateDXGIFactory1 = _dxgi.CreateDXGIFactory1
+_CreateDXGIFactory1.argtypes = [ctypes.POINTER(GUID), ctypes.POINTER(ctypes.c_void_p)]
+_CreateDXGIFactory1.restype = ctypes.c_long
+
+
+class AdapterDesc:
+    """Description of one DXGI adapter"""
+
+    __slots__ = ('description', 'vendor_id', 'device_id', 'dedicated_video_memory', 'flags', 'luid')
+
+    def __init__(self, description: str, vendor_id: int, device_id: int, dedicated_video_memory: int, flags: int,
+                 luid: int):
+        self.description = description
+        self.vendor_id = vendor_id
+        self.device_id = device_id
+        self.dedicated_video_memory = dedicated_video_memory
+        self.flags = flags
+        # Locally unique adapter id (HighPart << 32 | LowPart), as used in
+        # GPU performance counter instance names
+        self.luid = luid
+
+    @property
+    def is_software(self) -> bool:
+        """Whether this is a software rasterizer (e.g. Microsoft Basic Render Driver)"""
+        return bool(self.flags & DXGI_ADAPTER_FLAG_SOFTWARE)
+
+    def __repr__(self):
+        return f"<AdapterDesc '{self.description}' {self.vendor_id:04x}:{self.device_id:04x}>"
+
+
+def _com_method(obj: ctypes.c_void_p, index: int, *argtypes):
+    """Bind the vtable entry at index of a COM object, returning an HRESULT-returning callable"""
+    vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    return ctypes.WINFUNCTYPE(ctypes.c_long, ctypes.c_void_p, *argtypes)(vtable[index])
+
+
+def _release(obj: ctypes.c_void_p):
+    vtable = ctypes.cast(obj, ctypes.POINTER(ctypes.POINTER(ctypes.c_void_p))).contents
+    ctypes.WINFUNCTYPE(wintypes.ULONG, ctypes.c_void_p)(vtable[_IUNKNOWN_RELEASE])(obj)
+
+
+def _check(hr: int, what: str):
+    if hr < 0:
+        raise OSError(f"{what} failed: HRESULT 0x{hr & 0xFFFFFFFF:08X}")
+
+
+def enumerate_adapters() -> list:
+    """
+    List the graphics adapters known to DXGI.
+
+    Returns:
+        List of AdapterDesc, in DXGI order (the adapter driving the primary output first)
+
+    Raises:
+        OSError: If the DXGI factory cannot be created or enumeration fails
+    """
+    factory = ctypes.c_void_p()
+    _check(_CreateDXGIFactory1(ctypes.byref(IID_IDXGIFactory1), ctypes.byref(factory)), "CreateDXGIFactory1")
+
+    adapters = []
+    try:
+        enum_adapters1 = _com_method(factory, _IDXGIFACTORY1_ENUMADAPTERS1,
+                                     wintypes.UINT, ctypes.POINTER(ctypes.c_void_p))
+        index = 0
+        while True:
+            adapter = ctypes.c_void_p()
+            hr = enum_adapters1(factory, index, ctypes.byref(adapter))
+            if hr & 0xFFFFFFFF == DXGI_ERROR_NOT_FOUND:
+                break
+            _check(hr, "IDXGIFactory1::EnumAdapters1")
+
+            try:
+                desc = DXGI_ADAPTER_DESC1()
+                get_desc1 = _com_method(adapter, _IDXGIADAPTER1_GETDESC1, ctypes.POINTER(DXGI_ADAPTER_DESC1))
+                _check(get_desc1(adapter, ctypes.byref(desc)), "IDXGIAdapter1::GetDesc1")
+                luid = ((desc.AdapterLuid.HighPart & 0xFFFFFFFF) << 32) | desc.AdapterLuid.LowPart
+                adapters.append(AdapterDesc(desc.Description, desc.VendorId, desc.DeviceId,
+                                            desc.DedicatedVideoMemory, desc.Flags, luid))
+            finally:
+                _release(adapter)
+            index += 1
+    finally:
+        _release(factory)
+
+    return adapters
@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Cheap GPU presence probes shared by GPUDetector and GpuMetrics.
+
+DRM cards are found by listing /sys/class/drm and reading the PCI ids of
+each card with raw os calls; NVIDIA GPUs are listed through nvidia-smi.
+"""
+
+import os
+import subprocess
+from typing import List, Optional
+
+DRM_CLASS_DIR = '/sys/class/drm'
+AMD_VENDOR_ID = '0x1002'
+INTEL_VENDOR_ID = '0x8086'
+
+# Seconds to wait for nvidia-smi during detection (NVML is used when installed)
+NVIDIA_SMI_DETECT_TIMEOUT = 2.0
+
+
+def read_sysfs(path: str, size: int = 64) -> Optional[str]:
+    """Read a small sysfs attribute with raw os calls, or None if unreadable"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, size).decode('ascii', 'replace').strip()
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def drm_card_devices() -> List[str]:
+    """PCI device directories of /sys/class/drm/cardN entries (connectors excluded)"""
+    try:
+        with os.scandir(DRM_CLASS_DIR) as entries:
+            cards = [entry.name for entry in entries
+                     if entry.name.startswith('card') and entry.name[4:].isdigit()]
+    except OSError:
+        return []
+    cards.sort(key=lambda name: int(name[4:]))
+    return [f"{DRM_CLASS_DIR}/{name}/device" for name in cards]
+
+
+def nvidia_smi_names(timeout: float = NVIDIA_SMI_DETECT_TIMEOUT) -> List[str]:
+    """
+    Names of the GPUs listed by nvidia-smi, in index order.
+
+    Args:
+        timeout: Seconds to wait for nvidia-smi
+
+    Returns:
+        GPU names, empty if nvidia-smi reports an error
+
+    Raises:
+        OSError: If nvidia-smi is not installed
+        subprocess.TimeoutExpired: If it does not answer within timeout
+    """
+    result = subprocess.run(
+        ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
+        capture_output=True,
+        text=True,
+        timeout=timeout
+    )
+    if result.returncode != 0:
+        return []
+    return [name.strip() for name in result.stdout.splitlines() if name.strip()]
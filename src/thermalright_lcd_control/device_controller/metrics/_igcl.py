@@ -0,0 +1,301 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Windows-only Intel GPU telemetry through the Intel Graphics Control Library.
+
+OpenHardwareMonitor does not expose Intel Arc sensors, so the WMI sensor
+queries come back empty on those cards. IGCL (ControlLib.dll, installed
+with the Intel graphics driver) reads temperature and clocks from the
+driver in-process, through Level Zero.
+
+IntelGPUBackendIGCL resolves the device, sensor and frequency domain
+handles once; each reading is then a single library call.
+"""
+
+import atexit
+import ctypes
+import functools
+import weakref
+from typing import Optional
+
+# CTL_MAKE_VERSION(CTL_IMPL_MAJOR_VERSION, CTL_IMPL_MINOR_VERSION)
+CTL_IMPL_VERSION = (1 << 16) | 1
+CTL_INIT_FLAG_USE_LEVEL_ZERO = 1
+CTL_RESULT_SUCCESS = 0
+
+# ctl_temp_sensors_t / ctl_freq_domain_t
+CTL_TEMP_SENSORS_GPU = 1
+CTL_FREQ_DOMAIN_GPU = 0
+
+CTL_MAX_DEVICE_NAME_LEN = 100
+CTL_MAX_RESERVED_SIZE = 112
+
+
+class ctl_application_id_t(ctypes.Structure):
+    _fields_ = [
+        ('Data1', ctypes.c_uint32),
+        ('Data2', ctypes.c_uint16),
+        ('Data3', ctypes.c_uint16),
+        ('Data4', ctypes.c_uint8 * 8),
+    ]
+
+
+class ctl_init_args_t(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_uint32),
+        ('Version', ctypes.c_uint8),
+        ('AppVersion', ctypes.c_uint32),
+        ('flags', ctypes.c_uint32),
+        ('SupportedVersion', ctypes.c_uint32),
+        ('ApplicationUID', ctl_application_id_t),
+    ]
+
+
+class ctl_firmware_version_t(ctypes.Structure):
+    _fields_ = [
+        ('major_version', ctypes.c_uint64),
+        ('minor_version', ctypes.c_uint64),
+        ('build_number', ctypes.c_uint64),
+    ]
+
+
+class ctl_adapter_bdf_t(ctypes.Structure):
+    _fields_ = [
+        ('bus', ctypes.c_uint8),
+        ('device', ctypes.c_uint8),
+        ('function', ctypes.c_uint8),
+    ]
+
+
+class ctl_device_adapter_properties_t(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_uint32),
+        ('Version', ctypes.c_uint8),
+        # On Windows the driver writes the adapter LUID here
+        ('pDeviceID', ctypes.c_void_p),
+        ('device_id_size', ctypes.c_uint32),
+        ('device_type', ctypes.c_uint32),
+        ('supported_subfunction_flags', ctypes.c_uint32),
+        ('driver_version', ctypes.c_uint64),
+        ('firmware_version', ctl_firmware_version_t),
+        ('pci_vendor_id', ctypes.c_uint32),
+        ('pci_device_id', ctypes.c_uint32),
+        ('rev_id', ctypes.c_uint32),
+        ('num_eus_per_sub_slice', ctypes.c_uint32),
+        ('num_sub_slices_per_slice', ctypes.c_uint32),
+        ('num_slices', ctypes.c_uint32),
+        ('name', ctypes.c_char * CTL_MAX_DEVICE_NAME_LEN),
+        ('graphics_adapter_properties', ctypes.c_uint32),
+        ('Frequency', ctypes.c_uint32),
+        ('pci_subsys_id', ctypes.c_uint16),
+        ('pci_subsys_vendor_id', ctypes.c_uint16),
+        ('adapter_bdf', ctl_adapter_bdf_t),
+        ('reserved', ctypes.c_char * CTL_MAX_RESERVED_SIZE),
+    ]
+
+
+class LUID(ctypes.Structure):
+    _fields_ = [
+        ('LowPart', ctypes.c_uint32),
+        ('HighPart', ctypes.c_int32),
+    ]
+
+
+class ctl_temp_properties_t(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_uint32),
+        ('Version', ctypes.c_uint8),
+        ('type', ctypes.c_uint32),
+        ('maxTemperature', ctypes.c_double),
+    ]
+
+
+class ctl_freq_properties_t(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_uint32),
+        ('Version', ctypes.c_uint8),
+        ('type', ctypes.c_uint32),
+        ('canControl', ctypes.c_bool),
+        ('min', ctypes.c_double),
+        ('max', ctypes.c_double),
+    ]
+
+
+class ctl_freq_state_t(ctypes.Structure):
+    _fields_ = [
+        ('Size', ctypes.c_uint32),
+        ('Version', ctypes.c_uint8),
+        ('currentVoltage', ctypes.c_double),
+        ('request', ctypes.c_double),
+        ('tdp', ctypes.c_double),
+        ('efficient', ctypes.c_double),
+        ('actual', ctypes.c_double),
+        ('throttleReasons', ctypes.c_uint32),
+    ]
+
+
+def _sized(struct_type):
+    """New IGCL struct with its Size field filled in, as the library requires"""
+    struct = struct_type()
+    struct.Size = ctypes.sizeof(struct_type)
+    return struct
+
+
+def _close_at_exit(close_ref: weakref.WeakMethod):
+    """atexit hook calling an IntelGPUBackendIGCL's close() if it is still alive"""
+    close = close_ref()
+    if close is not None:
+        close()
+
+
+class IntelGPUBackendIGCL:
+    """
+    Intel GPU temperature and clock readings through IGCL.
+
+    Raises OSError from the constructor if ControlLib.dll is missing, fails
+    to initialize, or reports no Intel device.
+    """
+
+    def __init__(self, luid: Optional[int] = None):
+        """
+        Args:
+            luid: Adapter LUID of the GPU to read (as reported by DXGI);
+                the first IGCL device is used if None or not found
+        """
+        self._api = None
+        self._atexit_hook = None
+        self._lib = ctypes.CDLL('ControlLib.dll')
+        self._bind()
+
+        args = _sized(ctl_init_args_t)
+        args.AppVersion = CTL_IMPL_VERSION
+        args.flags = CTL_INIT_FLAG_USE_LEVEL_ZERO
+        api = ctypes.c_void_p()
+        self._check(self._lib.ctlInit(ctypes.byref(args), ctypes.byref(api)), "ctlInit")
+        self._api = api
+        self._atexit_hook = functools.partial(_close_at_exit, weakref.WeakMethod(self.close))
+        atexit.register(self._atexit_hook)
+
+        devices = self._enumerate(self._lib.ctlEnumerateDevices, self._api, "ctlEnumerateDevices")
+        if not devices:
+            self.close()
+            raise OSError("IGCL reports no Intel graphics device")
+        device = self._select_device(devices, luid)
+
+        # GPU die sensors and the GPU (not memory) frequency domain
+        self._temp_sensors = []
+        for sensor in self._enumerate(self._lib.ctlEnumTemperatureSensors, device, "ctlEnumTemperatureSensors"):
+            props = _sized(ctl_temp_properties_t)
+            if (self._lib.ctlTemperatureGetProperties(sensor, ctypes.byref(props)) == CTL_RESULT_SUCCESS
+                    and props.type == CTL_TEMP_SENSORS_GPU):
+                self._temp_sensors.append(sensor)
+
+        self._freq_domain = None
+        for domain in self._enumerate(self._lib.ctlEnumFrequencyDomains, device, "ctlEnumFrequencyDomains"):
+            props = _sized(ctl_freq_properties_t)
+            if (self._lib.ctlFrequencyGetProperties(domain, ctypes.byref(props)) == CTL_RESULT_SUCCESS
+                    and props.type == CTL_FREQ_DOMAIN_GPU):
+                self._freq_domain = domain
+                break
+
+    def _bind(self):
+        """Declare the signatures of the IGCL functions used here"""
+        handle_p = ctypes.POINTER(ctypes.c_void_p)
+        count_p = ctypes.POINTER(ctypes.c_uint32)
+        signatures = {
+            'ctlInit': [ctypes.POINTER(ctl_init_args_t), handle_p],
+            'ctlClose': [ctypes.c_void_p],
+            'ctlEnumerateDevices': [ctypes.c_void_p, count_p, handle_p],
+            'ctlGetDeviceProperties': [ctypes.c_void_p, ctypes.POINTER(ctl_device_adapter_properties_t)],
+            'ctlEnumTemperatureSensors': [ctypes.c_void_p, count_p, handle_p],
+            'ctlTemperatureGetProperties': [ctypes.c_void_p, ctypes.POINTER(ctl_temp_properties_t)],
+            'ctlTemperatureGetState': [ctypes.c_void_p, ctypes.POINTER(ctypes.c_double)],
+            'ctlEnumFrequencyDomains': [ctypes.c_void_p, count_p, handle_p],
+            'ctlFrequencyGetProperties': [ctypes.c_void_p, ctypes.POINTER(ctl_freq_properties_t)],
+            'ctlFrequencyGetState': [ctypes.c_void_p, ctypes.POINTER(ctl_freq_state_t)],
+        }
+        for name, argtypes in signatures.items():
+            function = getattr(self._lib, name)
+            function.argtypes = argtypes
+            function.restype = ctypes.c_uint32
+
+    @staticmethod
+    def _check(result: int, what: str):
+        if result != CTL_RESULT_SUCCESS:
+            raise OSError(f"{what} failed: ctl_result 0x{result:08X}")
+
+    def _enumerate(self, function, parent, what: str) -> list:
+        """Run an IGCL two-call enumeration (count, then handles)"""
+        count = ctypes.c_uint32(0)
+        self._check(function(parent, ctypes.byref(count), None), what)
+        if not count.value:
+            return []
+        handles = (ctypes.c_void_p * count.value)()
+        self._check(function(parent, ctypes.byref(count), handles), what)
+        return [ctypes.c_void_p(handle) for handle in handles[:count.value]]
+
+    def _device_luid(self, device) -> Optional[int]:
+        """Adapter LUID of an IGCL device, or None if the driver does not report it"""
+        luid = LUID()
+        props = _sized(ctl_device_adapter_properties_t)
+        props.pDeviceID = ctypes.cast(ctypes.pointer(luid), ctypes.c_void_p)
+        props.device_id_size = ctypes.sizeof(LUID)
+        if self._lib.ctlGetDeviceProperties(device, ctypes.byref(props)) != CTL_RESULT_SUCCESS:
+            return None
+        return ((luid.HighPart & 0xFFFFFFFF) << 32) | luid.LowPart
+
+    def _select_device(self, devices: list, luid: Optional[int]):
+        """
+        Pick the IGCL device matching a DXGI adapter LUID.
+
+        Args:
+            devices: Device handles from ctlEnumerateDevices
+            luid: Wanted adapter LUID, or None
+
+        Returns:
+            The matching device handle, else the first one
+        """
+        if luid is not None:
+            for device in devices:
+                if self._device_luid(device) == luid:
+                    return device
+        return devices[0]
+
+    def get_temperature(self) -> Optional[float]:
+        """
+        Hottest GPU temperature sensor.
+
+        Returns:
+            Temperature in Celsius, or None if no GPU sensor can be read
+        """
+        hottest = None
+        value = ctypes.c_double()
+        for sensor in self._temp_sensors:
+            if self._lib.ctlTemperatureGetState(sensor, ctypes.byref(value)) == CTL_RESULT_SUCCESS:
+                hottest = value.value if hottest is None else max(hottest, value.value)
+        return hottest
+
+    def get_frequency(self) -> Optional[float]:
+        """
+        Actual GPU clock.
+
+        Returns:
+            Frequency in MHz, or None if unavailable
+        """
+        if self._freq_domain is None:
+            return None
+        state = _sized(ctl_freq_state_t)
+        if self._lib.ctlFrequencyGetState(self._freq_domain, ctypes.byref(state)) != CTL_RESULT_SUCCESS:
+            return None
+        # Negative values mean the driver cannot report the clock
+        return state.actual if state.actual >= 0 else None
+
+    def close(self):
+        """Release the IGCL API handle"""
+        if self._api is not None:
+            self._lib.ctlClose(self._api)
+            self._api = None
+        if self._atexit_hook is not None:
+            atexit.unregister(self._atexit_hook)
+            self._atexit_hook = None
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright © 2025 Rejeb Ben Rejeb
+
+"""
+Windows-only performance counter reads through PDH.
+
+The Win32_PerfFormattedData_* WMI classes wrap these same counters behind
+a COM round-trip and return every instance as a full object. Querying PDH
+directly keeps one open query whose samples are refreshed in-process.
+
+PdhCounterArray reads a wildcard counter path as {instance: value}.
+"""
+
+import ctypes
+from ctypes import wintypes
+
+ERROR_SUCCESS = 0
+PDH_MORE_DATA = 0x800007D2
+PDH_FMT_DOUBLE = 0x00000200
+# Don't clamp values at 100 (engines are summed by the caller)
+PDH_FMT_NOCAP100 = 0x00008000
+# CStatus values of usable samples
+PDH_CSTATUS_VALID_DATA = 0x0
+PDH_CSTATUS_NEW_DATA = 0x1
+
+
+class PDH_FMT_COUNTERVALUE(ctypes.Structure):
+    class _Value(ctypes.Union):
+        _fields_ = [
+            ('longValue', wintypes.LONG),
+            ('doubleValue', ctypes.c_double),
+            ('largeValue', ctypes.c_longlong),
+            ('AnsiStringValue', wintypes.LPCSTR),
+            ('WideStringValue', wintypes.LPCWSTR),
+        ]
+
+    _anonymous_ = ('value',)
+    _fields_ = [('CStatus', wintypes.DWORD), ('value', _Value)]
+
+
+class PDH_FMT_COUNTERVALUE_ITEM_W(ctypes.Structure):
+    _fields_ = [('szName', wintypes.LPWSTR), ('FmtValue', PDH_FMT_COUNTERVALUE)]
+
+
+_pdh = ctypes.WinDLL('pdh')
+
+_PdhOpenQueryW = _pdh.PdhOpenQueryW
+_PdhOpenQueryW.argtypes = [wintypes.LPCWSTR, ctypes.c_size_t, ctypes.POINTER(wintypes.HANDLE)]
+_PdhOpenQueryW.restype = wintypes.DWORD
+
+_PdhAddEnglishCounterW = _pdh.PdhAddEnglishCounterW
+_PdhAddEnglishCounterW.argtypes = [wintypes.HANDLE, wintypes.LPCWSTR, ctypes.c_size_t, ctypes.POINTER(wintypes.HANDLE)]
+_PdhAddEnglishCounterW.restype = wintypes.DWORD
+
+_PdhCollectQueryData = _pdh.PdhCollectQueryData
+_PdhCollectQueryData.argtypes = [wintypes.HANDLE]
+_PdhCollectQueryData.restype = wintypes.DWORD
+
+_PdhGetFormattedCounterArrayW = _pdh.PdhGetFormattedCounterArrayW
+_PdhGetFormattedCounterArrayW.argtypes = [
+    wintypes.HANDLE, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+    ctypes.POINTER(wintypes.DWORD), ctypes.c_void_p
+]
+_PdhGetFormattedCounterArrayW.restype = wintypes.DWORD
+
+_PdhCloseQuery = _pdh.PdhCloseQuery
+_PdhCloseQuery.argtypes = [wintypes.HANDLE]
+_PdhCloseQuery.restype = wintypes.DWORD
+
+
+def _check(status: int, what: str):
+    if status != ERROR_SUCCESS:
+        raise OSError(f"{what} failed: PDH status 0x{status:08X}")
+
+
+class PdhCounterArray:
+    """
+    Open PDH query on one (wildcard) counter path.
+
+    Rate counters need two samples: the constructor takes the first one,
+    and every read() takes one more and reports the values over the
+    interval since the previous read.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: English counter path, e.g. "\\\\GPU Engine(*engtype_3D)\\\\Utilization Percentage"
+
+        Raises:
+            OSError: If the query cannot be opened or the counter added
+        """
+        self.path = path
+        self._query = wintypes.HANDLE()
+        _check(_PdhOpenQueryW(None, 0, ctypes.byref(self._query)), "PdhOpenQuery")
+        try:
+            self._counter = wintypes.HANDLE()
+            _check(_PdhAddEnglishCounterW(self._query, path, 0, ctypes.byref(self._counter)), "PdhAddEnglishCounter")
+            _check(_PdhCollectQueryData(self._query), "PdhCollectQueryData")
+        except OSError:
+            self.close()
+            raise
+        self._buffer = ctypes.create_string_buffer(0)
+
+    def read(self) -> dict:
+        """
+        Sample the counter.
+
+        Returns:
+            {instance name: value} for every instance with valid data
+
+        Raises:
+            OSError: If sampling fails
+        """
+        _check(_PdhCollectQueryData(self._query), "PdhCollectQueryData")
+
+        size = wintypes.DWORD(ctypes.sizeof(self._buffer))
+        count = wintypes.DWORD(0)
+        fmt = PDH_FMT_DOUBLE | PDH_FMT_NOCAP100
+        status = _PdhGetFormattedCounterArrayW(self._counter, fmt, ctypes.byref(size), ctypes.byref(count), self._buffer)
+        if status == PDH_MORE_DATA:
+            # The item array and its instance names share the buffer; it only
+            # grows, so steady-state reads reuse it
+            self._buffer = ctypes.create_string_buffer(size.value)
+            status = _PdhGetFormattedCounterArrayW(self._counter, fmt, ctypes.byref(size), ctypes.byref(count), self._buffer)
+        _check(status, "PdhGetFormattedCounterArray")
+
+        items = ctypes.cast(self._buffer, ctypes.POINTER(PDH_FMT_COUNTERVALUE_ITEM_W))
+        values = {}
+        for i in range(count.value):
+            item = items[i]
+            if item.FmtValue.CStatus in (PDH_CSTATUS_VALID_DATA, PDH_CSTATUS_NEW_DATA):
+                values[item.szName] = item.FmtValue.doubleValue
+        return values
+
+    def close(self):
+        """Close the query"""
+        if self._query:
+            _PdhCloseQuery(self._query)
+            self._query = wintypes.HANDLE()
+
+    def __del__(self):
+        self.close()
@@ -13,8 +13,11 @@ Note: Comprehensive AMD metrics require additional SDKs or tools.
 This implementation provides basic metrics that work out-of-the-box.
 """
 
+import functools
+import re
 import subprocess
-from typing import Optional
+import time
+from typing import List, Optional, Tuple
 
 from thermalright_lcd_control.common.logging_config import get_service_logger
 
@@ -24,15 +27,44 @@ try:
 except ImportError:
     HAS_WMI = False
 
+# Video controller names that belong to AMD (ATI only as a whole word).
+# Case-sensitive on purpose: a case-insensitive 'ati' would match e.g. "Corporation"
+AMD_GPU_NAME_RE = re.compile(r'AMD|Radeon|\bATI\b')
+# Sensor names reported by hardware monitors for AMD GPUs
+_AMD_SENSOR_NAME_RE = re.compile(r'AMD|Radeon')
+
 
 class AMDGPUMetricsWindows:
     """AMD GPU metrics for Windows using WMI"""
     
+    # Seconds a sensor snapshot is reused before WMI is queried again
+    SENSORS_TTL = 1.0
+    # 3D engine utilization, filtered server-side to the rows we read
+    GPU_ENGINE_3D_QUERY = (
+        "SELECT UtilizationPercentage FROM Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine "
+        "WHERE Name LIKE '%engtype_3D%'"
+    )
+    
     def __init__(self):
         self.logger = get_service_logger()
         self.wmi_connection = None
         self.gpu_name = "AMD GPU"
         
+        # Each WMI query is a COM round-trip: sensors are read at most once
+        # per SENSORS_TTL, and video controllers (static hardware) once
+        self._sensors_cache: List[Tuple[str, str, float]] = []
+        self._sensors_cache_ts = 0.0
+        self._sensors_ttl = self.SENSORS_TTL
+        self._has_sensors = False
+        self._cached_controllers: List[Tuple[str, Optional[int]]] = []
+        self._gpu_engine_class = None
+        
+        # Latest readings, filled in one pass over the sensor snapshot
+        self._parsed_sensors: Optional[List[Tuple[str, str, float]]] = None
+        self._last_temp: Optional[float] = None
+        self._last_usage: Optional[float] = None
+        self._last_freq: Optional[float] = None
+        
         if HAS_WMI:
             try:
                 self.wmi_connection = wmi.WMI(namespace="root\\OpenHardwareMonitor")
@@ -45,22 +77,90 @@ class AMDGPUMetricsWindows:
                     self.logger.error(f"Failed to initialize WMI: {e}")
                     self.wmi_connection = None
         
+        if self.wmi_connection:
+            self._has_sensors = hasattr(self.wmi_connection, 'Sensor')
+            self._cache_controllers()
+            self._gpu_engine_class = self._resolve_wmi_class(
+                'Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine')
+        
         self._detect_amd_gpu()
     
+    def _resolve_wmi_class(self, class_name: str):
+        """
+        Look up a WMI class once.
+        
+        Args:
+            class_name: WMI class name
+            
+        Returns:
+            The WMI class, or None if the namespace does not provide it
+        """
+        try:
+            return getattr(self.wmi_connection, class_name)
+        except Exception:
+            self.logger.debug(f"WMI class {class_name} not available")
+            return None
+    
+    def _cache_controllers(self):
+        """Read AMD video controllers (name, AdapterRAM) once from Win32_VideoController"""
+        try:
+            for gpu in self.wmi_connection.Win32_VideoController():
+                if AMD_GPU_NAME_RE.search(gpu.Name):
+                    self._cached_controllers.append((gpu.Name, getattr(gpu, 'AdapterRAM', None)))
+        except Exception as e:
+            self.logger.debug(f"Error reading video controllers: {e}")
+    
+    def _get_sensors(self) -> List[Tuple[str, str, float]]:
+        """
+        Get OpenHardwareMonitor sensors as (name, type, value) tuples.
+        
+        Returns:
+            Sensor snapshot, refreshed at most once per SENSORS_TTL seconds
+        """
+        if not self._has_sensors:
+            return []
+        
+        now = time.monotonic()
+        if now - self._sensors_cache_ts >= self._sensors_ttl:
+            self._sensors_cache = [
+                (sensor.Name, sensor.SensorType, sensor.Value)
+                for sensor in self.wmi_connection.Sensor()
+            ]
+            self._sensors_cache_ts = now
+        return self._sensors_cache
+    
+    def refresh(self):
+        """
+        Read temperature, load and clock from the sensor snapshot in one pass.
+        
+        Cheap to call repeatedly: the snapshot is only re-parsed after it was
+        re-read from WMI (see _get_sensors).
+        """
+        sensors = self._get_sensors()
+        if sensors is self._parsed_sensors:
+            return
+        self._parsed_sensors = sensors
+        
+        temp = usage = freq = None
+        for name, sensor_type, value in sensors:
+            if 'GPU' not in name or not _AMD_SENSOR_NAME_RE.search(name):
+                continue
+            if temp is None and 'Temperature' in sensor_type:
+                temp = float(value)
+            elif usage is None and 'Load' in sensor_type:
+                usage = float(value)
+            elif freq is None and 'Clock' in sensor_type:
+                freq = float(value)
+        self._last_temp, self._last_usage, self._last_freq = temp, usage, freq
+    
     def _detect_amd_gpu(self):
         """Detect AMD GPU name"""
         if not HAS_WMI or not self.wmi_connection:
             return
         
-        try:
-            # Try to get GPU info from Win32_VideoController
-            for gpu in self.wmi_connection.Win32_VideoController():
-                if 'AMD' in gpu.Name or 'Radeon' in gpu.Name or 'ATI' in gpu.Name:
-                    self.gpu_name = gpu.Name
-                    self.logger.info(f"AMD GPU detected: {self.gpu_name}")
-                    return
-        except Exception as e:
-            self.logger.debug(f"Error detecting AMD GPU: {e}")
+        if self._cached_controllers:
+            self.gpu_name = self._cached_controllers[0][0]
+            self.logger.info(f"AMD GPU detected: {self.gpu_name}")
     
     def get_temperature(self) -> Optional[float]:
         """
@@ -74,11 +174,9 @@ class AMDGPUMetricsWindows:
         
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Temperature' in sensor.SensorType:
-                        if 'AMD' in sensor.Name or 'Radeon' in sensor.Name:
-                            return float(sensor.Value)
+            self.refresh()
+            if self._last_temp is not None:
+                return self._last_temp
             
             # Fallback: Try ACPI thermal zone (less reliable)
             try:
@@ -108,21 +206,18 @@ class AMDGPUMetricsWindows:
         
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Load' in sensor.SensorType:
-                        if 'AMD' in sensor.Name or 'Radeon' in sensor.Name:
-                            return float(sensor.Value)
+            self.refresh()
+            if self._last_usage is not None:
+                return self._last_usage
             
             # Fallback: Try Win32_PerfFormattedData_GPUPerformanceCounters
-            try:
-                for counter in self.wmi_connection.query(
-                    "SELECT * FROM Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine"
-                ):
-                    if hasattr(counter, 'UtilizationPercentage'):
-                        return float(counter.UtilizationPercentage)
-            except Exception:
-                pass
+            if self._gpu_engine_class is not None:
+                try:
+                    for counter in self.wmi_connection.query(self.GPU_ENGINE_3D_QUERY):
+                        if hasattr(counter, 'UtilizationPercentage'):
+                            return float(counter.UtilizationPercentage)
+                except Exception:
+                    pass
                 
         except Exception as e:
             self.logger.debug(f"Error getting AMD usage: {e}")
@@ -141,11 +236,9 @@ class AMDGPUMetricsWindows:
         
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Clock' in sensor.SensorType:
-                        if 'AMD' in sensor.Name or 'Radeon' in sensor.Name:
-                            return float(sensor.Value)
+            self.refresh()
+            if self._last_freq is not None:
+                return self._last_freq
                             
         except Exception as e:
             self.logger.debug(f"Error getting AMD frequency: {e}")
@@ -163,11 +256,10 @@ class AMDGPUMetricsWindows:
             return None
         
         try:
-            for gpu in self.wmi_connection.Win32_VideoController():
-                if 'AMD' in gpu.Name or 'Radeon' in gpu.Name or 'ATI' in gpu.Name:
-                    # AdapterRAM is in bytes
-                    if hasattr(gpu, 'AdapterRAM') and gpu.AdapterRAM:
-                        return float(gpu.AdapterRAM) / (1024 * 1024)
+            for _, adapter_ram in self._cached_controllers:
+                # AdapterRAM is in bytes
+                if adapter_ram:
+                    return float(adapter_ram) / (1024 * 1024)
                         
         except Exception as e:
             self.logger.debug(f"Error getting AMD VRAM: {e}")
@@ -175,6 +267,7 @@ class AMDGPUMetricsWindows:
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def has_amd_gpu_windows() -> bool:
     """Check if an AMD GPU is present on Windows"""
     if not HAS_WMI:
@@ -183,7 +276,7 @@ def has_amd_gpu_windows() -> bool:
     try:
         w = wmi.WMI()
         for gpu in w.Win32_VideoController():
-            if 'AMD' in gpu.Name or 'Radeon' in gpu.Name or 'ATI' in gpu.Name:
+            if AMD_GPU_NAME_RE.search(gpu.Name):
                 return True
     except Exception:
         pass
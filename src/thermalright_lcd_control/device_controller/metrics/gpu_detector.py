@@ -8,9 +8,36 @@ This module detects the available GPU(s) and initializes the appropriate
 metrics handler for the platform and GPU vendor.
 """
 
+import atexit
+import subprocess
+import threading
 from typing import Optional, List, Dict
 from thermalright_lcd_control.common.platform_utils import is_windows, is_linux
 from thermalright_lcd_control.common.logging_config import get_service_logger
+from thermalright_lcd_control.device_controller.metrics._gpu_probe import (
+    AMD_VENDOR_ID, INTEL_VENDOR_ID, NVIDIA_SMI_DETECT_TIMEOUT, drm_card_devices, nvidia_smi_names, read_sysfs
+)
+
+# Try to import NVML bindings (nvidia-ml-py) for in-process NVIDIA detection
+try:
+    import pynvml
+    HAS_PYNVML = True
+except ImportError:
+    HAS_PYNVML = False
+
+# GPUs found by the first detection in this process; hardware does not change
+# at runtime, so later GPUDetector instances reuse the result
+_DETECTED_GPUS: Optional[List["GPUInfo"]] = None
+_DETECTION_LOCK = threading.Lock()
+_NVML_INITIALIZED = False
+
+def _nvml_init():
+    """Initialize NVML once per process and shut it down at exit"""
+    global _NVML_INITIALIZED
+    if not _NVML_INITIALIZED:
+        pynvml.nvmlInit()
+        _NVML_INITIALIZED = True
+        atexit.register(pynvml.nvmlShutdown)
 
 
 class GPUInfo:
@@ -30,7 +57,7 @@ class GPUDetector:
     Detect available GPUs and provide appropriate metrics handlers
     
     Supports:
-    - NVIDIA GPUs (Windows and Linux via nvidia-smi)
+    - NVIDIA GPUs (Windows and Linux via NVML, or nvidia-smi without it)
     - AMD GPUs (Linux via sysfs, Windows via WMI)
     - Intel GPUs (Linux via sysfs, Windows via WMI)
     - Multi-GPU systems
@@ -39,7 +66,31 @@ class GPUDetector:
     def __init__(self):
         self.logger = get_service_logger()
         self.detected_gpus: List[GPUInfo] = []
-        self._detect_all_gpus()
+        self._load_gpus()
+    
+    def _load_gpus(self, refresh: bool = False):
+        """
+        Fill detected_gpus from the process-wide cache, scanning on first use.
+        
+        Args:
+            refresh: Scan again even if a cached result exists
+        """
+        global _DETECTED_GPUS
+        with _DETECTION_LOCK:
+            if refresh or _DETECTED_GPUS is None:
+                self._detect_all_gpus()
+                _DETECTED_GPUS = list(self.detected_gpus)
+            else:
+                self.detected_gpus = list(_DETECTED_GPUS)
+    
+    def refresh(self):
+        """Re-scan for GPUs, replacing the cached detection result"""
+        if is_windows():
+            from thermalright_lcd_control.device_controller.metrics.gpu_amd_windows import has_amd_gpu_windows
+            from thermalright_lcd_control.device_controller.metrics.gpu_intel_windows import IntelAdapterInfo
+            has_amd_gpu_windows.cache_clear()
+            IntelAdapterInfo.invalidate()
+        self._load_gpus(refresh=True)
     
     def _detect_all_gpus(self):
         """Detect all available GPUs"""
@@ -62,26 +113,40 @@ class GPUDetector:
     
     def _detect_nvidia(self) -> bool:
         """Detect NVIDIA GPUs"""
+        if HAS_PYNVML:
+            return self._detect_nvidia_nvml()
+        
         try:
-            import subprocess
-            result = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-                capture_output=True,
-                text=True,
-                timeout=4
-            )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                names = result.stdout.strip().split('\n')
+            names = nvidia_smi_names()
+            if names:
                 for idx, name in enumerate(names):
-                    self.detected_gpus.append(GPUInfo('nvidia', name.strip(), idx))
+                    self.detected_gpus.append(GPUInfo('nvidia', name, idx))
                 return True
                 
+        except subprocess.TimeoutExpired:
+            self.logger.debug(f"nvidia-smi did not answer within {NVIDIA_SMI_DETECT_TIMEOUT}s, assuming no NVIDIA GPU")
         except Exception as e:
             self.logger.debug(f"NVIDIA detection failed: {e}")
         
         return False
     
+    def _detect_nvidia_nvml(self) -> bool:
+        """Detect NVIDIA GPUs through NVML, without spawning nvidia-smi"""
+        try:
+            _nvml_init()
+            count = pynvml.nvmlDeviceGetCount()
+            for idx in range(count):
+                name = pynvml.nvmlDeviceGetName(pynvml.nvmlDeviceGetHandleByIndex(idx))
+                if isinstance(name, bytes):
+                    name = name.decode('utf-8', 'replace')
+                self.detected_gpus.append(GPUInfo('nvidia', name.strip(), idx))
+            return count > 0
+        except pynvml.NVMLError as e:
+            # Includes NVMLError_LibraryNotFound: no NVIDIA driver installed
+            self.logger.debug(f"NVIDIA detection failed: {e}")
+        
+        return False
+    
     def _detect_amd(self) -> bool:
         """Detect AMD GPUs"""
         if is_linux():
@@ -93,39 +158,28 @@ class GPUDetector:
     def _detect_amd_linux(self) -> bool:
         """Detect AMD GPUs on Linux via sysfs"""
         try:
-            import glob
             found = False
             
-            for vendor_file in glob.glob("/sys/class/drm/card*/device/vendor"):
-                try:
-                    with open(vendor_file, 'r') as f:
-                        vendor_id = f.read().strip()
-                        if vendor_id == "0x1002":  # AMD vendor ID
-                            # Get card name
-                            card_path = vendor_file.replace('/vendor', '')
-                            device_file = f"{card_path}/device"
-                            
-                            try:
-                                with open(device_file, 'r') as df:
-                                    device_id = df.read().strip()
-                                    gpu_name = f"AMD GPU (Device {device_id})"
-                                    
-                                    # Try to get a better name from uevent
-                                    uevent_file = f"{card_path}/uevent"
-                                    if os.path.exists(uevent_file):
-                                        with open(uevent_file, 'r') as ef:
-                                            for line in ef:
-                                                if 'PCI_ID' in line:
-                                                    gpu_name = f"AMD GPU ({line.split('=')[1].strip()})"
-                                                    break
-                                    
-                                    self.detected_gpus.append(GPUInfo('amd', gpu_name, len(self.detected_gpus)))
-                                    found = True
-                            except Exception:
-                                pass
-                                
-                except Exception:
+            for device_dir in drm_card_devices():
+                if read_sysfs(f"{device_dir}/vendor") != AMD_VENDOR_ID:
                     continue
+                
+                # Get card name
+                device_id = read_sysfs(f"{device_dir}/device")
+                if device_id is None:
+                    continue
+                gpu_name = f"AMD GPU (Device {device_id})"
+                
+                # Try to get a better name from uevent
+                uevent = read_sysfs(f"{device_dir}/uevent", 4096)
+                if uevent:
+                    for line in uevent.splitlines():
+                        if 'PCI_ID' in line:
+                            gpu_name = f"AMD GPU ({line.split('=')[1].strip()})"
+                            break
+                
+                self.detected_gpus.append(GPUInfo('amd', gpu_name, len(self.detected_gpus)))
+                found = True
             
             return found
             
@@ -137,7 +191,7 @@ class GPUDetector:
     def _detect_amd_windows(self) -> bool:
         """Detect AMD GPUs on Windows via WMI"""
         try:
-            from thermalright_lcd_control.device_controller.metrics.gpu_amd_windows import has_amd_gpu_windows
+            from thermalright_lcd_control.device_controller.metrics.gpu_amd_windows import AMD_GPU_NAME_RE, has_amd_gpu_windows
             
             if has_amd_gpu_windows():
                 # Get GPU name from WMI
@@ -145,7 +199,7 @@ class GPUDetector:
                     import wmi
                     w = wmi.WMI()
                     for gpu in w.Win32_VideoController():
-                        if 'AMD' in gpu.Name or 'Radeon' in gpu.Name or 'ATI' in gpu.Name:
+                        if AMD_GPU_NAME_RE.search(gpu.Name):
                             self.detected_gpus.append(GPUInfo('amd', gpu.Name, len(self.detected_gpus)))
                     return True
                 except Exception:
@@ -169,19 +223,13 @@ class GPUDetector:
     def _detect_intel_linux(self) -> bool:
         """Detect Intel GPUs on Linux via sysfs"""
         try:
-            import glob
             found = False
             
-            for vendor_file in glob.glob("/sys/class/drm/card*/device/vendor"):
-                try:
-                    with open(vendor_file, 'r') as f:
-                        vendor_id = f.read().strip()
-                        if vendor_id == "0x8086":  # Intel vendor ID
-                            gpu_name = "Intel GPU"
-                            self.detected_gpus.append(GPUInfo('intel', gpu_name, len(self.detected_gpus)))
-                            found = True
-                except Exception:
-                    continue
+            for device_dir in drm_card_devices():
+                if read_sysfs(f"{device_dir}/vendor") == INTEL_VENDOR_ID:
+                    gpu_name = "Intel GPU"
+                    self.detected_gpus.append(GPUInfo('intel', gpu_name, len(self.detected_gpus)))
+                    found = True
             
             return found
             
@@ -191,23 +239,15 @@ class GPUDetector:
         return False
     
     def _detect_intel_windows(self) -> bool:
-        """Detect Intel GPUs on Windows via WMI"""
+        """Detect Intel GPUs on Windows via the cached DXGI/WMI adapter probe"""
         try:
-            from thermalright_lcd_control.device_controller.metrics.gpu_intel_windows import has_intel_gpu_windows
+            from thermalright_lcd_control.device_controller.metrics.gpu_intel_windows import get_intel_adapter
             
-            if has_intel_gpu_windows():
-                # Get GPU name from WMI
-                try:
-                    import wmi
-                    w = wmi.WMI()
-                    for gpu in w.Win32_VideoController():
-                        if 'Intel' in gpu.Name:
-                            self.detected_gpus.append(GPUInfo('intel', gpu.Name, len(self.detected_gpus)))
-                    return True
-                except Exception:
-                    # Generic Intel GPU entry
-                    self.detected_gpus.append(GPUInfo('intel', 'Intel GPU', 0))
-                    return True
+            # Probed once per process: no new WMI connection per detection
+            adapter = get_intel_adapter()
+            if adapter.present:
+                self.detected_gpus.append(GPUInfo('intel', adapter.name, len(self.detected_gpus)))
+                return True
                     
         except Exception as e:
             self.logger.debug(f"Intel Windows detection failed: {e}")
@@ -271,8 +311,6 @@ class GPUDetector:
 
 def main():
     """Test GPU detection"""
-    import os
-    
     print("GPU Detection Test")
     print("=" * 60)
     print()
@@ -297,5 +335,4 @@ def main():
 
 
 if __name__ == '__main__':
-    import os
     main()
@@ -5,14 +5,31 @@
 Intel GPU Metrics for Windows
 
 Provides Intel GPU metrics using WMI (Windows Management Instrumentation).
+Temperature and clock are read through the Intel Graphics Control Library
+first when the driver provides it (required for Intel Arc).
+
+The adapter itself is looked up through DXGI when available, which is much
+faster than enumerating Win32_VideoController.
 
 Supports Intel Arc, Iris, and UHD Graphics.
 """
 
+import functools
 import subprocess
-from typing import Optional
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
 
 from thermalright_lcd_control.common.logging_config import get_service_logger
+from thermalright_lcd_control.device_controller.metrics._igcl import IntelGPUBackendIGCL
+
+try:
+    from thermalright_lcd_control.device_controller.metrics._pdh import PdhCounterArray
+    HAS_PDH = True
+except (ImportError, AttributeError, OSError):
+    HAS_PDH = False
 
 try:
     import wmi
@@ -20,14 +37,174 @@ try:
 except ImportError:
     HAS_WMI = False
 
+try:
+    from thermalright_lcd_control.device_controller.metrics._dxgi import enumerate_adapters
+    HAS_DXGI = True
+except (ImportError, AttributeError, OSError):
+    HAS_DXGI = False
+
+INTEL_VENDOR_ID = 0x8086
+# Seconds the Win32_VideoController fallback may take; a stalled WMI service
+# must not hold up GPU detection indefinitely
+WMI_PROBE_TIMEOUT = 5.0
+# Filtered and projected by the WMI provider, so only Intel rows are marshaled
+VIDEO_CONTROLLER_QUERY = "SELECT Name, AdapterRAM FROM Win32_VideoController WHERE Name LIKE '%Intel%'"
+
+
+@dataclass(frozen=True)
+class IntelAdapterInfo:
+    """Intel GPU found by the startup probe (see _probe_intel_adapter)"""
+    name: str = "Intel GPU"
+    vram_bytes: Optional[int] = None
+    present: bool = False
+    # Adapter LUID from DXGI, used to pick this GPU's performance counters
+    luid: Optional[int] = None
+    
+    @staticmethod
+    def invalidate():
+        """Forget the probed adapter so the next lookup enumerates again"""
+        _probe_intel_adapter.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_intel_adapter() -> IntelAdapterInfo:
+    """
+    Find the Intel GPU once per process, as the hardware inventory does not
+    change at runtime. DXGI is used when available, Win32_VideoController
+    otherwise.
+    
+    Returns:
+        IntelAdapterInfo, with present=False if there is no Intel GPU
+    """
+    if HAS_DXGI:
+        try:
+            for adapter in enumerate_adapters():
+                if adapter.vendor_id == INTEL_VENDOR_ID and not adapter.is_software:
+                    return IntelAdapterInfo(adapter.description, adapter.dedicated_video_memory or None, True,
+                                            adapter.luid)
+            return IntelAdapterInfo()
+        except OSError:
+            pass
+    
+    if HAS_WMI:
+        try:
+            return _run_with_timeout(_query_video_controllers, WMI_PROBE_TIMEOUT)
+        except FutureTimeoutError:
+            get_service_logger().warning(
+                f"Win32_VideoController did not answer within {WMI_PROBE_TIMEOUT}s, assuming no Intel GPU")
+        except Exception:
+            pass
+    
+    return IntelAdapterInfo()
+
+
+def _query_video_controllers() -> IntelAdapterInfo:
+    """Look up the Intel GPU in Win32_VideoController (own COM apartment)"""
+    import pythoncom
+    pythoncom.CoInitialize()
+    try:
+        for gpu in wmi.WMI().query(VIDEO_CONTROLLER_QUERY):
+            return IntelAdapterInfo(gpu.Name, gpu.AdapterRAM or None, True)
+        return IntelAdapterInfo()
+    finally:
+        pythoncom.CoUninitialize()
+
+
+def _run_with_timeout(function, timeout: float):
+    """
+    Run function on a daemon thread and wait at most timeout seconds for it.
+    
+    A WMI call cannot be cancelled, so on timeout the thread is abandoned
+    (it does not keep the process alive).
+    
+    Raises:
+        concurrent.futures.TimeoutError: If function did not return in time
+    """
+    future = Future()
+    
+    def run():
+        try:
+            future.set_result(function())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=f"wmi-{function.__name__}", daemon=True).start()
+    return future.result(timeout=timeout)
+
+
+def _ttl_cached(getter):
+    """
+    Reuse a metric getter's result for the instance's RESULT_TTL seconds.
+    
+    Results are kept per getter in the instance's _results dict, with the
+    time they were read.
+    """
+    @functools.wraps(getter)
+    def wrapper(self):
+        now = time.monotonic()
+        cached = self._results.get(getter.__name__)
+        if cached is not None and now - cached[1] < self.RESULT_TTL:
+            return cached[0]
+        value = getter(self)
+        self._results[getter.__name__] = (value, now)
+        return value
+    return wrapper
+
 
 class IntelGPUMetricsWindows:
     """Intel GPU metrics for Windows using WMI"""
     
+    # Queries project only the columns that are read and filter rows
+    # server-side, instead of materializing every property of every row.
+    # All Intel GPU sensors, indexed once by OpenHardwareMonitor SensorType
+    SENSOR_INDEX_QUERY = (
+        "SELECT Identifier, SensorType FROM Sensor "
+        "WHERE Name LIKE '%GPU%' AND Name LIKE '%Intel%'"
+    )
+    SENSOR_KINDS = ('Temperature', 'Load', 'Clock')
+    # Values of all indexed sensors in one query (condition ORs their identifiers)
+    SENSOR_VALUES_QUERY = "SELECT Identifier, Value FROM Sensor WHERE {condition}"
+    # Seconds a sensor snapshot is reused, so the getters of one poll share a query
+    SENSORS_TTL = 0.2
+    # Seconds a getter's result is reused: the overlay, log and GUI may ask
+    # for the same metric within one frame, and sensors update at about 1 Hz
+    RESULT_TTL = 1.0
+    ACPI_TEMPERATURE_QUERY = "SELECT CurrentTemperature FROM MSAcpi_ThermalZoneTemperature"
+    # 3D engine utilization per (process, engine), read through PDH
+    GPU_ENGINE_3D_COUNTER = "\\GPU Engine(*engtype_3D)\\Utilization Percentage"
+    
     def __init__(self):
         self.logger = get_service_logger()
         self.wmi_connection = None
         self.gpu_name = "Intel GPU"
+        self._adapter = IntelAdapterInfo()
+        # Dedicated VRAM in MB, fixed for the adapter (see _detect_intel_gpu)
+        self._vram_mb: Optional[float] = None
+        self._has_sensors = False
+        # Identifier of the first Intel GPU sensor of each kind, so polls
+        # read a single sensor instead of scanning by name
+        self._sensor_ids: Dict[str, str] = {}
+        self._sensor_values_query: Optional[str] = None
+        # Latest {sensor type: value} snapshot of the indexed sensors
+        self._sensor_values: Dict[str, float] = {}
+        self._sensor_values_ts = 0.0
+        # When the last (empty) sensor index was built, see _read_sensors
+        self._sensor_index_ts = 0.0
+        # {getter name: (value, time.monotonic() of the read)}, see _ttl_cached
+        self._results: Dict[str, Tuple[Optional[float], float]] = {}
+        # Open PDH query on the 3D engine counters, created on first use
+        self._gpu_engine_3d = None
+        # root\WMI connection for the ACPI temperature fallback, made on first use
+        self._wmi_acpi = None
+        self._wmi_acpi_failed = False
+        
+        # Driver telemetry, preferred over OpenHardwareMonitor sensors
+        self._igcl: Optional[IntelGPUBackendIGCL] = None
+        try:
+            self._igcl = IntelGPUBackendIGCL(_probe_intel_adapter().luid)
+            self.logger.debug("Intel Graphics Control Library available")
+        except (OSError, AttributeError) as e:
+            self.logger.debug(f"Intel Graphics Control Library unavailable: {e}")
         
         if HAS_WMI:
             try:
@@ -41,23 +218,78 @@ class IntelGPUMetricsWindows:
                     self.logger.error(f"Failed to initialize WMI: {e}")
                     self.wmi_connection = None
         
+        if self.wmi_connection:
+            # Class lookup is a WMI round-trip: check for OpenHardwareMonitor once
+            self._has_sensors = hasattr(self.wmi_connection, 'Sensor')
+            if self._has_sensors:
+                self._build_sensor_index()
+        
         self._detect_intel_gpu()
     
     def _detect_intel_gpu(self):
-        """Detect Intel GPU name"""
-        if not HAS_WMI or not self.wmi_connection:
-            return
-        
+        """Detect Intel GPU name from the adapter probed once per process"""
+        self._adapter = _probe_intel_adapter()
+        if self._adapter.vram_bytes:
+            self._vram_mb = float(self._adapter.vram_bytes) / (1024 * 1024)
+        if self._adapter.present:
+            self.gpu_name = self._adapter.name
+            self.logger.info(f"Intel GPU detected: {self.gpu_name}")
+    
+    def _build_sensor_index(self):
+        """Index the Intel GPU sensors by kind with a single OpenHardwareMonitor query"""
+        self._sensor_ids = {}
         try:
-            # Try to get GPU info from Win32_VideoController
-            for gpu in self.wmi_connection.Win32_VideoController():
-                if 'Intel' in gpu.Name:
-                    self.gpu_name = gpu.Name
-                    self.logger.info(f"Intel GPU detected: {self.gpu_name}")
-                    return
+            for sensor in self.wmi_connection.query(self.SENSOR_INDEX_QUERY):
+                for kind in self.SENSOR_KINDS:
+                    if kind in sensor.SensorType:
+                        self._sensor_ids.setdefault(kind, sensor.Identifier)
         except Exception as e:
-            self.logger.debug(f"Error detecting Intel GPU: {e}")
+            self.logger.debug(f"Error indexing Intel GPU sensors: {e}")
+        
+        identifiers = sorted(set(self._sensor_ids.values()))
+        self._sensor_values_query = self.SENSOR_VALUES_QUERY.format(
+            condition=" OR ".join(f"Identifier = '{identifier}'" for identifier in identifiers)
+        ) if identifiers else None
+    
+    def _read_sensors(self) -> Dict[str, float]:
+        """
+        Read all indexed Intel GPU sensors with a single OpenHardwareMonitor query.
+        
+        Returns:
+            {sensor type: value}, refreshed at most once per SENSORS_TTL seconds
+        """
+        now = time.monotonic()
+        if not self._sensor_values_query:
+            # Nothing indexed, e.g. the hardware monitor started after this
+            # app: look for the sensors again, at most once per RESULT_TTL
+            if now - self._sensor_index_ts < self.RESULT_TTL:
+                return self._sensor_values
+            self._sensor_index_ts = now
+            self._build_sensor_index()
+        if self._sensor_values_query and now - self._sensor_values_ts >= self.SENSORS_TTL:
+            by_id = {sensor.Identifier: sensor.Value
+                     for sensor in self.wmi_connection.query(self._sensor_values_query)}
+            self._sensor_values = {kind: float(by_id[identifier]) for kind, identifier in self._sensor_ids.items()
+                                   if by_id.get(identifier) is not None}
+            self._sensor_values_ts = now
+            if len(by_id) < len(set(self._sensor_ids.values())):
+                # A sensor is gone (e.g. the hardware monitor restarted): re-index for the next poll
+                self._build_sensor_index()
+        return self._sensor_values
     
+    def _query_sensor(self, kind: str) -> Optional[float]:
+        """
+        Read the indexed Intel GPU sensor of an OpenHardwareMonitor sensor type.
+        
+        Args:
+            kind: Sensor type ('Temperature', 'Load' or 'Clock')
+            
+        Returns:
+            Sensor value, or None if no sensor matches
+        """
+        return self._read_sensors().get(kind)
+    
+    @_ttl_cached
     def get_temperature(self) -> Optional[float]:
         """
         Get GPU temperature
@@ -65,33 +297,55 @@ class IntelGPUMetricsWindows:
         Returns:
             Temperature in Celsius or None if unavailable
         """
+        if self._igcl is not None:
+            temp = self._igcl.get_temperature()
+            if temp is not None:
+                return temp
+        
         if not HAS_WMI or not self.wmi_connection:
             return None
         
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Temperature' in sensor.SensorType:
-                        if 'Intel' in sensor.Name:
-                            return float(sensor.Value)
+            if self._has_sensors:
+                value = self._query_sensor('Temperature')
+                if value is not None:
+                    return value
             
             # Fallback: Try ACPI thermal zone
-            try:
-                wmi_temp = wmi.WMI(namespace="root\\WMI")
-                for sensor in wmi_temp.MSAcpi_ThermalZoneTemperature():
-                    # Convert from tenths of Kelvin to Celsius
-                    temp_celsius = (sensor.CurrentTemperature / 10.0) - 273.15
-                    if 0 < temp_celsius < 150:  # Sanity check
-                        return temp_celsius
-            except Exception:
-                pass
+            wmi_acpi = self._get_acpi_connection()
+            if wmi_acpi is not None:
+                try:
+                    for sensor in wmi_acpi.query(self.ACPI_TEMPERATURE_QUERY):
+                        # Convert from tenths of Kelvin to Celsius
+                        temp_celsius = (sensor.CurrentTemperature / 10.0) - 273.15
+                        if 0 < temp_celsius < 150:  # Sanity check
+                            return temp_celsius
+                except Exception:
+                    pass
                 
         except Exception as e:
             self.logger.debug(f"Error getting Intel temperature: {e}")
         
         return None
     
+    def _get_acpi_connection(self):
+        """
+        Connect to the root\\WMI namespace once.
+        
+        Returns:
+            WMI connection, or None if the namespace cannot be opened
+        """
+        if self._wmi_acpi is None and not self._wmi_acpi_failed:
+            try:
+                self._wmi_acpi = wmi.WMI(namespace="root\\WMI")
+            except Exception as e:
+                # Don't retry a COM connection on every poll
+                self._wmi_acpi_failed = True
+                self.logger.debug(f"root\\WMI namespace unavailable: {e}")
+        return self._wmi_acpi
+    
+    @_ttl_cached
     def get_usage(self) -> Optional[float]:
         """
         Get GPU usage percentage
@@ -99,32 +353,43 @@ class IntelGPUMetricsWindows:
         Returns:
             Usage percentage (0-100) or None if unavailable
         """
-        if not HAS_WMI or not self.wmi_connection:
-            return None
-        
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Load' in sensor.SensorType:
-                        if 'Intel' in sensor.Name:
-                            return float(sensor.Value)
+            if self._has_sensors:
+                value = self._query_sensor('Load')
+                if value is not None:
+                    return value
             
-            # Fallback: Try Win32_PerfFormattedData_GPUPerformanceCounters
-            try:
-                for counter in self.wmi_connection.query(
-                    "SELECT * FROM Win32_PerfFormattedData_GPUPerformanceCounters_GPUEngine"
-                ):
-                    if hasattr(counter, 'UtilizationPercentage'):
-                        return float(counter.UtilizationPercentage)
-            except Exception:
-                pass
+            # Fallback: 3D engine utilization from the GPU performance counters
+            if HAS_PDH:
+                return self._get_3d_engine_usage()
                 
         except Exception as e:
             self.logger.debug(f"Error getting Intel usage: {e}")
         
         return None
     
+    def _get_3d_engine_usage(self) -> Optional[float]:
+        """
+        Sum the 3D engine utilization of all processes on the Intel adapter.
+        
+        Returns:
+            Usage percentage (0-100), or None before the first full sample interval
+        """
+        if self._gpu_engine_3d is None:
+            # The query stays open: each later poll is a single sample
+            self._gpu_engine_3d = PdhCounterArray(self.GPU_ENGINE_3D_COUNTER)
+            return None
+        
+        values = self._gpu_engine_3d.read()
+        luid = self._adapter.luid
+        if luid is not None:
+            # Instance names look like pid_1234_luid_0x00000000_0x0000C5F2_phys_0_eng_0_engtype_3D
+            tag = f"luid_0x{luid >> 32:08x}_0x{luid & 0xFFFFFFFF:08x}_"
+            values = {name: value for name, value in values.items() if tag in name.lower()}
+        return min(sum(values.values()), 100.0)
+    
+    @_ttl_cached
     def get_frequency(self) -> Optional[float]:
         """
         Get GPU clock frequency in MHz
@@ -132,16 +397,18 @@ class IntelGPUMetricsWindows:
         Returns:
             Frequency in MHz or None if unavailable
         """
+        if self._igcl is not None:
+            freq = self._igcl.get_frequency()
+            if freq is not None:
+                return freq
+        
         if not HAS_WMI or not self.wmi_connection:
             return None
         
         try:
             # Try OpenHardwareMonitor namespace
-            if hasattr(self.wmi_connection, 'Sensor'):
-                for sensor in self.wmi_connection.Sensor():
-                    if 'GPU' in sensor.Name and 'Clock' in sensor.SensorType:
-                        if 'Intel' in sensor.Name:
-                            return float(sensor.Value)
+            if self._has_sensors:
+                return self._query_sensor('Clock')
                             
         except Exception as e:
             self.logger.debug(f"Error getting Intel frequency: {e}")
@@ -158,33 +425,33 @@ class IntelGPUMetricsWindows:
         Returns:
             VRAM usage in MB or None if unavailable
         """
-        if not HAS_WMI or not self.wmi_connection:
-            return None
+        # DXGI DedicatedVideoMemory (or WMI AdapterRAM without DXGI), read
+        # once by the adapter probe
+        return self._vram_mb
+    
+    def get_all_metrics(self) -> Dict[str, Optional[float]]:
+        """
+        Read every metric for one poll.
         
-        try:
-            for gpu in self.wmi_connection.Win32_VideoController():
-                if 'Intel' in gpu.Name:
-                    # AdapterRAM is in bytes
-                    if hasattr(gpu, 'AdapterRAM') and gpu.AdapterRAM:
-                        return float(gpu.AdapterRAM) / (1024 * 1024)
-                        
-        except Exception as e:
-            self.logger.debug(f"Error getting Intel VRAM: {e}")
+        The OpenHardwareMonitor sensors behind the getters are fetched by a
+        single query, shared for SENSORS_TTL seconds.
         
-        return None
+        Returns:
+            Dict with 'temperature', 'usage_percentage', 'frequency' and 'vram' keys
+        """
+        return {
+            'temperature': self.get_temperature(),
+            'usage_percentage': self.get_usage(),
+            'frequency': self.get_frequency(),
+            'vram': self.get_vram_usage(),
+        }
+
+
+def get_intel_adapter() -> IntelAdapterInfo:
+    """Get the Intel GPU found by the (memoized) adapter probe"""
+    return _probe_intel_adapter()
 
 
 def has_intel_gpu_windows() -> bool:
-    """Check if an Intel GPU is present on Windows"""
-    if not HAS_WMI:
-        return False
-    
-    try:
-        w = wmi.WMI()
-        for gpu in w.Win32_VideoController():
-            if 'Intel' in gpu.Name:
-                return True
-    except Exception:
-        pass
-    
-    return False
+    """Check if an Intel GPU is present on Windows (memoized for the process lifetime)"""
+    return _probe_intel_adapter().present
@@ -6,8 +6,12 @@ import json
 import os
 import re
 import subprocess
+from typing import Optional, Tuple
 
 from thermalright_lcd_control.device_controller.metrics import Metrics
+from thermalright_lcd_control.device_controller.metrics._gpu_probe import (
+    AMD_VENDOR_ID, INTEL_VENDOR_ID, drm_card_devices, nvidia_smi_names, read_sysfs
+)
 from thermalright_lcd_control.common.logging_config import LoggerConfig
 from thermalright_lcd_control.common.platform_utils import is_windows, is_linux
 
@@ -22,6 +26,10 @@ class GpuMetrics(Metrics):
       - AMD usage: /sys/class/drm/cardX/device/gpu_busy_percent (selected card).
       - AMD frequency: prefer pp_dpm_sclk on selected card, else that card's hwmon freq1_input, else debugfs match by BDF.
     """
+    # Seconds to wait for nvidia-smi once the GPU is in use (detect_vendor
+    # uses the shorter NVIDIA_SMI_DETECT_TIMEOUT)
+    NVIDIA_SMI_TIMEOUT = 4
+
     def __init__(self):
         super().__init__()
         self.logger = LoggerConfig.setup_service_logger()
@@ -53,6 +61,38 @@ class GpuMetrics(Metrics):
 
     # ---------- detection ----------
 
+    @classmethod
+    def detect_vendor(cls) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Identify the GPU an instance would use, without setting up its readers.
+
+        Runs nvidia-smi once, then checks the sysfs PCI vendor ids (Linux);
+        the AMD card selection and the rocm-smi/intel_gpu_top probes are skipped.
+
+        Returns:
+            (vendor, name), or (None, None) if no supported GPU is found
+        """
+        try:
+            names = nvidia_smi_names()
+            if names:
+                return "nvidia", names[0]
+        except Exception:
+            pass
+
+        if not is_linux():
+            return None, None
+
+        intel_found = False
+        for dev_path in drm_card_devices():
+            vendor = read_sysfs(f"{dev_path}/vendor")
+            if vendor == AMD_VENDOR_ID:
+                return "amd", f"AMD GPU (Device {read_sysfs(f'{dev_path}/device')})"
+            intel_found = intel_found or vendor == INTEL_VENDOR_ID
+        # AMD takes precedence over Intel, as in _detect_gpu
+        if intel_found:
+            return "intel", "Intel GPU"
+        return None, None
+
     def _detect_gpu(self):
         try:
             if self._is_nvidia_available():
@@ -83,11 +123,7 @@ class GpuMetrics(Metrics):
 
     def _is_nvidia_available(self):
         try:
-            r = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-                capture_output=True, text=True, timeout=4
-            )
-            return r.returncode == 0 and r.stdout.strip()
+            return bool(nvidia_smi_names(self.NVIDIA_SMI_TIMEOUT))
         except Exception:
             return False
 
@@ -246,12 +282,9 @@ class GpuMetrics(Metrics):
 
     def _get_nvidia_name(self):
         try:
-            r = subprocess.run(
-                ["nvidia-smi", "--query-gpu=name", "--format=csv,noheader,nounits"],
-                capture_output=True, text=True, timeout=4
-            )
-            if r.returncode == 0 and r.stdout.strip():
-                return r.stdout.strip().splitlines()[0]
+            names = nvidia_smi_names(self.NVIDIA_SMI_TIMEOUT)
+            if names:
+                return names[0]
         except Exception:
             pass
         return "NVIDIA GPU"
@@ -14,14 +14,100 @@ Performs comprehensive system diagnostics to identify potential issues:
 - Service status (Windows)
 """
 
+import ctypes
+import functools
+import glob
+import importlib.util
+import json
+import os
+import shutil
 import sys
 import subprocess
-from pathlib import Path
-from typing import List, Dict, Tuple
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import List, Dict, Optional, Tuple
 
-from thermalright_lcd_control.common.platform_utils import is_windows, is_linux
+from thermalright_lcd_control.common.platform_utils import is_windows, is_linux, get_cache_dir
 from thermalright_lcd_control.common.logging_config import get_gui_logger
 
+UDEV_RULES_DIR = "/etc/udev/rules.d"
+
+# Fragments (lowercase) of import errors caused by a missing native library
+NATIVE_LIBRARY_ERROR_TOKENS = ('hidapi', 'dll', 'library', '.so', 'dylib')
+
+
+@functools.lru_cache(maxsize=None)
+def _has_module(import_name: str) -> bool:
+    """Whether a top-level module is installed, located once per process without importing it"""
+    return importlib.util.find_spec(import_name) is not None
+
+
+@functools.lru_cache(maxsize=1)
+def _udev_rules_snapshot(rules_dir_mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Thermalright udev rules files; memoized per rules directory modification time.
+    
+    Adding or removing a rules file changes the directory mtime, so a stale
+    listing is never returned.
+    """
+    # Plain name test on a directory listing, no per-entry glob matching or stat
+    with os.scandir(UDEV_RULES_DIR) as entries:
+        return tuple(entry.name for entry in entries if 'thermalright' in entry.name)
+
+
+@functools.lru_cache(maxsize=1)
+def _has_gpu_driver_hint() -> bool:
+    """
+    Cheap evidence of a GPU that GpuMetrics can read: nvidia-smi on PATH,
+    the NVML library or device node, or a DRM device on Linux.
+    
+    Without any, GPU detection is skipped; it spawns vendor tools otherwise.
+    """
+    if shutil.which('nvidia-smi'):
+        return True
+    if is_windows():
+        system_root = os.environ.get('SystemRoot', 'C:\\Windows')
+        return os.path.exists(os.path.join(system_root, 'System32', 'nvml.dll'))
+    if is_linux():
+        return os.path.exists('/dev/nvidia0') or bool(glob.glob('/sys/class/drm/card*/device/vendor'))
+    return False
+
+
+def _start_daemon(function, initializer=None) -> Future:
+    """
+    Run function on a daemon thread and return a Future for its result.
+    
+    A WMI, USB or driver query cannot be cancelled; unlike an executor
+    worker, a daemon thread stuck in one is not joined at interpreter exit,
+    so it does not keep the process alive once its check was reported.
+    
+    Args:
+        function: Callable without arguments
+        initializer: Called first on the new thread, if given
+        
+    Returns:
+        Future resolved with the return value or exception of function
+    """
+    future = Future()
+    
+    def run():
+        try:
+            if initializer is not None:
+                initializer()
+            future.set_result(function())
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=run, name=f"system-check-{function.__name__}", daemon=True).start()
+    return future
+
+
+def _is_native_library_error(message: str) -> bool:
+    """Whether an import error message points at a native library that failed to load"""
+    message = message.lower()
+    return any(token in message for token in NATIVE_LIBRARY_ERROR_TOKENS)
+
 
 class DiagnosticCheck:
     """Represents a single diagnostic check result"""
@@ -42,58 +128,230 @@ class SystemChecker:
     Comprehensive system diagnostics checker
     
     Checks all requirements and provides actionable feedback for issues.
+    Each check_* method returns its results; run_all_checks collects them.
     """
     
+    # Seconds the concurrent probes may take in total; a probe still blocked
+    # on WMI or a driver after that is reported as failed instead of waited on
+    CHECK_TIMEOUT = 15.0
+    # Seconds a probe's passing results are reused, also by later runs (see _load_cache)
+    CHECK_CACHE_TTL = 30.0
+    CHECK_CACHE_FILE = "diagnostics.json"
+    # Probes of hardware that can be unplugged at any time, with no cheap
+    # input to key a cache on: always run
+    UNCACHED_CHECKS = frozenset({'check_usb_device', 'check_gpu_support'})
+    
     def __init__(self):
         self.logger = get_gui_logger()
         self.checks: List[DiagnosticCheck] = []
+        # Outcome of importing hid (see _probe_hid), shared by all checks
+        self._hid_probe: Optional[Tuple[bool, Optional[str]]] = None
+        # {probe name: {'key', 'timestamp', 'checks'}}, loaded on the first run
+        self._cache: Optional[Dict[str, Dict]] = None
+        self._cache_path = os.path.join(get_cache_dir(), self.CHECK_CACHE_FILE)
+        # Interpreter and platform part of every cache key, fixed for the process
+        self._platform_key = '|'.join((sys.version, sys.platform, sys.executable))
     
-    def run_all_checks(self) -> List[DiagnosticCheck]:
-        """Run all diagnostic checks"""
-        self.checks = []
+    def run_all_checks(self, force_refresh: bool = False) -> List[DiagnosticCheck]:
+        """
+        Run all diagnostic checks
         
-        # Core checks
-        self.check_python_version()
-        self.check_dependencies()
+        Results of the slow probes (drivers, file search) are reused for
+        CHECK_CACHE_TTL seconds while their inputs are unchanged, unless a
+        check failed: a user re-running after applying a fix hint always gets
+        a fresh result. USB and GPU detection always run (UNCACHED_CHECKS).
         
+        Args:
+            force_refresh: Run every probe, ignoring cached results and lookups
+            
+        Returns:
+            List of check results, also stored in self.checks
+        """
+        probes = []
         # Platform-specific checks
         if is_windows():
-            self.check_windows_specific()
-            self.check_video_codecs()  # Windows 11 codec check
+            probes.append(self.check_windows_specific)
+            probes.append(self.check_video_codecs)  # Windows 11 codec check
         elif is_linux():
-            self.check_linux_specific()
+            probes.append(self.check_linux_specific)
         
         # Device and GPU checks
-        self.check_usb_device()
-        self.check_gpu_support()
+        probes.append(self.check_usb_device)
+        probes.append(self.check_gpu_support)
         
         # Optional feature checks
-        self.check_window_capture()
-        self.check_istripper()
+        probes.append(self.check_window_capture)
+        probes.append(self.check_istripper)
+        
+        if self._cache is None:
+            self._cache = self._load_cache()
+        if force_refresh:
+            _has_module.cache_clear()
+            _has_gpu_driver_hint.cache_clear()
+        cached = {} if force_refresh else {probe.__name__: self._get_cached(probe) for probe in probes}
+        pending = [probe for probe in probes if cached.get(probe.__name__) is None]
+        
+        # The probes (USB, registry, drivers, file search) are independent and
+        # mostly wait on I/O: run them concurrently, reporting in this order
+        futures = {probe.__name__: _start_daemon(probe, self._init_check_worker) for probe in pending}
+        deadline = time.monotonic() + self.CHECK_TIMEOUT
         
+        # Core checks (cheap, in-process) run here while the probes are
+        # in flight, and are reported first
+        checks = self.check_python_version() + self.check_dependencies()
+        for probe in probes:
+            if probe.__name__ not in futures:
+                checks.extend(cached[probe.__name__])
+                continue
+            try:
+                results = futures[probe.__name__].result(timeout=max(0.0, deadline - time.monotonic()))
+                checks.extend(results)
+                self._store_cached(probe, results)
+            except FutureTimeoutError:
+                # The probe's thread is abandoned: its result is no longer reported
+                self.logger.warning(f"{probe.__name__} did not finish within {self.CHECK_TIMEOUT}s")
+                checks.append(DiagnosticCheck(
+                    "Diagnostic Timeout",
+                    False,
+                    f"{probe.__name__} did not finish within {self.CHECK_TIMEOUT:.0f}s",
+                    "A system query (WMI, USB or driver) is not responding; try again after a reboot"
+                ))
+        
+        if pending:
+            self._save_cache()
+        self.checks = checks
         return self.checks
     
-    def check_python_version(self):
+    def _cache_key(self, probe) -> str:
+        """
+        Fingerprint of the cheap inputs a probe's results depend on.
+        
+        Args:
+            probe: Bound check_* method
+            
+        Returns:
+            Key that changes when cached results of the probe become invalid
+        """
+        if probe.__name__ == 'check_linux_specific':
+            try:
+                return f"{self._platform_key}|{os.stat(UDEV_RULES_DIR).st_mtime_ns}"
+            except OSError:
+                return f"{self._platform_key}|-"
+        return self._platform_key
+    
+    def _get_cached(self, probe) -> Optional[List[DiagnosticCheck]]:
+        """Cached results of a probe, or None if missing, expired, stale or not cacheable"""
+        if probe.__name__ in self.UNCACHED_CHECKS:
+            return None
+        entry = self._cache.get(probe.__name__)
+        if (not isinstance(entry, dict) or entry.get('key') != self._cache_key(probe)
+                or time.time() - entry.get('timestamp', 0) >= self.CHECK_CACHE_TTL):
+            return None
+        try:
+            return [DiagnosticCheck(**check) for check in entry['checks']]
+        except (KeyError, TypeError):
+            return None
+    
+    def _store_cached(self, probe, results: List[DiagnosticCheck]):
+        """Remember the results of a cacheable probe that just ran, if all of them passed"""
+        if probe.__name__ in self.UNCACHED_CHECKS or not all(check.passed for check in results):
+            self._cache.pop(probe.__name__, None)
+            return
+        self._cache[probe.__name__] = {
+            'key': self._cache_key(probe),
+            'timestamp': time.time(),
+            'checks': [vars(check) for check in results],
+        }
+    
+    def _load_cache(self) -> Dict[str, Dict]:
+        """Read cached probe results written by an earlier run"""
+        try:
+            with open(self._cache_path, encoding='utf-8') as f:
+                cache = json.load(f)
+            return cache if isinstance(cache, dict) else {}
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_cache(self):
+        """Write the probe results for later runs (best effort)"""
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(self._cache_path, 'w', encoding='utf-8') as f:
+                json.dump(self._cache, f)
+        except OSError as e:
+            self.logger.debug(f"Could not write diagnostics cache: {e}")
+    
+    @staticmethod
+    def _init_check_worker():
+        """Initialize COM in probe threads, which WMI needs on Windows"""
+        if is_windows():
+            try:
+                import pythoncom
+                pythoncom.CoInitialize()
+            except ImportError:
+                pass
+    
+    def _probe_hid(self) -> Tuple[bool, Optional[str]]:
+        """
+        Import hid once and remember the outcome.
+        
+        hid only imports when its native hidapi library can be loaded, so it
+        is really imported rather than just located. A failed import is not
+        retried (each attempt searches for the library again).
+        
+        Returns:
+            (True, None) if hid imports, else (False, error message)
+        """
+        if self._hid_probe is None:
+            try:
+                import hid
+                self._hid_probe = (True, None)
+            except ImportError as e:
+                self._hid_probe = (False, str(e))
+        return self._hid_probe
+    
+    def _is_available(self, import_name: str) -> bool:
+        """
+        Check whether a module is installed.
+        
+        find_spec locates the module without executing it, so heavy packages
+        (PySide6, cv2) are not loaded just to be reported.
+        
+        Args:
+            import_name: Top-level module name
+            
+        Returns:
+            True if the module can be imported
+        """
+        if import_name == 'hid':
+            return self._probe_hid()[0]
+        return _has_module(import_name)
+    
+    def check_python_version(self) -> List[DiagnosticCheck]:
         """Check Python version (3.10+ required)"""
+        checks = []
         version = sys.version_info
         required = (3, 10)
         
         if version >= required:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Python Version",
                 True,
                 f"Python {version.major}.{version.minor}.{version.micro} (required: {required[0]}.{required[1]}+)"
             ))
         else:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Python Version",
                 False,
                 f"Python {version.major}.{version.minor}.{version.micro} is too old",
                 f"Install Python {required[0]}.{required[1]} or higher from python.org"
             ))
+        
+        return checks
     
-    def check_dependencies(self):
+    def check_dependencies(self) -> List[DiagnosticCheck]:
         """Check if all required dependencies are installed"""
+        checks = []
         required_packages = [
             ('PySide6', 'PySide6'),
             ('hid', 'hid'),
@@ -104,39 +362,49 @@ class SystemChecker:
             ('yaml', 'pyyaml'),
         ]
         
-        missing = []
-        for import_name, package_name in required_packages:
-            try:
-                __import__(import_name)
-            except ImportError:
-                missing.append(package_name)
+        missing = [package_name for import_name, package_name in required_packages
+                   if not self._is_available(import_name)]
+        
+        hid_ok, hid_error = self._probe_hid()
+        if (not hid_ok and _is_native_library_error(hid_error)
+                and _has_module('hid')):
+            # The package is installed, only its native library failed to load
+            missing.remove('hid')
+            checks.append(DiagnosticCheck(
+                "HID Native Library",
+                False,
+                f"hid is installed but the hidapi library could not be loaded: {hid_error}",
+                "Install hidapi (hidapi.dll next to python.exe on Windows, libhidapi-hidraw0 on Linux)"
+            ))
         
         if not missing:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Required Dependencies",
                 True,
                 "All required packages are installed"
             ))
         else:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Required Dependencies",
                 False,
                 f"Missing packages: {', '.join(missing)}",
                 f"Install with: pip install {' '.join(missing)}"
             ))
+        
+        return checks
     
-    def check_windows_specific(self):
+    def check_windows_specific(self) -> List[DiagnosticCheck]:
         """Windows-specific checks"""
+        checks = []
         # Check pywin32 for service support
-        try:
-            import win32serviceutil
-            self.checks.append(DiagnosticCheck(
+        if self._is_available('win32serviceutil'):
+            checks.append(DiagnosticCheck(
                 "Windows Service Support",
                 True,
                 "pywin32 is installed (service support available)"
             ))
-        except ImportError:
-            self.checks.append(DiagnosticCheck(
+        else:
+            checks.append(DiagnosticCheck(
                 "Windows Service Support",
                 False,
                 "pywin32 not installed (no service support)",
@@ -145,16 +413,15 @@ class SystemChecker:
         
         # Check if running as Administrator
         try:
-            import ctypes
             is_admin = ctypes.windll.shell32.IsUserAnAdmin() != 0
             if is_admin:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "Administrator Privileges",
                     True,
                     "Running with Administrator privileges"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "Administrator Privileges",
                     False,
                     "Not running as Administrator",
@@ -162,53 +429,73 @@ class SystemChecker:
                 ))
         except Exception:
             pass
+        
+        return checks
     
-    def check_linux_specific(self):
+    def check_linux_specific(self) -> List[DiagnosticCheck]:
         """Linux-specific checks"""
-        # Check for udev rules
-        udev_rules_path = Path("/etc/udev/rules.d")
-        if udev_rules_path.exists():
-            rules_files = list(udev_rules_path.glob("*thermalright*"))
+        checks = []
+        # Check for udev rules (listed again only when the directory changes)
+        try:
+            rules_files = _udev_rules_snapshot(os.stat(UDEV_RULES_DIR).st_mtime_ns)
+        except OSError:
+            rules_files = None
+        
+        if rules_files is not None:
             if rules_files:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "USB Permissions (udev rules)",
                     True,
-                    f"udev rules found: {', '.join(f.name for f in rules_files)}"
+                    f"udev rules found: {', '.join(rules_files)}"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "USB Permissions (udev rules)",
                     False,
                     "No udev rules found for Thermalright devices",
                     "USB access may require running as root or setting up udev rules"
                 ))
+        
+        return checks
     
-    def check_usb_device(self):
+    def check_usb_device(self) -> List[DiagnosticCheck]:
         """Check if USB device is detected"""
+        checks = []
+        use_udev = is_linux() and self._is_available('pyudev')
+        if not use_udev and not self._is_available('usb'):
+            checks.append(DiagnosticCheck(
+                "USB Device Detection",
+                False,
+                "pyusb is not installed",
+                "Install with: pip install pyusb"
+            ))
+            return checks
+        
         try:
-            import usb.core
-            
             # Check for known Thermalright devices
-            known_devices = [
+            known_devices = {
                 (0x0416, 0x5302),
                 (0x0418, 0x5304),
                 (0x87AD, 0x70DB),
-            ]
+            }
             
-            found_devices = []
-            for vid, pid in known_devices:
-                dev = usb.core.find(idVendor=vid, idProduct=pid)
-                if dev:
-                    found_devices.append(f"{vid:04x}:{pid:04x}")
+            # One enumeration of the bus, filtered here, instead of one per device
+            if use_udev:
+                ids = self._usb_ids_udev()
+            else:
+                ids = self._usb_ids_libusb()
+            found_devices = list(dict.fromkeys(
+                f"{vid:04x}:{pid:04x}" for vid, pid in ids if (vid, pid) in known_devices
+            ))
             
             if found_devices:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "USB Device Detection",
                     True,
                     f"Found device(s): {', '.join(found_devices)}"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "USB Device Detection",
                     False,
                     "No Thermalright USB device found",
@@ -216,27 +503,61 @@ class SystemChecker:
                 ))
                 
         except Exception as e:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "USB Device Detection",
                 False,
                 f"Error checking USB devices: {e}",
-                "Ensure pyusb is installed and USB access is permitted"
+                "Ensure USB access is permitted" if use_udev else "Ensure pyusb is installed and USB access is permitted"
             ))
+        
+        return checks
     
-    def check_gpu_support(self):
+    @staticmethod
+    def _usb_ids_udev() -> List[Tuple[int, int]]:
+        """
+        (vendor id, product id) of every USB device, enumerated through udev.
+        
+        The ids are read from the idVendor/idProduct sysfs attributes rather
+        than udev database properties, so this also works where udevd does
+        not run (containers, minimal systems).
+        """
+        import pyudev
+        
+        ids = []
+        for device in pyudev.Context().list_devices(subsystem='usb', DEVTYPE='usb_device'):
+            try:
+                vid = device.attributes.asstring('idVendor')
+                pid = device.attributes.asstring('idProduct')
+                ids.append((int(vid, 16), int(pid, 16)))
+            except (KeyError, ValueError):
+                continue
+        return ids
+    
+    @staticmethod
+    def _usb_ids_libusb() -> List[Tuple[int, int]]:
+        """(vendor id, product id) of every USB device, from one libusb enumeration"""
+        # Imported for real: the enumeration needs the module
+        import usb.core
+        
+        return [(dev.idVendor, dev.idProduct) for dev in usb.core.find(find_all=True)]
+    
+    def check_gpu_support(self) -> List[DiagnosticCheck]:
         """Check GPU support"""
+        checks = []
         try:
             from thermalright_lcd_control.device_controller.metrics.gpu_metrics import GpuMetrics
             
-            gpu = GpuMetrics()
-            if gpu.gpu_vendor:
-                self.checks.append(DiagnosticCheck(
+            # Only presence is reported: skip setting up the metric readers,
+            # and detection altogether without any driver present
+            vendor, name = GpuMetrics.detect_vendor() if _has_gpu_driver_hint() else (None, None)
+            if vendor:
+                checks.append(DiagnosticCheck(
                     "GPU Detection",
                     True,
-                    f"Detected: {gpu.gpu_name} ({gpu.gpu_vendor})"
+                    f"Detected: {name} ({vendor})"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "GPU Detection",
                     False,
                     "No GPU detected or GPU metrics unavailable",
@@ -244,57 +565,59 @@ class SystemChecker:
                 ))
                 
         except Exception as e:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "GPU Detection",
                 False,
                 f"Error detecting GPU: {e}",
                 "GPU metrics may not be available"
             ))
+        
+        return checks
     
-    def check_window_capture(self):
+    def check_window_capture(self) -> List[DiagnosticCheck]:
         """Check window capture dependencies"""
+        checks = []
         if is_windows():
             required = [('mss', 'mss'), ('pygetwindow', 'pygetwindow')]
         elif is_linux():
             required = [('Xlib', 'python-xlib')]
         else:
-            return
+            return []
         
-        missing = []
-        for import_name, package_name in required:
-            try:
-                __import__(import_name)
-            except ImportError:
-                missing.append(package_name)
+        missing = [package_name for import_name, package_name in required
+                   if not self._is_available(import_name)]
         
         if not missing:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Window Capture Support",
                 True,
                 "Window capture dependencies installed (iStripper support available)"
             ))
         else:
-            self.checks.append(DiagnosticCheck(
+            checks.append(DiagnosticCheck(
                 "Window Capture Support",
                 False,
                 f"Missing: {', '.join(missing)}",
                 f"Install for iStripper support: pip install {' '.join(missing)}"
             ))
+        
+        return checks
     
-    def check_istripper(self):
+    def check_istripper(self) -> List[DiagnosticCheck]:
         """Check if iStripper is installed"""
+        checks = []
         try:
             from thermalright_lcd_control.common.app_detector import find_istripper_path
             
             path = find_istripper_path()
             if path:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "iStripper Installation",
                     True,
                     f"Found at: {path}"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "iStripper Installation",
                     False,
                     "iStripper not detected",
@@ -303,9 +626,12 @@ class SystemChecker:
         except Exception:
             # iStripper check is optional, don't fail
             pass
+        
+        return checks
     
-    def check_video_codecs(self):
+    def check_video_codecs(self) -> List[DiagnosticCheck]:
         """Check video codec support (Windows only)"""
+        checks = []
         try:
             from thermalright_lcd_control.utils.codec_detector import CodecDetector
             
@@ -323,13 +649,13 @@ class SystemChecker:
                 if has_ffmpeg:
                     codec_names.append('FFmpeg')
                 
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "Video Codec Support",
                     True,
                     f"Codecs installed: {', '.join(codec_names)}"
                 ))
             else:
-                self.checks.append(DiagnosticCheck(
+                checks.append(DiagnosticCheck(
                     "Video Codec Support",
                     False,
                     "No video codec packs detected",
@@ -340,13 +666,13 @@ class SystemChecker:
             opencv_info = result.get('opencv_codecs', {})
             if 'error' not in opencv_info:
                 if opencv_info.get('ffmpeg_support') or opencv_info.get('media_foundation_support'):
-                    self.checks.append(DiagnosticCheck(
+                    checks.append(DiagnosticCheck(
                         "OpenCV Video Support",
                         True,
                         f"OpenCV {opencv_info.get('opencv_version', 'Unknown')} with video backend support"
                     ))
                 else:
-                    self.checks.append(DiagnosticCheck(
+                    checks.append(DiagnosticCheck(
                         "OpenCV Video Support",
                         False,
                         "OpenCV lacks video codec support",
@@ -359,6 +685,8 @@ class SystemChecker:
         except Exception as e:
             self.logger.debug(f"Error checking codecs: {e}")
             pass
+        
+        return checks
     
     def print_report(self):
         """Print diagnostic report to console"""
@@ -2,3 +2,19 @@
 # Copyright © 2025 Rejeb Ben Rejeb
 
 """GUI Wizards for Windows 11 setup"""
+
+__all__ = ['IStripperWizard', 'USBDriverWizard']
+
+# Wizard classes derive from QDialog, so their modules need PySide6 when
+# imported: load them on first access only
+_LAZY_CLASSES = {
+    'IStripperWizard': 'thermalright_lcd_control.gui.wizards.istripper_wizard',
+    'USBDriverWizard': 'thermalright_lcd_control.gui.wizards.usb_driver_wizard',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_CLASSES:
+        import importlib
+        return getattr(importlib.import_module(_LAZY_CLASSES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -12,6 +12,7 @@ Provides a GUI wizard for easy iStripper integration setup with:
 """
 
 import sys
+import time
 from pathlib import Path
 from typing import Optional
 
@@ -22,13 +23,61 @@ try:
         QApplication, QMessageBox, QProgressBar
     )
     from PySide6.QtCore import Qt, QTimer, Signal
-    from PySide6.QtGui import QPixmap, QImage
+    from PySide6.QtGui import QImage, QPainter
     HAS_PYSIDE = True
 except ImportError:
     HAS_PYSIDE = False
 
 from thermalright_lcd_control.common.logging_config import get_gui_logger
-from thermalright_lcd_control.integrations.istripper_manager import IStripperManager
+
+
+class FramePreviewLabel(QLabel):
+    """
+    Label that paints capture frames directly.
+    
+    Setting a QPixmap per frame allocates and converts a new pixmap every
+    time; here the frame array is wrapped in a QImage (no pixel copy) and
+    drawn in paintEvent. Text is shown while there is no frame.
+    """
+    
+    def __init__(self, text: str = ""):
+        super().__init__(text)
+        self._frame = None  # RGBA array backing _frame_image
+        self._frame_image: Optional[QImage] = None
+    
+    @property
+    def frame(self):
+        """The frame being shown, or None while text is shown"""
+        return self._frame
+    
+    def set_frame(self, frame):
+        """
+        Show a frame.
+        
+        Args:
+            frame: (H, W, 4) uint8 opaque RGBA array, not modified afterwards
+        """
+        height, width = frame.shape[:2]
+        self._frame = frame
+        self._frame_image = QImage(frame.data, width, height, frame.strides[0], QImage.Format_RGBX8888)
+        if self.text():
+            super().setText("")
+        self.update()
+    
+    def setText(self, text: str):
+        self._frame = None
+        self._frame_image = None
+        super().setText(text)
+    
+    def paintEvent(self, event):
+        # Border and background (style sheet), and the text if any
+        super().paintEvent(event)
+        if self._frame_image is not None:
+            painter = QPainter(self)
+            painter.drawImage((self.width() - self._frame_image.width()) // 2,
+                              (self.height() - self._frame_image.height()) // 2,
+                              self._frame_image)
+            painter.end()
 
 
 class IStripperWizard(QDialog):
@@ -45,6 +94,10 @@ class IStripperWizard(QDialog):
     
     configuration_saved = Signal(dict)
     
+    # Quiet time (ms) after the last slider/title change before the running
+    # preview is updated
+    CONFIG_DEBOUNCE_MS = 150
+    
     def __init__(self, parent=None, target_width=320, target_height=240):
         """
         Initialize iStripper wizard
@@ -57,6 +110,9 @@ class IStripperWizard(QDialog):
         if not HAS_PYSIDE:
             raise RuntimeError("PySide6 is required for the wizard")
         
+        # Imported here: it pulls in psutil, which only the open wizard needs
+        from thermalright_lcd_control.integrations.istripper_manager import IStripperManager
+        
         super().__init__(parent)
         self.logger = get_gui_logger()
         
@@ -75,8 +131,17 @@ class IStripperWizard(QDialog):
         
         # Preview state
         self.preview_timer = None
+        self._preview_skip = False
         self.capture_preview = None
         
+        # Slider drags and title edits arrive in bursts: the running preview
+        # is updated once they settle (see _apply_pending_config)
+        self._pending_config = set()
+        self._config_debounce = QTimer(self)
+        self._config_debounce.setSingleShot(True)
+        self._config_debounce.setInterval(self.CONFIG_DEBOUNCE_MS)
+        self._config_debounce.timeout.connect(self._apply_pending_config)
+        
         self.setup_ui()
         self.detect_istripper()
     
@@ -155,7 +220,7 @@ class IStripperWizard(QDialog):
         layout = QVBoxLayout(group)
         
         # Preview label
-        self.preview_label = QLabel("Preview will appear here when iStripper is running")
+        self.preview_label = FramePreviewLabel("Preview will appear here when iStripper is running")
         self.preview_label.setMinimumSize(self.target_width, self.target_height)
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setStyleSheet("border: 1px solid gray; background-color: black;")
@@ -288,10 +353,15 @@ class IStripperWizard(QDialog):
                 fps=self.capture_fps,
                 scale_factor=self.scale_factor
             )
+            # Frames are grabbed on the capture thread; the timer only displays them
+            self.capture_preview.start()
             
-            # Start preview timer
+            # Start preview timer: single-shot, rescheduled by each tick for
+            # the rest of its frame time (see _preview_tick)
+            self._preview_skip = False
             self.preview_timer = QTimer(self)
-            self.preview_timer.timeout.connect(self.update_preview)
+            self.preview_timer.setSingleShot(True)
+            self.preview_timer.timeout.connect(self._preview_tick)
             self.preview_timer.start(1000 // self.capture_fps)  # Update at FPS rate
             
             self.start_preview_button.setText("Stop Preview")
@@ -311,29 +381,39 @@ class IStripperWizard(QDialog):
             self.preview_timer = None
         
         if self.capture_preview:
+            self.capture_preview.cleanup()
             self.capture_preview = None
         
         self.start_preview_button.setText("Start Preview")
         self.preview_status_label.setText("Preview stopped")
         self.preview_label.setText("Preview stopped")
     
+    def _preview_tick(self):
+        """Show the latest frame, then schedule the next tick so ticks never pile up"""
+        interval = 1.0 / self.capture_fps
+        started = time.perf_counter()
+        if self._preview_skip:
+            self._preview_skip = False
+        else:
+            self.update_preview()
+        elapsed = time.perf_counter() - started
+        
+        # A tick that overran two frame times drops the next frame to catch up
+        self._preview_skip = elapsed > 2 * interval
+        if self.preview_timer is not None:  # update_preview stops the preview on errors
+            self.preview_timer.start(max(1, int((interval - elapsed) * 1000)))
+    
     def update_preview(self):
         """Update preview frame"""
         try:
             if self.capture_preview:
-                frame = self.capture_preview.get_next_frame()
+                frame = self.capture_preview.get_latest()
                 
                 if frame is not None:
-                    # Convert PIL image to QPixmap
-                    if frame.mode != 'RGB':
-                        frame = frame.convert('RGB')
-                    
-                    width, height = frame.size
-                    image_data = frame.tobytes("raw", "RGB")
-                    qimage = QImage(image_data, width, height, QImage.Format_RGB888)
-                    pixmap = QPixmap.fromImage(qimage)
-                    
-                    self.preview_label.setPixmap(pixmap)
+                    # Each published frame is a new array: the same one means
+                    # nothing new was captured, so skip the repaint
+                    if frame is not self.preview_label.frame:
+                        self.preview_label.set_frame(frame)
                 else:
                     self.preview_label.setText("No frame captured")
         
@@ -344,26 +424,42 @@ class IStripperWizard(QDialog):
     def on_config_changed(self):
         """Handle configuration changes"""
         self.window_title = self.title_combo.currentText()
+        self._schedule_config('window')
     
     def on_fps_changed(self, value):
         """Handle FPS slider change"""
         self.capture_fps = value
         self.fps_label.setText(str(value))
-        
-        # Restart preview if running
-        if self.preview_timer and self.preview_timer.isActive():
-            self.stop_preview()
-            self.start_preview()
+        self._schedule_config('fps')
     
     def on_scale_changed(self, value):
         """Handle scale slider change"""
         self.scale_factor = value / 100.0
         self.scale_label.setText(f"{self.scale_factor:.2f}x")
+        self._schedule_config('scale')
+    
+    def _schedule_config(self, setting: str):
+        """Apply a changed setting to the preview once changes stop for CONFIG_DEBOUNCE_MS"""
+        self._pending_config.add(setting)
+        self._config_debounce.start()
+    
+    def _apply_pending_config(self):
+        """Update the running preview with the settled configuration"""
+        pending, self._pending_config = self._pending_config, set()
+        
+        if 'window' in pending:
+            # Only a different window needs a new capture (with all current settings)
+            if self.preview_timer and self.preview_timer.isActive():
+                self.stop_preview()
+                self.start_preview()
+            return
         
-        # Restart preview if running
-        if self.preview_timer and self.preview_timer.isActive():
-            self.stop_preview()
-            self.start_preview()
+        # Retime and rescale the running preview in place (the preview timer
+        # reads capture_fps on every tick)
+        if 'fps' in pending and self.capture_preview is not None:
+            self.capture_preview.set_fps(self.capture_fps)
+        if 'scale' in pending and self.capture_preview is not None:
+            self.capture_preview.set_scale_factor(self.scale_factor)
     
     def on_rotation_changed(self, text):
         """Handle rotation combo change"""
@@ -413,6 +509,7 @@ class IStripperWizard(QDialog):
     
     def closeEvent(self, event):
         """Handle dialog close"""
+        self._config_debounce.stop()
         self.stop_preview()
         super().closeEvent(event)
 